@@ -6,7 +6,6 @@ import webbrowser
 from functools import cached_property
 from typing import Optional
 
-import requests
 import typer
 from pydantic import BaseModel
 
@@ -40,6 +39,8 @@ class Demo:
                 result = f.read()
             return result
 
+        import requests
+
         resp = requests.get(self.url, allow_redirects=True)
         if resp.status_code != 200:
             raise Exception(
@@ -65,6 +66,8 @@ class Demo:
             os.unlink(temp.name)
 
     def run_script(self):
+        import requests
+
         with tempfile.NamedTemporaryFile(delete=False) as temp:
             temp.write(self.compose_script.encode())
         try:
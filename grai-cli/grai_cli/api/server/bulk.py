@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from grai_cli.settings.config import config_handler
+from grai_cli.utilities.styling import HAS_RICH
+from grai_cli.utilities.styling import print as print_styled
+
+if HAS_RICH:
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        ProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+    from rich.text import Text
+
+    class RateColumn(ProgressColumn):
+        """Renders the throughput of a task in objects per second"""
+
+        def render(self, task) -> Text:
+            return Text(f"{task.speed or 0:.1f} obj/s")
+
+
+if TYPE_CHECKING:
+    from grai_client.endpoints.client import BaseClient
+
+T = TypeVar("T")
+SpecKey = Tuple[str, str, str]
+
+# Types which can be looked up in bulk by namespace, ordered as they must be created
+BULK_TYPES = ("Node", "Edge")
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_CONCURRENCY = 8
+# Fewer objects of a type in one namespace are looked up one at a time rather than paging through the namespace
+BULK_LOOKUP_MIN = 1000
+
+
+def spec_key(item) -> Optional[SpecKey]:
+    """A key identifying an object by type, name, and namespace, or None if it can't be looked up in bulk"""
+    if getattr(item, "type", None) not in BULK_TYPES:
+        return None
+
+    name, namespace = getattr(item.spec, "name", None), getattr(item.spec, "namespace", None)
+    if name is None or namespace is None:
+        return None
+
+    return item.type, name, namespace
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def fetch_existing(client: BaseClient, items: List, concurrency: int = DEFAULT_CONCURRENCY) -> Dict[SpecKey, object]:
+    """Loads the existing records for `items`, grouped by type and namespace
+
+    Groups of at least `BULK_LOOKUP_MIN` items are loaded with one paginated query for their whole namespace, smaller
+    groups look up each of their items so a small file doesn't download a large namespace.
+
+    Args:
+        client: An authenticated client
+        items: Objects with a valid `spec_key`
+        concurrency: The number of concurrent lookups for small groups
+
+    Returns:
+        A mapping of spec keys to the existing server records
+    """
+    groups: Dict[Tuple[str, str], List] = {}
+    for item in items:
+        key = spec_key(item)
+        groups.setdefault((key[0], key[2]), []).append(item)
+
+    existing = {}
+    for (grai_type, namespace), group in sorted(groups.items(), key=lambda group: group[0]):
+        if len(group) < BULK_LOOKUP_MIN:
+            records = lookup_each(client, group, concurrency)
+        else:
+            records = client.get(grai_type, namespace=namespace)
+
+        for record in records:
+            existing[spec_key(record)] = record
+    return existing
+
+
+def lookup_each(client: BaseClient, items: List, concurrency: int = DEFAULT_CONCURRENCY) -> List:
+    """Looks up the existing record of each item concurrently, items without a record are left out"""
+    pool = ClientPool(client)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        records = list(executor.map(lambda item: pool.get().get(item), items))
+    return [record for record in records if record is not None]
+
+
+class ClientPool:
+    """Hands every worker thread its own copy of a client.
+
+    Clients hold a single httpx session which is replaced on every request so they can't be shared between threads.
+    """
+
+    def __init__(self, client: BaseClient):
+        self.client = client
+        self.local = threading.local()
+
+    def get(self) -> BaseClient:
+        if not hasattr(self.local, "client"):
+            from grai_client.endpoints.client import HttpxClientManager
+
+            worker = copy.copy(self.client)
+            worker.session = HttpxClientManager(self.client.session.client_args, self.client.session.auth)
+            self.local.client = worker
+        return self.local.client
+
+
+class Checkpoint:
+    """Records the objects an apply or delete has finished so an interrupted run can resume where it stopped.
+
+    Checkpoints are keyed by the command and the file's contents so editing the file starts a fresh run.
+    """
+
+    directory = "checkpoints"
+
+    def __init__(self, command: str, file: Path, resume: bool = False):
+        digest = hashlib.sha256(Path(file).read_bytes()).hexdigest()
+        checkpoint_dir = os.path.join(config_handler.config_dir, self.directory)
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        self.path = os.path.join(checkpoint_dir, f"{command}-{digest}.jsonl")
+        self.lock = threading.Lock()
+
+        self.completed: Set[SpecKey] = set()
+        if resume and os.path.exists(self.path):
+            with open(self.path) as f:
+                self.completed = {tuple(json.loads(line)) for line in f if line.strip()}
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+    def is_complete(self, key: Optional[SpecKey]) -> bool:
+        return key is not None and key in self.completed
+
+    def record(self, keys: Iterable[SpecKey]):
+        with self.lock, open(self.path, "a") as f:
+            for key in keys:
+                self.completed.add(key)
+                f.write(f"{json.dumps(key)}\n")
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def run_concurrently(
+    client: BaseClient,
+    fn: Callable[[BaseClient, T], object],
+    items: List[T],
+    description: str,
+    checkpoint: Optional[Checkpoint] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> List[Tuple[T, Exception]]:
+    """Calls `fn` on every item from a pool of worker threads, one batch at a time, reporting progress and throughput.
+
+    Args:
+        client: An authenticated client, each worker receives its own copy
+        fn: The request to make for each item
+        items: The items to process
+        description: A label for the progress bar
+        checkpoint: Completed items are recorded after every batch
+        batch_size: The number of items submitted to the pool at once
+        concurrency: The number of worker threads
+
+    Returns:
+        The items which failed alongside their exceptions
+    """
+    if not items:
+        return []
+
+    pool = ClientPool(client)
+    failures: List[Tuple[T, Exception]] = []
+
+    def call(item: T) -> Optional[Exception]:
+        try:
+            fn(pool.get(), item)
+        except Exception as e:
+            return e
+
+    if HAS_RICH:
+        columns = [TextColumn("{task.description}"), BarColumn(), MofNCompleteColumn(), RateColumn()]
+        progress = Progress(*columns, TimeElapsedColumn())
+    else:
+        progress = nullcontext()
+
+    start = time.perf_counter()
+    with progress, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        task = progress.add_task(description, total=len(items)) if HAS_RICH else None
+        for batch in batched(items, batch_size):
+            errors = list(executor.map(call, batch))
+            failures.extend((item, error) for item, error in zip(batch, errors) if error is not None)
+
+            if checkpoint is not None:
+                checkpoint.record(spec_key(item) for item, error in zip(batch, errors) if error is None)
+            if task is not None:
+                progress.update(task, advance=len(batch))
+
+    elapsed = time.perf_counter() - start
+    print_styled(f"{description}: {len(items)} objects in {elapsed:.1f}s ({len(items) / max(elapsed, 1e-9):.1f} obj/s)")
+    return failures
+
+
+def plan_apply(client: BaseClient, specs: List, concurrency: int = DEFAULT_CONCURRENCY) -> Tuple[List, List]:
+    """Computes the objects to create and the merged records to update for a set of specs
+
+    Returns:
+        A tuple of new objects and updated records
+    """
+    from grai_schemas.utilities import compute_graph_changes, merge
+
+    existing = fetch_existing(client, specs, concurrency)
+    new_items, updated_items, _ = compute_graph_changes(specs, list(existing.values()))
+
+    updates = []
+    for spec in updated_items:
+        record = existing[spec_key(spec)]
+        updated_record = merge(record, spec)
+        if updated_record != record:
+            updates.append(updated_record)
+
+    return new_items, updates
+
+
+def plan_delete(client: BaseClient, specs: List, concurrency: int = DEFAULT_CONCURRENCY) -> List:
+    """Finds the existing records for a set of specs, specs without a record are ignored"""
+    existing = fetch_existing(client, specs, concurrency)
+    return [existing[key] for key in map(spec_key, specs) if key in existing]
+
+
+def by_type(items: List, order: Tuple[str, ...]) -> List[Tuple[str, List]]:
+    return [(grai_type, [item for item in items if item.type == grai_type]) for grai_type in order]
+
+
+def split_individual(items: List) -> Tuple[List, List]:
+    """The objects which can't be looked up in bulk, split into edges and everything else, each in file order.
+
+    Individual edges may reference nodes from the bulk passes so they're applied after and deleted before them.
+    """
+    individual = [item for item in items if spec_key(item) is None]
+    return [item for item in individual if item.type != "Edge"], [item for item in individual if item.type == "Edge"]
@@ -3,17 +3,14 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import typer
-from grai_client.schemas.schema import validate_file
-from grai_schemas.utilities import merge
 from typing_extensions import Annotated
 
 from grai_cli.api.callbacks import requires_config_decorator
 from grai_cli.api.entrypoint import app
+from grai_cli.api.server import bulk
 from grai_cli.api.server.setup import client_app, client_get_app, get_default_client
-from grai_cli.utilities import utilities
 from grai_cli.utilities.styling import default_styler
 from grai_cli.utilities.styling import print as print_styled
-from grai_cli.utilities.utilities import write_yaml
 
 
 @client_app.command("is_authenticated", help="Verify auth credentials are valid")
@@ -42,6 +39,8 @@ def perform_type_query(query_type: str, print: bool = True, to_file: Optional[Pa
     Raises:
 
     """
+    from grai_cli.utilities.utilities import write_yaml
+
     client = get_default_client()
     result = client.get(query_type, **kwargs)
 
@@ -170,43 +169,90 @@ def get_workspaces(
     return perform_type_query("Workspace", print=print, to_file=to_file, **kwargs)
 
 
+def apply_individually(client, spec):
+    from grai_schemas.utilities import merge
+
+    record = None
+    try:
+        record = client.get(spec)
+    except:
+        client.post(spec)
+
+    if record is not None:
+        updated_record = merge(record, spec)
+        client.patch(updated_record)
+
+
+def report_failures(failures: List) -> None:
+    if not failures:
+        return
+
+    for item, error in failures[:10]:
+        print_styled(f"Failed on {item.type} `{getattr(item.spec, 'name', None)}`: {error}")
+    print_styled(f"{len(failures)} objects failed. Rerun with `--resume` to retry only the unfinished objects.")
+    raise typer.Exit(code=1)
+
+
 @app.command(help="Apply a configuration to The Guide by file name")
 @requires_config_decorator
 def apply(
     file: Path = typer.Argument(...),
     dry_run: bool = typer.Option(False, "--d", help="Dry run of file application"),
+    batch_size: int = typer.Option(bulk.DEFAULT_BATCH_SIZE, "--batch-size", help="Objects submitted per batch"),
+    concurrency: int = typer.Option(bulk.DEFAULT_CONCURRENCY, "--concurrency", help="Number of concurrent requests"),
+    resume: bool = typer.Option(False, "--resume", help="Skip objects completed by a previous interrupted apply"),
 ):
     """Apply a file to The Guide either creating or modifying the associated resource.
 
+    Existing nodes and edges are looked up concurrently, or loaded in bulk for namespaces with many objects in the
+    file, and compared locally. Only new or changed objects are sent to the server, in concurrent batches.
+
     Args:
         file:  yaml file to apply
         dry_run:  Print the resulting yaml to the console without applying it to the guide.
+        batch_size: The number of objects submitted to the server at once
+        concurrency: The number of concurrent requests
+        resume: Skip objects which were already applied by a previous interrupted run of the same file
 
     Returns:
 
     Raises:
 
     """
+    from grai_client.schemas.schema import validate_file
 
     # TODO: Edges don't have a human readable unique identifier
     client = get_default_client()
-    specs = validate_file(file)
+    specs = list(validate_file(file))
 
     if dry_run:
         for spec in specs:
             print_styled(spec)
-        typer.Exit()
+        raise typer.Exit()
 
-    for spec in specs:
-        record = None
-        try:
-            record = client.get(spec)
-        except:
-            client.post(spec)
+    checkpoint = bulk.Checkpoint("apply", file, resume)
+    specs = [spec for spec in specs if not checkpoint.is_complete(bulk.spec_key(spec))]
 
-        if record is not None:
-            updated_record = merge(record, spec)
-            client.patch(updated_record)
+    # Workspaces, sources, and unnamed objects can't be looked up in bulk
+    individual, individual_edges = bulk.split_individual(specs)
+    for spec in individual:
+        apply_individually(client, spec)
+
+    failures = []
+    bulk_specs = [spec for spec in specs if bulk.spec_key(spec) is not None]
+    for grai_type, type_specs in bulk.by_type(bulk_specs, bulk.BULK_TYPES):
+        new_items, updated_items = bulk.plan_apply(client, type_specs, concurrency) if type_specs else ([], [])
+        print_styled(f"{grai_type}: {len(new_items)} new, {len(updated_items)} updated, {len(type_specs)} total")
+
+        options = dict(checkpoint=checkpoint, batch_size=batch_size, concurrency=concurrency)
+        failures += bulk.run_concurrently(client, lambda c, item: c.post(item), new_items, "Create", **options)
+        failures += bulk.run_concurrently(client, lambda c, item: c.patch(item), updated_items, "Update", **options)
+
+    for spec in individual_edges:
+        apply_individually(client, spec)
+
+    report_failures(failures)
+    checkpoint.clear()
 
 
 @app.command("delete", help="Delete a configuration from The Guide by file name")
@@ -214,12 +260,18 @@ def apply(
 def delete(
     file: Path = typer.Argument(...),
     dry_run: bool = typer.Option(False, "--d", help="Dry run of file application"),
+    batch_size: int = typer.Option(bulk.DEFAULT_BATCH_SIZE, "--batch-size", help="Objects submitted per batch"),
+    concurrency: int = typer.Option(bulk.DEFAULT_CONCURRENCY, "--concurrency", help="Number of concurrent requests"),
+    resume: bool = typer.Option(False, "--resume", help="Skip objects completed by a previous interrupted delete"),
 ):
     """
 
     Args:
         file:  yaml file to delete
         dry_run:  Print the resulting yaml to the console without deleting resources from the guide.
+        batch_size: The number of objects submitted to the server at once
+        concurrency: The number of concurrent requests
+        resume: Skip objects which were already deleted by a previous interrupted run of the same file
 
     Returns:
 
@@ -230,11 +282,38 @@ def delete(
 
     # TODO: Edges don't have a human readable unique identifier
     client = get_default_client()
-    specs = validate_file(file)
+    specs = list(validate_file(file))
     if dry_run:
         for spec in specs:
             print_styled(spec)
-        typer.Exit()
+        raise typer.Exit()
+
+    checkpoint = bulk.Checkpoint("delete", file, resume)
+    specs = [spec for spec in specs if not checkpoint.is_complete(bulk.spec_key(spec))]
 
-    for spec in specs:
+    # Edges are removed before the nodes they reference
+    individual, individual_edges = bulk.split_individual(specs)
+    for spec in individual_edges:
         client.delete(spec)
+
+    failures = []
+    bulk_specs = [spec for spec in specs if bulk.spec_key(spec) is not None]
+    for grai_type, type_specs in bulk.by_type(bulk_specs, tuple(reversed(bulk.BULK_TYPES))):
+        records = bulk.plan_delete(client, type_specs, concurrency) if type_specs else []
+        print_styled(f"{grai_type}: {len(records)} to delete, {len(type_specs) - len(records)} not found")
+
+        failures += bulk.run_concurrently(
+            client,
+            lambda c, item: c.delete(item),
+            records,
+            "Delete",
+            checkpoint=checkpoint,
+            batch_size=batch_size,
+            concurrency=concurrency,
+        )
+
+    for spec in individual:
+        client.delete(spec)
+
+    report_failures(failures)
+    checkpoint.clear()
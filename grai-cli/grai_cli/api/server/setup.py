@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Dict, Type
 
 import typer
 
 from grai_cli.api.callbacks import requires_config_callback
+from grai_cli.settings.cache import cache
 from grai_cli.settings.config import config
 from grai_cli.utilities.headers import authenticate
 from grai_cli.utilities.styling import print as print_styled
 
 if TYPE_CHECKING:
     from grai_client.endpoints.client import BaseClient
+    from httpx import Response
+
+# Seconds a successful server health check is trusted before the server is checked again
+HEALTH_CHECK_TTL = 300
+
+
+class CachedHealthCheck:
+    """Client mixin which skips the blocking health check when the same server passed one within the TTL"""
+
+    health_check_cache_key = "health_checks"
+
+    def server_health_status(self) -> Response:
+        from httpx import Response
+
+        checks = cache.get(self.health_check_cache_key) or {}
+        if time.time() - checks.get(self.url, 0) < HEALTH_CHECK_TTL:
+            return Response(200)
+
+        response = super().server_health_status()
+        if response.status_code == 200:
+            cache.set(self.health_check_cache_key, {**checks, self.url: time.time()})
+        return response
+
+    @classmethod
+    def clear(cls):
+        cache.set(cls.health_check_cache_key, {})
 
 
 def get_default_client() -> BaseClient:
@@ -33,9 +61,12 @@ def get_default_client() -> BaseClient:
     workspace = config.server.workspace
 
     try:
-        client = _clients[config.server.api_version](url=url, workspace=workspace)
+        client_class = _clients[config.server.api_version]
+        client_class = type(client_class.__name__, (CachedHealthCheck, client_class), {})
+        client = client_class(url=url, workspace=workspace)
         authenticate(client)
     except:
+        CachedHealthCheck.clear()
         message = (
             f"Failed to authenticate with the Grai server at `{url}` using the `{workspace}` workspace and"
             f" provided credentials. Double check your configuration settings are correct. If you're attempting to "
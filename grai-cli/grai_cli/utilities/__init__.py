@@ -1,8 +1,12 @@
-from grai_cli.utilities import (
-    headers,
-    serializers,
-    telemetry,
-    test,
-    utilities,
-    validators,
-)
+import importlib
+
+from grai_cli.utilities import headers, serializers, telemetry, test, validators
+
+# `utilities` builds multimethod dispatch tables on import and is only needed by commands which write yaml
+_lazy_modules = {"utilities"}
+
+
+def __getattr__(name: str):
+    if name in _lazy_modules:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
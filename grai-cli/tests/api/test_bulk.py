@@ -0,0 +1,182 @@
+import uuid
+
+import pytest
+from grai_client.endpoints.client import HttpxClientManager
+from grai_schemas.v1.mock import MockV1
+
+from grai_cli.api.server import bulk, endpoints
+from grai_cli.utilities.utilities import write_yaml
+
+
+class InMemoryClient:
+    """Stands in for a server with an in memory store of nodes and edges"""
+
+    def __init__(self, records):
+        self.records = {bulk.spec_key(record): record for record in records}
+        self.calls = []
+        self.session = HttpxClientManager({})
+
+    def get(self, item, namespace=None):
+        if namespace is None:
+            self.calls.append(("get", bulk.spec_key(item)))
+            return self.records.get(bulk.spec_key(item))
+
+        self.calls.append(("get", item, namespace))
+        return [record for key, record in self.records.items() if key[0] == item and key[2] == namespace]
+
+    def post(self, item):
+        self.calls.append(("post", item.type))
+        self.records[bulk.spec_key(item)] = item
+
+    def patch(self, item):
+        self.calls.append(("patch", item.type))
+
+    def delete(self, item):
+        self.calls.append(("delete", item.type))
+        self.records.pop(bulk.spec_key(item), None)
+
+
+@pytest.fixture
+def mock_v1():
+    return MockV1()
+
+
+class TestPlanApply:
+    def test_small_groups_are_looked_up_individually(self, mock_v1):
+        specs = [mock_v1.node.node(spec=mock_v1.node.named_node_spec(namespace="a")) for _ in range(5)]
+        client = InMemoryClient([])
+
+        bulk.plan_apply(client, specs)
+
+        assert sorted(client.calls) == sorted(("get", bulk.spec_key(spec)) for spec in specs)
+
+    def test_large_groups_are_fetched_once_per_namespace(self, mock_v1, monkeypatch):
+        monkeypatch.setattr(bulk, "BULK_LOOKUP_MIN", 5)
+        specs = [mock_v1.node.node(spec=mock_v1.node.named_node_spec(namespace="a")) for _ in range(5)]
+        client = InMemoryClient([])
+
+        bulk.plan_apply(client, specs)
+
+        assert client.calls == [("get", "Node", "a")]
+
+    def test_new_and_updated_items(self, mock_v1):
+        existing = mock_v1.node.node()
+        unchanged = mock_v1.node.node()
+        updated = existing.copy(deep=True)
+        updated.spec.display_name = str(uuid.uuid4())
+        new = mock_v1.node.node()
+        client = InMemoryClient([existing, unchanged])
+
+        new_items, updated_items = bulk.plan_apply(client, [updated, unchanged, new])
+
+        assert [bulk.spec_key(item) for item in new_items] == [bulk.spec_key(new)]
+        assert [item.spec.display_name for item in updated_items] == [updated.spec.display_name]
+        assert updated_items[0].spec.id == existing.spec.id
+
+    def test_plan_delete_ignores_missing(self, mock_v1):
+        existing = mock_v1.node.node()
+        client = InMemoryClient([existing])
+
+        records = bulk.plan_delete(client, [existing, mock_v1.node.node()])
+
+        assert records == [existing]
+
+
+class TestRunConcurrently:
+    def test_all_items_processed(self, mock_v1):
+        items = [mock_v1.node.node() for _ in range(25)]
+        seen = []
+
+        failures = bulk.run_concurrently(
+            InMemoryClient([]), lambda client, item: seen.append(item), items, "Create", batch_size=10, concurrency=4
+        )
+
+        assert failures == []
+        assert {bulk.spec_key(item) for item in seen} == {bulk.spec_key(item) for item in items}
+
+    def test_failures_are_collected(self, mock_v1):
+        items = [mock_v1.node.node() for _ in range(4)]
+
+        def fn(client, item):
+            if item is items[2]:
+                raise ValueError("boom")
+
+        failures = bulk.run_concurrently(InMemoryClient([]), fn, items, "Create", concurrency=2)
+
+        assert [(item, str(error)) for item, error in failures] == [(items[2], "boom")]
+
+
+class TestCheckpoint:
+    def test_resume_skips_completed(self, mock_v1, tmp_path, monkeypatch):
+        monkeypatch.setattr(bulk.config_handler, "config_dir", str(tmp_path))
+        file = tmp_path / "nodes.yaml"
+        file.write_text("nodes")
+        node = mock_v1.node.node()
+
+        checkpoint = bulk.Checkpoint("apply", file)
+        checkpoint.record([bulk.spec_key(node)])
+
+        assert bulk.Checkpoint("apply", file, resume=True).is_complete(bulk.spec_key(node))
+        assert not bulk.Checkpoint("apply", file, resume=False).is_complete(bulk.spec_key(node))
+
+    def test_changed_file_starts_fresh(self, mock_v1, tmp_path, monkeypatch):
+        monkeypatch.setattr(bulk.config_handler, "config_dir", str(tmp_path))
+        file = tmp_path / "nodes.yaml"
+        file.write_text("nodes")
+        node = mock_v1.node.node()
+        bulk.Checkpoint("apply", file).record([bulk.spec_key(node)])
+
+        file.write_text("changed")
+
+        assert not bulk.Checkpoint("apply", file, resume=True).is_complete(bulk.spec_key(node))
+
+
+class TestSplitIndividual:
+    def test_edges_are_split_from_other_individual_items(self, mock_v1):
+        source = mock_v1.source.source()
+        edge = mock_v1.edge.edge(spec=mock_v1.edge.id_edge_spec())
+        edge.spec.name = None
+        workspace = mock_v1.workspace.workspace()
+
+        individual, individual_edges = bulk.split_individual([source, mock_v1.node.node(), edge, workspace])
+
+        assert individual == [source, workspace]
+        assert individual_edges == [edge]
+
+
+class TestOrdering:
+    @pytest.fixture
+    def items(self, mock_v1):
+        node = mock_v1.node.node()
+        named_edge = mock_v1.edge.edge()
+        unnamed_edge = mock_v1.edge.edge(spec=mock_v1.edge.id_edge_spec())
+        unnamed_edge.spec.name = None
+        unnamed_edge.spec.namespace = None
+        return [unnamed_edge, named_edge, node, mock_v1.source.source()]
+
+    @pytest.fixture
+    def run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bulk.config_handler, "config_dir", str(tmp_path))
+
+        def run(command, client, items):
+            monkeypatch.setattr(endpoints, "get_default_client", lambda: client)
+            monkeypatch.setattr(
+                endpoints, "apply_individually", lambda client, item: client.calls.append(("apply", item.type))
+            )
+            file = tmp_path / "items.yaml"
+            write_yaml(items, str(file))
+            command.__wrapped__(file, dry_run=False, batch_size=10, concurrency=1, resume=False)
+            return [call[1] for call in client.calls if call[0] != "get"]
+
+        return run
+
+    def test_apply_creates_individual_edges_after_nodes(self, items, run):
+        calls = run(endpoints.apply, InMemoryClient([]), items)
+
+        assert calls == ["Source", "Node", "Edge", "Edge"]
+
+    def test_delete_removes_individual_edges_before_nodes(self, items, run):
+        client = InMemoryClient([item for item in items if bulk.spec_key(item) is not None])
+        calls = run(endpoints.delete, client, items)
+
+        assert calls == ["Edge", "Edge", "Node", "Source"]
@@ -1,5 +1,64 @@
-from grai_cli.api.server.setup import get_default_client
+import pytest
+from httpx import Response
+
+from grai_cli.api.server import setup
+from grai_cli.api.server.setup import CachedHealthCheck, get_default_client
 
 
 def test_get_default_client():
     get_default_client()
+
+
+class FakeCache(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+class FakeClient:
+    url = "http://localhost:8000"
+
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.health_checks = 0
+
+    def server_health_status(self):
+        self.health_checks += 1
+        return Response(self.status_code)
+
+
+class CachedFakeClient(CachedHealthCheck, FakeClient):
+    pass
+
+
+class TestCachedHealthCheck:
+    @pytest.fixture(autouse=True)
+    def fake_cache(self, monkeypatch):
+        fake_cache = FakeCache()
+        monkeypatch.setattr(setup, "cache", fake_cache)
+        return fake_cache
+
+    def test_healthy_server_is_checked_once(self):
+        client = CachedFakeClient()
+        assert client.server_health_status().status_code == 200
+        assert client.server_health_status().status_code == 200
+        assert client.health_checks == 1
+
+    def test_expired_check_is_repeated(self, fake_cache):
+        client = CachedFakeClient()
+        client.server_health_status()
+        fake_cache[CachedHealthCheck.health_check_cache_key][client.url] -= setup.HEALTH_CHECK_TTL + 1
+        client.server_health_status()
+        assert client.health_checks == 2
+
+    def test_unhealthy_server_is_not_cached(self):
+        client = CachedFakeClient(status_code=500)
+        assert client.server_health_status().status_code == 500
+        assert client.server_health_status().status_code == 500
+        assert client.health_checks == 2
+
+    def test_clear(self):
+        client = CachedFakeClient()
+        client.server_health_status()
+        CachedHealthCheck.clear()
+        client.server_health_status()
+        assert client.health_checks == 2
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Cold `grai --help` time allowed on top of a bare interpreter start, in seconds
+STARTUP_BUDGET = float(os.environ.get("GRAI_CLI_STARTUP_BUDGET", 0.5))
+
+# Modules which should only be imported by the commands that talk to a server
+DEFERRED_MODULES = ["grai_client", "grai_schemas", "multimethod", "httpx", "requests"]
+
+HELP_SCRIPT = f"""
+import json, sys
+from grai_cli.api.entrypoint import app
+try:
+    app(["--help"])
+finally:
+    print("imported:", json.dumps([name for name in {DEFERRED_MODULES!r} if name in sys.modules]))
+"""
+
+
+def run_cold(script: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=os.environ)
+
+
+def fastest_run(script: str, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_cold(script)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_help_defers_server_imports():
+    result = run_cold(HELP_SCRIPT)
+    imported = next(line for line in result.stdout.splitlines() if line.startswith("imported:"))
+    assert json.loads(imported.split(":", 1)[1]) == []
+
+
+def test_help_startup_budget():
+    overhead = fastest_run(HELP_SCRIPT) - fastest_run("pass")
+    assert overhead < STARTUP_BUDGET, f"`grai --help` took {overhead:.2f}s over the {STARTUP_BUDGET:.2f}s budget"
@@ -160,6 +160,11 @@ def paginated(
         if page := options.pagination.get("page", False):
             return fn(client, page, options).json()["results"]
 
+        # Servers which support keyset pagination avoid OFFSET/COUNT queries, older servers ignore the parameter
+        # and fall back to page numbers. Either way the `next` link is followed until exhausted.
+        if options.pagination.get("mode", "cursor") == "cursor":
+            url = add_query_params(url, {"pagination": "cursor"})
+
         # Temporary fix for pagination to deal with poorly configured proxy headers
 
         results = []
@@ -26,12 +26,12 @@ X = TypeVar("X")
 
 @handles_bad_metadata(GraiMalformedNodeMetadataV1)
 def node_builder(resp: Dict[str, X]) -> NodeV1:
-    return NodeV1.from_spec(resp)
+    return NodeV1.from_trusted_spec(resp)
 
 
 @handles_bad_metadata(GraiMalformedEdgeMetadataV1)
 def edge_builder(resp: Dict[str, X]) -> EdgeV1:
-    return EdgeV1.from_spec(resp)
+    return EdgeV1.from_trusted_spec(resp)
 
 
 @get.register
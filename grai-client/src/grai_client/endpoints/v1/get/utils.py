@@ -19,7 +19,7 @@ T = TypeVar("T")
 
 @handles_bad_metadata(GraiMalformedNodeMetadataV1)
 def node_builder(resp: Dict[str, Any]) -> NodeV1:
-    return NodeV1.from_spec(resp)
+    return NodeV1.from_trusted_spec(resp)
 
 
 @handles_bad_metadata(GraiMalformedNodeMetadataV1)
@@ -29,7 +29,7 @@ def source_node_builder(resp: Dict[str, Any]) -> SourcedNodeV1:
 
 @handles_bad_metadata(GraiMalformedEdgeMetadataV1)
 def edge_builder(resp: Dict[str, Any]) -> EdgeV1:
-    return EdgeV1.from_spec(resp)
+    return EdgeV1.from_trusted_spec(resp)
 
 
 @handles_bad_metadata(GraiMalformedEdgeMetadataV1)
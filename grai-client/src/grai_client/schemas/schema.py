@@ -1,12 +1,12 @@
 from pathlib import Path
 from typing import Any, Dict, Iterable, Literal, Type, Union
 
-import yaml
 from grai_schemas.schema import GraiType, Schema
+from grai_schemas.serializers import get_serializer
 
 
 def validate_file(file: Union[str, Path]) -> Iterable[GraiType]:
-    """
+    """Lazily validates each object in a multi-document yaml or json lines file
 
     Args:
         file (Union[str, Path]):
@@ -16,6 +16,5 @@ def validate_file(file: Union[str, Path]) -> Iterable[GraiType]:
     Raises:
 
     """
-    with open(file) as f:
-        for item in yaml.safe_load_all(f):
-            yield Schema(entity=item).entity
+    for item in get_serializer(file).load_all(Path(file)):
+        yield Schema(entity=item).entity
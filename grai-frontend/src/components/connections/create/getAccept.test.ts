@@ -9,6 +9,7 @@ test("json", () => {
 test("yaml", () => {
   expect(getAccept("yaml")).toEqual({
     "application/yaml": [".yaml", ".yml"],
+    "application/x-ndjson": [".jsonl", ".ndjson"],
   })
 })
 
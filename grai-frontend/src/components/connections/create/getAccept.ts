@@ -9,6 +9,7 @@ const getAccept = (extension: string | null | undefined): Accept => {
   if (extension === "yaml")
     return {
       "application/yaml": [".yaml", ".yml"],
+      "application/x-ndjson": [".jsonl", ".ndjson"],
     }
 
   if (extension === "flat-file")
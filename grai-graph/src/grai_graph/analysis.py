@@ -1,4 +1,4 @@
-from typing import Generator, List, Optional, Tuple
+from typing import Dict, FrozenSet, Generator, List, Optional, Tuple
 
 import networkx as nx
 from grai_schemas.base import Node as NodeTypes
@@ -11,13 +11,48 @@ class GraphAnalyzer:
 
     def __init__(self, graph: Graph):
         self.graph = graph
+        # Nodes reachable from each node, computed on first use since the graph doesn't change after it's built
+        self._descendants: Dict[int, FrozenSet[int]] = {}
 
-    def downstream_nodes(self, namespace: str, name: str):
+    def neighbour_ids(self, node_id: int, depth: int = 1, upstream: bool = False) -> List[int]:
+        """The ids of the nodes within `depth` hops of a node, nearest first
+
+        Args:
+            node_id (int): The id of the starting node
+            depth (int, optional): The maximum number of hops (Default value = 1)
+            upstream (bool, optional): Follow edges against their direction (Default value = False)
+
+        Returns:
+            The ids of the neighbouring nodes, excluding `node_id` itself
+        """
+        graph = self.graph.graph
+        if depth == 1:
+            return list(graph.predecessors(node_id) if upstream else graph.successors(node_id))
+
+        graph = graph.reverse(copy=False) if upstream else graph
+        distances = nx.single_source_shortest_path_length(graph, node_id, cutoff=depth)
+        return [node for node, _ in sorted(distances.items(), key=lambda item: item[1]) if node != node_id]
+
+    def descendant_ids(self, node_id: int) -> FrozenSet[int]:
+        """The ids of every node reachable from a node
+
+        Args:
+            node_id (int): The id of the starting node
+
+        Returns:
+            The reachable node ids
+        """
+        if node_id not in self._descendants:
+            self._descendants[node_id] = frozenset(nx.descendants(self.graph.graph, node_id))
+        return self._descendants[node_id]
+
+    def downstream_nodes(self, namespace: str, name: str, depth: int = 1):
         """
 
         Args:
             namespace (str):
             name (str):
+            depth (int, optional): The maximum number of hops (Default value = 1)
 
         Returns:
 
@@ -25,24 +60,44 @@ class GraphAnalyzer:
 
         """
         node_id = self.graph.get_node_id(namespace, name)
-        downstream = list(nx.bfs_successors(self.graph.graph, node_id))[0][1]
-        return [self.graph.get_node(node_id=node) for node in downstream]
+        return [self.graph.get_node(node_id=node) for node in self.neighbour_ids(node_id, depth)]
 
-    def upstream_nodes(self, namespace: str, name: str):
+    def upstream_nodes(self, namespace: str, name: str, depth: int = 1):
         """
 
         Args:
             namespace (str):
             name (str):
+            depth (int, optional): The maximum number of hops (Default value = 1)
+
+        Returns:
+
+        Raises:
+
+        """
+        node_id = self.graph.get_node_id(namespace, name)
+        return [self.graph.get_node(node_id=node) for node in self.neighbour_ids(node_id, depth, upstream=True)]
+
+    def is_upstream(self, namespace: str, name: str, other_namespace: str, other_name: str) -> bool:
+        """Whether data flows from one node into another
+
+        Args:
+            namespace (str):
+            name (str):
+            other_namespace (str):
+            other_name (str):
 
         Returns:
+            True if the second node is reachable from the first
 
         Raises:
 
         """
         node_id = self.graph.get_node_id(namespace, name)
-        upstream = list(nx.bfs_predecessors(self.graph.graph, node_id))[0][1]
-        return [self.graph.get_node(node_id=node) for node in upstream]
+        other_id = self.graph.get_node_id(other_namespace, other_name)
+        if node_id is None or other_id is None:
+            return False
+        return other_id in self.descendant_ids(node_id)
 
     def test_delete_node(self, namespace: str, name: str):
         """
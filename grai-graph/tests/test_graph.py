@@ -709,3 +709,41 @@ class TestDataType(unittest.TestCase):
         G = get_analysis_from_map(mock_structure)
         results = G.test_data_type_change(name="a", namespace=DEFAULT_NAMESPACE, new_type="int")
         assert len(results) == 2 and results[0][0][-1].spec.name == "c" and results[1][0][-1].spec.name == "c"
+
+
+class TestNeighbours(unittest.TestCase):
+    """ """
+
+    def get_analysis(self):
+        mock_structure = {
+            "a": [("b", TableToTableAttributes())],
+            "b": [("c", TableToTableAttributes())],
+            "c": [],
+            "d": [],
+        }
+        return get_analysis_from_map(mock_structure)
+
+    def test_immediate_neighbours(self):
+        """ """
+        G = self.get_analysis()
+        assert [node.spec.name for node in G.downstream_nodes(DEFAULT_NAMESPACE, "a")] == ["b"]
+        assert [node.spec.name for node in G.upstream_nodes(DEFAULT_NAMESPACE, "c")] == ["b"]
+
+    def test_isolated_node_has_no_neighbours(self):
+        """ """
+        G = self.get_analysis()
+        assert G.downstream_nodes(DEFAULT_NAMESPACE, "d") == []
+        assert G.upstream_nodes(DEFAULT_NAMESPACE, "d") == []
+
+    def test_n_level_neighbours(self):
+        """ """
+        G = self.get_analysis()
+        assert [node.spec.name for node in G.downstream_nodes(DEFAULT_NAMESPACE, "a", depth=2)] == ["b", "c"]
+        assert [node.spec.name for node in G.upstream_nodes(DEFAULT_NAMESPACE, "c", depth=2)] == ["b", "a"]
+
+    def test_is_upstream(self):
+        """ """
+        G = self.get_analysis()
+        assert G.is_upstream(DEFAULT_NAMESPACE, "a", DEFAULT_NAMESPACE, "c")
+        assert not G.is_upstream(DEFAULT_NAMESPACE, "c", DEFAULT_NAMESPACE, "a")
+        assert not G.is_upstream(DEFAULT_NAMESPACE, "a", DEFAULT_NAMESPACE, "d")
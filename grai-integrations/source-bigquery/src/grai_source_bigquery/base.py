@@ -27,6 +27,8 @@ class BigQueryIntegration(GraiIntegrationImplementation):
         credentials: Optional[str] = None,
         log_parsing: Optional[bool] = False,
         log_parsing_window: Optional[int] = 7,
+        region: Optional[str] = None,
+        log_state: Optional[dict] = None,
     ):
         """Initializes the BigQuery integration.
 
@@ -38,6 +40,9 @@ class BigQueryIntegration(GraiIntegrationImplementation):
             dataset: BigQuery Dataset Id, or multiple datasets seperated by a comma (`,`)
             credentials: JSON credentials for service account
             log_parsing: The number of days to read logs
+            region: The BigQuery region, e.g. `us`, holding the datasets. When provided all datasets are read from the
+                region wide INFORMATION_SCHEMA in one pass rather than with separate queries for each dataset.
+            log_state: The connector's `log_state` from a previous run, so log parsing only reads new log entries
 
         """
         super().__init__(source, version)
@@ -48,6 +53,7 @@ class BigQueryIntegration(GraiIntegrationImplementation):
                 namespace=namespace,
                 dataset=dataset,
                 credentials=credentials,
+                region=region,
             )
             if not log_parsing
             else LoggingConnector(
@@ -56,6 +62,8 @@ class BigQueryIntegration(GraiIntegrationImplementation):
                 dataset=dataset,
                 credentials=credentials,
                 window=log_parsing_window,
+                region=region,
+                log_state=log_state,
             )
         )
 
@@ -1,9 +1,12 @@
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from functools import cache, cached_property, lru_cache
+from functools import cache, lru_cache
 from itertools import chain
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from logging import getLogger
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from google.cloud import bigquery, logging
 from google.oauth2 import service_account
@@ -17,6 +20,8 @@ from grai_source_bigquery.models import (
     TableID,
 )
 
+logger = getLogger(__name__)
+
 
 def get_from_env(
     label: str,
@@ -57,18 +62,38 @@ class BigqueryConnector:
         project: Optional[str] = None,
         dataset: Optional[Union[str, List[str]]] = None,
         credentials: Optional[str] = None,
+        region: Optional[str] = None,
+        parallelization: int = 8,
+        page_size: int = 10000,
         **kwargs,
     ):
+        """
+
+        Args:
+            namespace: The Grai namespace to associate with output
+            project: GCP project id
+            dataset: A dataset or list of datasets to extract
+            credentials: JSON credentials for a service account
+            region: When set, e.g. `us` or `europe-west2`, every dataset is read from the region wide
+                INFORMATION_SCHEMA in a single pair of queries rather than with one pair of queries per dataset.
+            parallelization: The maximum number of per dataset queries to run concurrently
+            page_size: The number of rows fetched per page while streaming query results
+        """
         self.namespace = get_from_env("namespace", "default") if namespace is None else namespace
         self.project = get_from_env("project", required=False) if project is None else project
         dataset = get_from_env("dataset", required=False) if dataset is None else dataset
         self.datasets = [dataset] if isinstance(dataset, str) else dataset
+        self.region = get_from_env("region", required=False) if region is None else region
+        self.parallelization = parallelization
+        self.page_size = page_size
 
         self.credentials = get_from_env("credentials", required=False) if credentials is None else credentials
         self._connection: Optional[bigquery.connector.BigqueryConnection] = None
 
         self._tables: Optional[List[Table]] = None
         self._foreign_keys: Optional[List[Edge]] = None
+        self._catalog: Optional[Dict[str, Tuple[List[Dict], List[Dict]]]] = None
+        self.dataset_timings: Dict[str, float] = {}
 
     def __enter__(self):
         return self.connect()
@@ -138,6 +163,77 @@ class BigqueryConnector:
         """
         return self.connection.query(query)
 
+    def query_rows(self, query: str, parameters: Optional[List] = None) -> Iterator[Dict]:
+        """Runs a query and lazily yields its rows with lower cased keys, fetching one page at a time.
+
+        Args:
+            query (str):
+            parameters (Optional[List], optional): BigQuery query parameters (Default value = None)
+
+        Returns:
+
+        Raises:
+
+        """
+        job_config = bigquery.QueryJobConfig(query_parameters=parameters or [])
+        rows = self.connection.query(query, job_config=job_config).result(page_size=self.page_size)
+        return ({k.lower(): v for k, v in row.items()} for row in rows)
+
+    def tables_query(self, dataset: Optional[str] = None) -> str:
+        source = f"`{self.project}`.`region-{self.region}`" if dataset is None else f"{self.project}.{dataset}"
+        filter_datasets = "AND table_schema IN UNNEST(@datasets)" if dataset is None else ""
+        return f"""
+            SELECT table_schema, table_name, table_type
+            FROM {source}.INFORMATION_SCHEMA.TABLES
+            WHERE table_schema != 'INFORMATION_SCHEMA' {filter_datasets}
+            ORDER BY table_schema, table_name
+        """
+
+    def columns_query(self, dataset: Optional[str] = None) -> str:
+        source = f"`{self.project}`.`region-{self.region}`" if dataset is None else f"{self.project}.{dataset}"
+        filter_datasets = "WHERE table_schema IN UNNEST(@datasets)" if dataset is None else ""
+        return f"""
+            SELECT column_name, data_type, is_nullable, column_default, table_schema, table_name
+            FROM {source}.INFORMATION_SCHEMA.COLUMNS
+            {filter_datasets}
+        """
+
+    @property
+    def catalog(self) -> Dict[str, Tuple[List[Dict], List[Dict]]]:
+        """Table and column rows for every dataset read from the region wide INFORMATION_SCHEMA.
+
+        Only used when a region is configured. Both views are queried once, concurrently, and rows are partitioned
+        by dataset as they stream in.
+        """
+        if self._catalog is None:
+            start = time.perf_counter()
+            parameters = [bigquery.ArrayQueryParameter("datasets", "STRING", self.datasets)]
+            catalog: Dict[str, Tuple[List[Dict], List[Dict]]] = {dataset: ([], []) for dataset in self.datasets}
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                tables = executor.submit(lambda: list(self.query_rows(self.tables_query(), parameters)))
+                columns = executor.submit(lambda: list(self.query_rows(self.columns_query(), parameters)))
+
+                for row in tables.result():
+                    catalog[row["table_schema"]][0].append(row)
+                for row in columns.result():
+                    catalog[row["table_schema"]][1].append(row)
+
+            self._catalog = catalog
+            logger.info(f"Read the {self.region} catalog in {time.perf_counter() - start:.2f}s")
+
+        return self._catalog
+
+    def table_rows(self, dataset: str) -> Iterator[Dict]:
+        if self.region:
+            return iter(self.catalog[dataset][0])
+        return self.query_rows(self.tables_query(dataset))
+
+    def column_rows(self, dataset: str) -> Iterator[Dict]:
+        if self.region:
+            return iter(self.catalog[dataset][1])
+        return self.query_rows(self.columns_query(dataset))
+
     @lru_cache
     def tables(self, dataset: str) -> List[Table]:
         """Create and return a list of dictionaries with the
@@ -151,13 +247,7 @@ class BigqueryConnector:
         Raises:
 
         """
-        query = f"""
-            SELECT table_schema, table_name, table_type
-            FROM {self.project}.{dataset}.INFORMATION_SCHEMA.TABLES
-            WHERE table_schema != 'INFORMATION_SCHEMA'
-            ORDER BY table_schema, table_name
-        """
-        res = ({k.lower(): v for k, v in result.items()} for result in self.query_runner(query))
+        res = self.table_rows(dataset)
 
         additional_args = {
             "namespace": self.namespace,
@@ -182,24 +272,13 @@ class BigqueryConnector:
 
         """
 
-        query = f"""
-            SELECT column_name, data_type, is_nullable, column_default, table_schema, table_name
-            FROM {self.project}.{dataset}.INFORMATION_SCHEMA.COLUMNS
-        """
-
-        res = [{k.lower(): v for k, v in result.items()} for result in self.query_runner(query)]
-        for item in res:
-            item.update(
-                {
-                    "table": item["table_name"],
-                    "column_schema": item["table_schema"],
-                }
-            )
-
         addtl_args = {
             "namespace": self.namespace,
         }
-        return [Column(**result, **addtl_args) for result in res]
+        return [
+            Column(**result, table=result["table_name"], column_schema=result["table_schema"], **addtl_args)
+            for result in self.column_rows(dataset)
+        ]
 
     @lru_cache
     def column_map(self, dataset: str) -> Dict[Tuple[str, str], List[Column]]:
@@ -269,8 +348,26 @@ class BigqueryConnector:
         """
         return [item for item in chain(*[t.get_edges() for t in self.tables(dataset)]) if item is not None]
 
+    def load_dataset(self, dataset: str) -> None:
+        """Reads a dataset's tables and columns into the cache, recording how long it took."""
+        start = time.perf_counter()
+        self.tables(dataset)
+        self.dataset_timings[dataset] = time.perf_counter() - start
+        logger.info(f"Loaded BigQuery dataset {dataset} in {self.dataset_timings[dataset]:.2f}s")
+
+    def load_datasets(self) -> None:
+        """Loads every dataset, running the per dataset queries for up to `parallelization` datasets at once."""
+        pending = [dataset for dataset in self.datasets if dataset not in self.dataset_timings]
+        if self.region is None and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=self.parallelization) as executor:
+                list(executor.map(self.load_dataset, pending))
+        else:
+            for dataset in pending:
+                self.load_dataset(dataset)
+
     @cache
     def nodes(self) -> List[BigqueryNode]:
+        self.load_datasets()
         nodes = []
         for dataset in self.datasets:
             nodes.extend(self.get_nodes(dataset))
@@ -278,6 +375,7 @@ class BigqueryConnector:
 
     @cache
     def edges(self) -> List[Edge]:
+        self.load_datasets()
         edges = []
         for dataset in self.datasets:
             edges.extend(self.get_edges(dataset))
@@ -307,10 +405,23 @@ class LoggingConnector(BigqueryConnector):
         dataset: Optional[Union[str, List[str]]] = None,
         credentials: Optional[str] = None,
         window: Optional[int] = None,
+        log_state: Optional[Dict] = None,
+        log_page_size: int = 1000,
+        **kwargs,
     ):
-        super().__init__(namespace, project, dataset, credentials)
+        """
+
+        Args:
+            window: The number of days of audit logs to read when there is no previous run to continue from
+            log_state: The `log_state` of a previous run. Only log entries newer than its high water mark are read
+                and its edges are carried forward.
+            log_page_size: The number of log entries fetched per page
+        """
+        super().__init__(namespace, project, dataset, credentials, **kwargs)
 
         self.window = int(get_from_env("window", required=False, default=7)) if window is None else window
+        self.log_state: Dict = {} if log_state is None else log_state
+        self.log_page_size = log_page_size
         self._logging_connection: Optional[logging.Client] = None
 
     def __enter__(self):
@@ -370,11 +481,20 @@ class LoggingConnector(BigqueryConnector):
         self.logging_connection.close()
         self._logging_connection = None
 
-    @cached_property
-    def logs(self) -> List[Any]:
-        """Create and return a list of dictionaries with the
-        schemas and names of tables in the database
-        connected to by the connection argument.
+    @property
+    def log_start(self) -> datetime:
+        """The earliest log timestamp to read, the high water mark of the previous run if it's within the window."""
+        window_start = datetime.now(timezone.utc) - timedelta(days=self.window)
+        if (high_water_mark := self.log_state.get("high_water_mark")) is None:
+            return window_start
+
+        return max(window_start, datetime.fromisoformat(high_water_mark))
+
+    @property
+    def logs(self) -> Iterator[Any]:
+        """Lazily iterates over query job audit log entries since `log_start` which wrote to a destination table.
+
+        Entries are fetched a page at a time in timestamp order so they can be parsed and discarded as they arrive.
 
         Args:
 
@@ -383,29 +503,47 @@ class LoggingConnector(BigqueryConnector):
         Raises:
 
         """
-
-        yesterday = datetime.now(timezone.utc) - timedelta(days=self.window)
         time_format = "%Y-%m-%dT%H:%M:%S.%f%z"
 
         filter_str = (
             'protoPayload.serviceName="bigquery.googleapis.com"'
             ' AND resource.type = "bigquery_project"'
             ' AND protoPayload.methodName="google.cloud.bigquery.v2.JobService.InsertJob"'
-            f' AND timestamp>="{yesterday.strftime(time_format)}"'
+            f' AND timestamp>="{self.log_start.strftime(time_format)}"'
+            " AND (protoPayload.metadata.jobChange.job.jobConfig.queryConfig.destinationTable:*"
+            " OR protoPayload.metadata.jobInsertion.job.jobConfig.queryConfig.destinationTable:*)"
         )
 
         for dataset in self.datasets:
-            filter_str += (
-                f' AND NOT protoPayload.metadata.jobChange.job.jobStats.queryStats.referencedTables="projects/grai-demo/datasets/{dataset}/tables/INFORMATION_SCHEMA.TABLES"'
-                f' AND NOT protoPayload.metadata.jobInsertion.job.jobStats.queryStats.referencedTables="projects/grai-demo/datasets/{dataset}/tables/INFORMATION_SCHEMA.TABLES"'
-                f' AND NOT protoPayload.metadata.jobChange.job.jobStats.queryStats.referencedTables="projects/grai-demo/datasets/{dataset}/tables/INFORMATION_SCHEMA.COLUMNS"'
-                f' AND NOT protoPayload.metadata.jobInsertion.job.jobStats.queryStats.referencedTables="projects/grai-demo/datasets/{dataset}/tables/INFORMATION_SCHEMA.COLUMNS"'
-            )
+            for view in ["TABLES", "COLUMNS"]:
+                table = f"projects/{self.project}/datasets/{dataset}/tables/INFORMATION_SCHEMA.{view}"
+                filter_str += (
+                    f' AND NOT protoPayload.metadata.jobChange.job.jobStats.queryStats.referencedTables="{table}"'
+                    f' AND NOT protoPayload.metadata.jobInsertion.job.jobStats.queryStats.referencedTables="{table}"'
+                )
 
-        return self.logging_connection.list_entries(filter_=filter_str)
+        return self.logging_connection.list_entries(
+            filter_=filter_str, order_by=logging.ASCENDING, page_size=self.log_page_size
+        )
+
+    @staticmethod
+    def parse_log_entry(content: Dict) -> Iterator[Tuple[str, str]]:
+        """Yields the (referenced table, destination table) resource names of a query job audit log entry."""
+        metadata = content.get("protoPayload", {}).get("metadata", {})
+        job = metadata.get("jobChange", {}).get("job") or metadata.get("jobInsertion", {}).get("job") or {}
+
+        destination = job.get("jobConfig", {}).get("queryConfig", {}).get("destinationTable")
+        if destination is None:
+            return
+
+        for table in job.get("jobStats", {}).get("queryStats", {}).get("referencedTables", []):
+            if table != destination:
+                yield table, destination
 
     def get_bigquery_edges(self, existing_nodes: List[BigqueryNode]) -> List[Edge]:
-        """
+        """Returns edges between existing tables found in this and previous runs' audit logs.
+
+        `log_state` is updated with the accumulated edges and the timestamp of the newest entry read.
 
         Args:
 
@@ -415,92 +553,37 @@ class LoggingConnector(BigqueryConnector):
 
         """
 
-        existing_node_unique_ids = {
-            (node.name, node.table_schema) for node in existing_nodes if isinstance(node, Table)
-        }
-
-        def table_string_to_table_id(table_string: str) -> Optional[TableID]:
-            table_string = table_string.split("/")
+        def table_key(table_string: str) -> Tuple[str, str]:
+            parts = table_string.split("/")
+            return parts[3], parts[5]
 
-            schema = table_string[3]
-            name = table_string[5]
-
-            if (name, schema) not in existing_node_unique_ids:
-                return None
-
-            return TableID(
-                table_schema=schema,
-                name=name,
-                namespace=self.namespace,
-            )
-
-        edges = set()
+        edge_keys = {tuple(edge) for edge in self.log_state.get("edges", [])}
+        high_water_mark = self.log_start
 
         for log in self.logs:
-            content = log.to_api_repr()
-
-            destination_table = (
-                content.get("protoPayload", {})
-                .get("metadata", {})
-                .get("jobChange", {})
-                .get("job", {})
-                .get("jobConfig", {})
-                .get("queryConfig", {})
-                .get("destinationTable")
-            ) or (
-                content.get("protoPayload", {})
-                .get("metadata", {})
-                .get("jobInsertion", {})
-                .get("job", {})
-                .get("jobConfig", {})
-                .get("queryConfig", {})
-                .get("destinationTable")
-            )
-
-            if destination_table is None:
-                continue
-
-            destination = table_string_to_table_id(destination_table)
-
-            if destination is None:
-                continue
-
-            referenced_tables = (
-                content.get("protoPayload", {})
-                .get("metadata", {})
-                .get("jobChange", {})
-                .get("job", {})
-                .get("jobStats", {})
-                .get("queryStats", {})
-                .get("referencedTables", [])
-            ) or (
-                content.get("protoPayload", {})
-                .get("metadata", {})
-                .get("jobInsertion", {})
-                .get("job", {})
-                .get("jobStats", {})
-                .get("queryStats", {})
-                .get("referencedTables", [])
-            )
+            if log.timestamp is not None:
+                high_water_mark = max(high_water_mark, log.timestamp)
 
-            for table in referenced_tables:
-                if destination_table == table:
-                    continue
+            for source, destination in self.parse_log_entry(log.to_api_repr()):
+                edge_keys.add((*table_key(source), *table_key(destination)))
 
-                source = table_string_to_table_id(table)
-
-                if source is None:
-                    continue
+        self.log_state = {
+            "high_water_mark": high_water_mark.isoformat(),
+            "edges": sorted(list(edge) for edge in edge_keys),
+        }
 
-                edges.add(
-                    Edge(
-                        constraint_type=Constraint("bqm"),
-                        source=source,
-                        destination=destination,
-                    )
-                )
+        existing_tables = {(node.table_schema, node.name) for node in existing_nodes if isinstance(node, Table)}
 
-        return list(edges)
+        return [
+            Edge(
+                constraint_type=Constraint("bqm"),
+                source=TableID(table_schema=source_schema, name=source_name, namespace=self.namespace),
+                destination=TableID(table_schema=destination_schema, name=destination_name, namespace=self.namespace),
+            )
+            for source_schema, source_name, destination_schema, destination_name in sorted(edge_keys)
+            if (source_schema, source_name) in existing_tables
+            and (destination_schema, destination_name) in existing_tables
+        ]
 
     def nodes(self) -> List[BigqueryNode]:
         return super().nodes()
@@ -0,0 +1,165 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from grai_source_bigquery.loader import BigqueryConnector, LoggingConnector
+from grai_source_bigquery.models import Column, Table
+
+CATALOG = {
+    "sales": [("orders", ["id", "amount"]), ("customers", ["id"])],
+    "marketing": [("campaigns", ["id", "name"])],
+}
+
+
+class FakeQueryJob:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def result(self, page_size=None):
+        return iter(self.rows)
+
+
+class FakeClient:
+    def __init__(self):
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def query(self, query, job_config=None):
+        with self.lock:
+            self.queries.append(query)
+
+        datasets = [dataset for dataset in CATALOG if f".{dataset}.INFORMATION_SCHEMA" in query] or list(CATALOG)
+        if "INFORMATION_SCHEMA.TABLES" in query:
+            rows = [
+                {"TABLE_SCHEMA": dataset, "TABLE_NAME": table, "TABLE_TYPE": "BASE TABLE"}
+                for dataset in datasets
+                for table, _ in CATALOG[dataset]
+            ]
+        else:
+            rows = [
+                {
+                    "COLUMN_NAME": column,
+                    "DATA_TYPE": "STRING",
+                    "IS_NULLABLE": "YES",
+                    "COLUMN_DEFAULT": None,
+                    "TABLE_SCHEMA": dataset,
+                    "TABLE_NAME": table,
+                }
+                for dataset in datasets
+                for table, columns in CATALOG[dataset]
+                for column in columns
+            ]
+        return FakeQueryJob(rows)
+
+
+def make_connector(**kwargs) -> BigqueryConnector:
+    connector = BigqueryConnector(namespace="test", project="project", dataset=list(CATALOG), credentials="", **kwargs)
+    connector._connection = FakeClient()
+    return connector
+
+
+class TestCatalogQueries:
+    @pytest.mark.parametrize("region", [None, "us"])
+    def test_nodes(self, region):
+        connector = make_connector(region=region)
+
+        nodes = connector.nodes()
+
+        assert len([node for node in nodes if isinstance(node, Table)]) == 3
+        assert len([node for node in nodes if isinstance(node, Column)]) == 5
+        assert set(connector.dataset_timings) == set(CATALOG)
+
+    def test_per_dataset_queries(self):
+        connector = make_connector(parallelization=2)
+        connector.nodes()
+
+        assert len(connector.connection.queries) == 2 * len(CATALOG)
+
+    def test_region_queries_once(self):
+        connector = make_connector(region="us")
+        connector.nodes()
+        connector.edges()
+
+        assert len(connector.connection.queries) == 2
+        assert all("`region-us`.INFORMATION_SCHEMA" in query for query in connector.connection.queries)
+
+
+class FakeLogEntry:
+    def __init__(self, timestamp, destination, referenced):
+        self.timestamp = timestamp
+        self.content = {
+            "protoPayload": {
+                "metadata": {
+                    "jobChange": {
+                        "job": {
+                            "jobConfig": {"queryConfig": {"destinationTable": destination}},
+                            "jobStats": {"queryStats": {"referencedTables": referenced}},
+                        }
+                    }
+                }
+            }
+        }
+
+    def to_api_repr(self):
+        return self.content
+
+
+class FakeLoggingClient:
+    def __init__(self, entries):
+        self.entries = entries
+        self.filters = []
+
+    def list_entries(self, filter_, order_by=None, page_size=None):
+        self.filters.append(filter_)
+        return iter(self.entries)
+
+
+def table_resource(dataset, table):
+    return f"projects/project/datasets/{dataset}/tables/{table}"
+
+
+class TestLogLineage:
+    def make_connector(self, entries, log_state=None) -> LoggingConnector:
+        connector = LoggingConnector(
+            namespace="test", project="project", dataset=list(CATALOG), credentials="", log_state=log_state
+        )
+        connector._connection = FakeClient()
+        connector._logging_connection = FakeLoggingClient(entries)
+        return connector
+
+    def test_edges_are_accumulated_between_runs(self):
+        now = datetime.now(timezone.utc)
+        first = self.make_connector(
+            [FakeLogEntry(now, table_resource("sales", "orders"), [table_resource("sales", "customers")])]
+        )
+        assert len(first.get_bigquery_edges(first.nodes())) == 1
+
+        second = self.make_connector(
+            [FakeLogEntry(now, table_resource("marketing", "campaigns"), [table_resource("sales", "orders")])],
+            log_state=first.log_state,
+        )
+        edges = second.get_bigquery_edges(second.nodes())
+
+        assert {(edge.source.name, edge.destination.name) for edge in edges} == {
+            ("customers", "orders"),
+            ("orders", "campaigns"),
+        }
+
+    def test_reads_from_high_water_mark(self):
+        high_water_mark = datetime.now(timezone.utc) - timedelta(hours=1)
+        connector = self.make_connector([], log_state={"high_water_mark": high_water_mark.isoformat(), "edges": []})
+
+        connector.get_bigquery_edges(connector.nodes())
+
+        assert connector.log_start == high_water_mark
+        assert high_water_mark.strftime("%Y-%m-%dT%H:%M:%S") in connector.logging_connection.filters[0]
+        assert "grai-demo" not in connector.logging_connection.filters[0]
+
+    def test_edges_to_unknown_tables_are_ignored(self):
+        connector = self.make_connector(
+            [FakeLogEntry(datetime.now(timezone.utc), table_resource("sales", "orders"), [table_resource("x", "y")])]
+        )
+
+        assert connector.get_bigquery_edges(connector.nodes()) == []
+        assert connector.log_state["edges"] == [["x", "y", "sales", "orders"]]
@@ -0,0 +1,40 @@
+"""Times manifest loading against synthetic manifests built by replicating a real project.
+
+Usage: python scripts/benchmark_manifest.py [path/to/manifest.json] [copies ...]
+"""
+
+import json
+import sys
+import tempfile
+import time
+
+from grai_schemas.v1.source import SourceSpec
+from grai_schemas.v1.workspace import WorkspaceSpec
+
+from grai_source_dbt.data_tools import get_project_root, make_synthetic_manifest
+from grai_source_dbt.processor import ManifestProcessor
+
+default_manifest = f"{get_project_root()}/../tests/resources/v11/jaffle_shop/manifest.json"
+manifest_file = sys.argv[1] if len(sys.argv) > 1 else default_manifest
+copies = [int(arg) for arg in sys.argv[2:]] or [1, 10, 100]
+
+source = SourceSpec(name="benchmark", workspace=WorkspaceSpec(name="default", organization="default"))
+with open(manifest_file) as f:
+    manifest = json.load(f)
+
+for n in copies:
+    with tempfile.NamedTemporaryFile("w", suffix=".json") as f:
+        json.dump(make_synthetic_manifest(manifest, n), f)
+        f.flush()
+
+        ManifestProcessor._loader_cache.clear()
+        start = time.perf_counter()
+        processor = ManifestProcessor.load(f.name, "default", source)
+        num_nodes, num_edges = len(processor.adapted_nodes), len(processor.adapted_edges)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ManifestProcessor.load(f.name, "default", source).adapted_nodes
+        warm = time.perf_counter() - start
+
+    print(f"copies={n} nodes={num_nodes} edges={num_edges} cold={cold:.3f}s cached={warm:.3f}s")
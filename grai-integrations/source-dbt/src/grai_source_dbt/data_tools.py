@@ -1,3 +1,4 @@
+import json
 import os
 
 from grai_source_dbt.processor import ManifestProcessor
@@ -49,3 +50,45 @@ def load_from_manifest() -> ManifestProcessor:
     """
     manifest = ManifestProcessor.load(get_manifest_file(), "default")
     return manifest
+
+
+def make_synthetic_manifest(manifest_dict: dict, copies: int) -> dict:
+    """Scales a real manifest up by duplicating its nodes, sources, and macros `copies` times.
+
+    Each copy gets a suffixed unique_id and name with dependencies remapped onto the same copy, so the result
+    describes `copies` disjoint replicas of the original project and remains valid for the original schema version.
+
+    Args:
+        manifest_dict: A dictionary parsing of a manifest.json file
+        copies: The number of replicas of the project to include
+
+    Returns:
+        A new manifest dictionary
+
+    Raises:
+
+    """
+
+    def suffixed(unique_id: str, i: int) -> str:
+        return f"{unique_id}_{i}"
+
+    def replicate(section: dict, i: int) -> dict:
+        result = {}
+        for unique_id, obj in section.items():
+            obj = json.loads(json.dumps(obj))
+            obj["unique_id"] = suffixed(unique_id, i)
+            for field in ("name", "alias", "identifier"):
+                if obj.get(field):
+                    obj[field] = f"{obj[field]}_{i}"
+            if isinstance(obj.get("depends_on"), dict) and "nodes" in obj["depends_on"]:
+                obj["depends_on"]["nodes"] = [suffixed(parent, i) for parent in obj["depends_on"]["nodes"]]
+            result[obj["unique_id"]] = obj
+        return result
+
+    synthetic = {**manifest_dict}
+    for section in ("nodes", "sources", "macros"):
+        synthetic[section] = {}
+        for i in range(copies):
+            synthetic[section].update(replicate(manifest_dict.get(section, {}), i))
+
+    return synthetic
@@ -118,7 +118,7 @@ class ManifestLoaderV1(BaseManifestLoader):
                 columns[column.unique_id] = column
         return columns
 
-    @property
+    @cached_property
     def nodes(self) -> List[NodeType]:
         """
 
@@ -165,7 +165,7 @@ class ManifestLoaderV1(BaseManifestLoader):
                 edge_type=edge_type,
             )
 
-    @property
+    @cached_property
     def edges(self) -> List[Edge]:
         """
 
@@ -1,7 +1,9 @@
+import hashlib
 import json
 import warnings
+from collections import OrderedDict
 from functools import cached_property
-from typing import List, Union
+from typing import List, Tuple, Union
 
 from dbt_artifacts_parser.parser import parse_manifest
 from dbt_artifacts_parser.parsers.utils import get_dbt_schema_version
@@ -13,12 +15,65 @@ from grai_source_dbt.loaders import MANIFEST_MAP, AllDbtNodeTypes, ManifestTypes
 from grai_source_dbt.loaders.base import BaseManifestLoader
 from grai_source_dbt.models.grai import Column, Edge
 
+# Only these node resource types contribute to the graph, tests are kept for their column annotations.
+RELEVANT_NODE_TYPES = {"model", "seed", "snapshot", "test"}
+MANIFEST_CACHE_SIZE = 8
+
+
+def prune_manifest(manifest_dict: dict) -> dict:
+    """Drops the parts of a manifest which never contribute to the graph before it's validated.
+
+    Macros, docs, exposures, metrics, analyses etc. often dominate the size of large manifests and cost far more to
+    validate than the nodes and sources we actually use. Each pruned section is replaced with an empty value of the
+    same type so the manifest still satisfies the schema of every supported version.
+
+    Args:
+        manifest_dict: A dictionary parsing of a manifest.json file
+
+    Returns:
+        A shallow copy of the manifest containing only the metadata, relevant nodes, and sources
+    """
+    pruned = {}
+    for key, value in manifest_dict.items():
+        if key in {"metadata", "sources"}:
+            pruned[key] = value
+        elif key == "nodes":
+            pruned[key] = {
+                node_id: node for node_id, node in value.items() if node.get("resource_type") in RELEVANT_NODE_TYPES
+            }
+        elif isinstance(value, (dict, list)):
+            pruned[key] = type(value)()
+        else:
+            pruned[key] = value
+    return pruned
+
+
+def read_manifest(manifest_obj: Union[str, dict]) -> Tuple[dict, str]:
+    """Reads a manifest alongside a hash of its contents
+
+    Args:
+        manifest_obj: Either a string path to a manifest.json file, or a dictionary parsing of a manifest.json file
+
+    Returns:
+        The manifest dictionary and the sha256 hex digest of its contents
+    """
+    if isinstance(manifest_obj, str):
+        with open(manifest_obj, "rb") as f:
+            content = f.read()
+        return json.loads(content), hashlib.sha256(content).hexdigest()
+
+    content = json.dumps(manifest_obj, sort_keys=True, default=str).encode("utf-8")
+    return manifest_obj, hashlib.sha256(content).hexdigest()
+
 
 class ManifestProcessor:
     """ """
 
     MANIFEST_MAP = MANIFEST_MAP
 
+    # Parsed loaders keyed by (manifest content hash, namespace, strict_mode), most recently used last
+    _loader_cache: "OrderedDict[Tuple[str, str, bool], BaseManifestLoader]" = OrderedDict()
+
     source: SourceSpec
 
     def __init__(self, loader: BaseManifestLoader, source: SourceSpec, strict_mode: bool = False):
@@ -109,11 +164,11 @@ class ManifestProcessor:
         Raises:
 
         """
-        if isinstance(manifest_obj, str):
-            with open(manifest_obj, "r") as f:
-                manifest_dict = json.load(f)
-        else:
-            manifest_dict = manifest_obj
+        manifest_dict, digest = read_manifest(manifest_obj)
+        cache_key = (digest, namespace, strict_mode)
+        if (manifest := cls._loader_cache.get(cache_key)) is not None:
+            cls._loader_cache.move_to_end(cache_key)
+            return ManifestProcessor(manifest, source, strict_mode)
 
         version = get_dbt_schema_version(manifest_dict)
 
@@ -127,7 +182,11 @@ class ManifestProcessor:
             )
             version = latest_supported_version
 
-        manifest_obj = parse_manifest(manifest_dict)
+        manifest_obj = parse_manifest(prune_manifest(manifest_dict))
         manifest = cls.MANIFEST_MAP[version](manifest_obj, namespace)
 
-        return ManifestProcessor(manifest, source)
+        cls._loader_cache[cache_key] = manifest
+        while len(cls._loader_cache) > MANIFEST_CACHE_SIZE:
+            cls._loader_cache.popitem(last=False)
+
+        return ManifestProcessor(manifest, source, strict_mode)
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+from dbt_artifacts_parser.parser import parse_manifest
+from dbt_artifacts_parser.parsers.utils import get_dbt_schema_version
+
+from grai_source_dbt.data_tools import make_synthetic_manifest
+from grai_source_dbt.loaders import SUPPORTED_VERSIONS
+from grai_source_dbt.processor import (
+    MANIFEST_CACHE_SIZE,
+    RELEVANT_NODE_TYPES,
+    ManifestProcessor,
+    prune_manifest,
+)
+from grai_source_dbt.utils import full_name
+
+from .test_load import resource_path
+
+
+def read(file: str) -> dict:
+    with open(file) as f:
+        return json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    ManifestProcessor._loader_cache.clear()
+    yield
+    ManifestProcessor._loader_cache.clear()
+
+
+@pytest.mark.parametrize("version", SUPPORTED_VERSIONS)
+class TestPruneManifest:
+    def test_only_relevant_nodes_kept(self, version):
+        manifest = prune_manifest(read(resource_path("manifest.json", version)))
+        assert all(node["resource_type"] in RELEVANT_NODE_TYPES for node in manifest["nodes"].values())
+
+    def test_pruned_sections_are_empty(self, version):
+        original = read(resource_path("manifest.json", version))
+        manifest = prune_manifest(original)
+        assert manifest.keys() == original.keys()
+        assert not manifest.get("macros")
+        assert not manifest.get("docs")
+
+    def test_sources_untouched(self, version):
+        original = read(resource_path("manifest.json", version))
+        assert prune_manifest(original)["sources"] == original["sources"]
+
+    def test_same_graph_as_full_parse(self, version, mock_source):
+        original = read(resource_path("manifest.json", version))
+        loader_class = ManifestProcessor.MANIFEST_MAP[get_dbt_schema_version(original)]
+        full = loader_class(parse_manifest(original), "default")
+
+        processor = ManifestProcessor.load(original, "default", mock_source)
+
+        assert {full_name(node) for node in processor.nodes} == {full_name(node) for node in full.nodes}
+        assert {(e.source.name, e.destination.name) for e in processor.edges} == {
+            (e.source.name, e.destination.name) for e in full.edges
+        }
+
+
+class TestLoaderCache:
+    def test_identical_manifests_share_a_loader(self, mock_source):
+        file = resource_path("manifest.json", "v11")
+        first = ManifestProcessor.load(file, "default", mock_source)
+        second = ManifestProcessor.load(file, "default", mock_source)
+        assert first.loader is second.loader
+
+    def test_dict_keys_are_independent_of_key_order(self, mock_source):
+        manifest = read(resource_path("manifest.json", "v11"))
+        reordered = dict(reversed(list(manifest.items())))
+        first = ManifestProcessor.load(manifest, "default", mock_source)
+        second = ManifestProcessor.load(reordered, "default", mock_source)
+        assert first.loader is second.loader
+
+    def test_namespace_is_part_of_the_key(self, mock_source):
+        file = resource_path("manifest.json", "v11")
+        first = ManifestProcessor.load(file, "default", mock_source)
+        second = ManifestProcessor.load(file, "other", mock_source)
+        assert first.loader is not second.loader
+        assert all(edge.source.namespace == "other" for edge in second.edges)
+
+    def test_cache_is_bounded(self, mock_source):
+        manifest = read(resource_path("manifest.json", "v11"))
+        for i in range(MANIFEST_CACHE_SIZE + 2):
+            ManifestProcessor.load(manifest, f"namespace-{i}", mock_source)
+        assert len(ManifestProcessor._loader_cache) == MANIFEST_CACHE_SIZE
+
+
+class TestSyntheticManifest:
+    def test_scales_nodes(self, mock_source):
+        manifest = read(resource_path("manifest.json", "v11"))
+        single = ManifestProcessor.load(manifest, "default", mock_source)
+        tripled = ManifestProcessor.load(make_synthetic_manifest(manifest, 3), "default", mock_source)
+        assert len(tripled.nodes) == 3 * len(single.nodes)
+        assert len(tripled.edges) == 3 * len(single.edges)
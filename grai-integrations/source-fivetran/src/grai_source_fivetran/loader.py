@@ -1,5 +1,8 @@
-import asyncio
 import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from typing import (
     Any,
@@ -18,6 +21,7 @@ from typing import (
 
 import requests
 from pydantic import BaseModel, BaseSettings, Json, SecretStr, validator
+from requests.adapters import HTTPAdapter
 
 from grai_source_fivetran.fivetran_api.api_models import (
     ColumnMetadataResponse,
@@ -98,6 +102,7 @@ class FivetranAPI:
         api_secret: Optional[str] = None,
         endpoint: Optional[str] = None,
         limit: Optional[int] = None,
+        max_retries: int = 5,
     ):
         passthrough_kwargs = {
             "api_key": api_key,
@@ -114,6 +119,37 @@ class FivetranAPI:
         self.session.headers.update({"Accept": "application/json"})
         self.session.params.update({"limit": 10000 if limit is None else limit})
 
+        self.max_retries = max_retries
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limited_until = 0.0
+
+    def wait_for_rate_limit(self):
+        """Blocks until any rate limit reported by the API has expired"""
+        while (delay := self._rate_limited_until - time.monotonic()) > 0:
+            time.sleep(delay)
+
+    def register_rate_limit(self, response: requests.Response, attempt: int):
+        """Pauses every in-flight request after a 429 response
+
+        Fivetran's `Retry-After` header is honoured when present, otherwise a jittered exponential backoff is used.
+
+        Args:
+            response: The rate limited response
+            attempt: The number of times this request has already been retried
+
+        Returns:
+
+        Raises:
+
+        """
+        try:
+            delay = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            delay = min(2**attempt, 60) + random.uniform(0, 1)
+
+        with self._rate_limit_lock:
+            self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + delay)
+
     def make_request(
         self,
         request: Callable[..., requests.Response],
@@ -138,7 +174,13 @@ class FivetranAPI:
         """
         params = self.session.params if params is None else {**self.session.params, **params}
         headers = self.session.headers if headers is None else {**self.session.headers, **headers}
-        result = request(url, params=params, headers=headers, **kwargs)
+        for attempt in range(self.max_retries + 1):
+            self.wait_for_rate_limit()
+            result = request(url, params=params, headers=headers, **kwargs)
+            if result.status_code != 429:
+                break
+            self.register_rate_limit(result, attempt)
+
         assert result.status_code == 200
         return result.json(), result
 
@@ -183,8 +225,9 @@ class FivetranAPI:
         result, response = self.make_request(request, url, headers=headers, params=params, **kwargs)
         yield result
 
+        # The cursor is tracked locally so concurrent paginations against different connectors never interfere
         while has_cursor(result):
-            params = {**response.request.params, "cursor": result["data"]["nextCursor"]}
+            params = {**({} if params is None else params), "cursor": result["data"]["nextCursor"]}
             result, response = self.make_request(request, url, headers=headers, params=params, **kwargs)
             yield result
 
@@ -349,45 +392,23 @@ class FivetranAPI:
         return connectors
 
 
-async def caller(semaphore: asyncio.Semaphore, func: Callable[..., T], *args, **kwargs) -> T:
+def parallelize_http(parallelization: int):
     """
 
     Args:
-        semaphore (asyncio.Semaphore):
-        func (Callable[..., T]):
-        *args:
-        **kwargs:
+        parallelization: The maximum number of concurrent requests
 
     Returns:
 
     Raises:
 
     """
-    result = func(*args, **kwargs)
-
-    async with semaphore:
-        if semaphore.locked():
-            await asyncio.sleep(1)
-    return result
-
-
-def parallelize_http(semaphore):
-    """
-
-    Args:
-        semaphore:
 
-    Returns:
-
-    Raises:
-
-    """
-
-    async def parallel(
+    def inner(
         func: Callable[P, T],
         arg_list: Iterable[Sequence[Any]],
         kwarg_list: Optional[Sequence[Dict[str, Any]]] = None,
-    ) -> Tuple[T]:
+    ) -> List[T]:
         """
 
         Args:
@@ -403,27 +424,10 @@ def parallelize_http(semaphore):
         arg_list = list(arg_list) if not isinstance(arg_list, list) else arg_list
         kwarg_list = [{}] * len(arg_list) if kwarg_list is None else kwarg_list
         assert len(arg_list) == len(kwarg_list)
-        tasks = (caller(semaphore, func, *args, **kwargs) for args, kwargs in zip(arg_list, kwarg_list))
-        return await asyncio.gather(*tasks)
-
-    def inner(
-        func: Callable[P, T],
-        arg_list: Iterable[Sequence[Any]],
-        kwarg_list: Optional[Sequence[Dict[str, Any]]] = None,
-    ) -> List[T]:
-        """
 
-        Args:
-            func (Callable[P, T]):
-            arg_list (Iterable[Sequence[Any]]):
-            kwarg_list (Optional[Sequence[Dict[str, Any]]], optional):  (Default value = None)
-
-        Returns:
-
-        Raises:
-
-        """
-        return asyncio.run(parallel(func, arg_list, kwarg_list))
+        with ThreadPoolExecutor(max_workers=parallelization) as executor:
+            futures = [executor.submit(func, *args, **kwargs) for args, kwargs in zip(arg_list, kwarg_list)]
+            return [future.result() for future in futures]
 
     return inner
 
@@ -483,8 +487,12 @@ class FivetranConnector(FivetranAPI):
     ):
         super().__init__(*args, **kwargs)
         self.parallelization = parallelization
-        self.semaphore = asyncio.Semaphore(self.parallelization)
-        self.http_runner = parallelize_http(self.semaphore)
+        self.http_runner = parallelize_http(self.parallelization)
+
+        # requests only keeps 10 pooled connections per host by default
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.parallelization)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.default_namespace = default_namespace
         self._namespace_map_base = process_base_namespace_map(namespaces)
 
@@ -535,10 +543,13 @@ class FivetranConnector(FivetranAPI):
 
     def build_lineage(self):
         """ """
-        connector_ids = [[conn_id] for conn_id in self.connectors.keys()]
-        schemas = self.http_runner(self.get_schemas, arg_list=connector_ids)
-        tables = self.http_runner(self.get_tables, arg_list=connector_ids)
-        columns = self.http_runner(self.get_columns, arg_list=connector_ids)
+        fetchers = (self.get_schemas, self.get_tables, self.get_columns)
+        calls = [(fetcher, conn_id) for conn_id in self.connectors.keys() for fetcher in fetchers]
+        results = self.http_runner(lambda fetcher, conn_id: fetcher(conn_id), arg_list=calls)
+
+        schemas = results[0 :: len(fetchers)]
+        tables = results[1 :: len(fetchers)]
+        columns = results[2 :: len(fetchers)]
 
         for conn_id, t_res, c_res in zip(self.connectors.keys(), tables, columns):
             for table in t_res:
@@ -1,4 +1,8 @@
+import threading
+import time
+
 import pytest
+import requests
 from grai_schemas.v1 import SourcedEdgeV1, SourcedNodeV1
 from grai_schemas.v1.metadata.edges import (
     ColumnToColumnMetadata,
@@ -6,7 +10,11 @@ from grai_schemas.v1.metadata.edges import (
     TableToTableMetadata,
 )
 
-from grai_source_fivetran.loader import process_base_namespace_map
+from grai_source_fivetran.loader import (
+    FivetranAPI,
+    parallelize_http,
+    process_base_namespace_map,
+)
 from grai_source_fivetran.models import Edge, NodeTypes
 
 
@@ -55,6 +63,61 @@ class TestNamespaceMap:
         assert len(namespace_map.keys()) > 0
 
 
+class TestParallelizeHttp:
+    """ """
+
+    def test_results_preserve_order(self):
+        """ """
+        runner = parallelize_http(4)
+        results = runner(lambda a, b: a + b, arg_list=[(i, i) for i in range(20)])
+        assert results == [2 * i for i in range(20)]
+
+    def test_concurrency_is_bounded(self):
+        """ """
+        lock = threading.Lock()
+        active = {"current": 0, "max": 0}
+
+        def request(i):
+            with lock:
+                active["current"] += 1
+                active["max"] = max(active["max"], active["current"])
+            time.sleep(0.01)
+            with lock:
+                active["current"] -= 1
+            return i
+
+        parallelize_http(3)(request, arg_list=[(i,) for i in range(20)])
+        assert 1 < active["max"] <= 3
+
+
+class TestRateLimits:
+    """ """
+
+    @staticmethod
+    def response(status_code, headers=None):
+        """ """
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        response._content = b'{"data": {"items": []}}'
+        return response
+
+    def test_retries_rate_limited_requests(self, connector_kwargs):
+        """ """
+        api = FivetranAPI(**connector_kwargs)
+        responses = iter([self.response(429, {"Retry-After": "0"}), self.response(200)])
+        result, response = api.make_request(lambda *args, **kwargs: next(responses), "http://www.fivetran.com/")
+        assert response.status_code == 200
+        assert result == {"data": {"items": []}}
+
+    def test_gives_up_after_max_retries(self, connector_kwargs):
+        """ """
+        api = FivetranAPI(max_retries=1, **connector_kwargs)
+        responses = iter([self.response(429, {"Retry-After": "0"})] * 2)
+        with pytest.raises(AssertionError):
+            api.make_request(lambda *args, **kwargs: next(responses), "http://www.fivetran.com/")
+
+
 class TestConnector:
     """ """
 
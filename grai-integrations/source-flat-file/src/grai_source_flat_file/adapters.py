@@ -169,7 +169,7 @@ def build_metadata_from_node(current: Table, version: Literal["v1"] = "v1") -> D
     Raises:
 
     """
-    data = {"file_name": current.file_name}
+    data = {"file_name": current.file_name, "rows_sampled": current.rows_sampled, "row_count": current.row_count}
     return data
 
 
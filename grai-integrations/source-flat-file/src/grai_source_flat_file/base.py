@@ -7,7 +7,11 @@ from grai_schemas.integrations.base import GraiIntegrationImplementation
 from grai_schemas.v1.source import SourceV1
 
 from grai_source_flat_file.adapters import adapt_to_client
-from grai_source_flat_file.loader import LOADER_MAP, build_nodes_and_edges
+from grai_source_flat_file.loader import (
+    DEFAULT_SAMPLE_ROWS,
+    SCHEMA_READER_MAP,
+    build_nodes_and_edges,
+)
 
 
 class FlatFileIntegration(GraiIntegrationImplementation):
@@ -28,6 +32,7 @@ class FlatFileIntegration(GraiIntegrationImplementation):
         table_name: Optional[str] = None,
         file_location: Optional[str] = None,
         version: Optional[str] = None,
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
     ):
         """Initializes the Flat File integration.
 
@@ -36,6 +41,7 @@ class FlatFileIntegration(GraiIntegrationImplementation):
             namespace: The Grai namespace to associate with output from the integration
             source: The Grai data source to associate with output from the integration. More information about source objects is available in the `grai_schemas` library.
             version: The Grai data version to associate with output from the integration
+            sample_rows: The maximum number of rows read to infer column types of files without a stored schema (csv)
         """
         super().__init__(source, version)
         try:
@@ -71,12 +77,13 @@ class FlatFileIntegration(GraiIntegrationImplementation):
             self.file_location = self.file_ref
 
         self.namespace = namespace
+        self.sample_rows = sample_rows
 
     @cache
     def get_nodes_and_edges(self) -> Tuple[List[SourcedNode], List[SourcedEdge]]:
         """Returns a tuple of lists of SourcedNode and SourcedEdge objects"""
         nodes, edges = build_nodes_and_edges(
-            self.file_ref, self.file_ext, self.table_name, self.file_location, self.namespace
+            self.file_ref, self.file_ext, self.table_name, self.file_location, self.namespace, self.sample_rows
         )
         nodes = adapt_to_client(nodes, self.source, self.version)
         edges = adapt_to_client(edges, self.source, self.version)
@@ -92,4 +99,4 @@ class FlatFileIntegration(GraiIntegrationImplementation):
 
     def ready(self) -> bool:
         """Returns True if the integration is ready to run"""
-        return self.file_ext in LOADER_MAP
+        return self.file_ext in SCHEMA_READER_MAP
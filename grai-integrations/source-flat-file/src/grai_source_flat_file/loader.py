@@ -1,13 +1,24 @@
 import os
-from itertools import chain
+import struct
+from itertools import accumulate, chain
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 
-from grai_source_flat_file.models import ID, Column, Edge, Table
+from grai_source_flat_file.models import ID, Column, Edge, FileSchema, Table
 
 LOADER_MAP = {".csv": pd.read_csv, ".parquet": pd.read_parquet, ".feather": pd.read_feather}
 
+# The maximum number of csv rows inspected to infer column types, read CSV_CHUNK_SIZE rows at a time
+DEFAULT_SAMPLE_ROWS = 100_000
+CSV_CHUNK_SIZE = 10_000
+# The arrow IPC message header type of record batches
+RECORD_BATCH_MESSAGE = 3
+
 
 def load_file(file_name: str, file_ext: str) -> pd.DataFrame:
     """
@@ -25,6 +36,231 @@ def load_file(file_name: str, file_ext: str) -> pd.DataFrame:
     return LOADER_MAP[file_ext](file_name)
 
 
+def arrow_dtypes(schema: pa.Schema) -> Dict[str, str]:
+    """Converts an arrow schema into the pandas dtypes its data would be loaded as without loading any data
+
+    Args:
+        schema: An arrow schema
+
+    Returns:
+        A mapping of column names to pandas dtype names
+
+    Raises:
+
+    """
+    return {name: str(dtype) for name, dtype in schema.empty_table().to_pandas().dtypes.items()}
+
+
+def read_parquet_schema(file_ref, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> FileSchema:
+    """Reads a parquet file's schema from its footer without touching any data pages.
+
+    Nullability comes from the row group statistics where every row group has them, otherwise from the schema.
+
+    Args:
+        file_ref: A path or file object
+        sample_rows: Unused, parquet files are never sampled
+
+    Returns:
+
+    Raises:
+
+    """
+    parquet_file = pq.ParquetFile(file_ref)
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    dtypes = arrow_dtypes(schema)
+
+    null_counts: Dict[str, Optional[int]] = {}
+    for i in range(metadata.num_columns):
+        name = parquet_file.schema.column(i).path.split(".")[0]
+        for row_group in range(metadata.num_row_groups):
+            statistics = metadata.row_group(row_group).column(i).statistics
+            if statistics is None or not statistics.has_null_count or null_counts.get(name, 0) is None:
+                null_counts[name] = None
+            else:
+                null_counts[name] = null_counts.get(name, 0) + statistics.null_count
+
+    nullable = {}
+    for name in dtypes:
+        null_count = null_counts.get(name)
+        nullable[name] = schema.field(name).nullable if null_count is None else null_count > 0
+
+    return FileSchema(dtypes=dtypes, nullable=nullable, rows_sampled=0, row_count=metadata.num_rows)
+
+
+def read_feather_schema(file_ref, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> FileSchema:
+    """Reads a feather file's schema from its footer and its null counts from the record batch headers.
+
+    The record batch bodies are skipped so no column data is read or decompressed.
+
+    Args:
+        file_ref: A path or file object
+        sample_rows: Unused, feather files are never sampled
+
+    Returns:
+
+    Raises:
+
+    """
+    try:
+        schema = pa.ipc.open_file(file_ref).schema
+        null_counts = ipc_null_counts(file_ref, schema)
+    except pa.ArrowInvalid:
+        # Legacy (v1) feather files have no footer so must be read in full
+        table = feather.read_table(file_ref)
+        schema = table.schema
+        null_counts = {name: table.column(name).null_count for name in schema.names}
+
+    dtypes = arrow_dtypes(schema)
+    nullable = {name: schema.field(name).nullable if null_counts is None else null_counts[name] > 0 for name in dtypes}
+    return FileSchema(dtypes=dtypes, nullable=nullable, rows_sampled=0)
+
+
+def flatbuffer_field(buffer: bytes, table: int, index: int) -> Optional[int]:
+    """The position of a flatbuffer table's field, None if the field isn't set"""
+    vtable = table - struct.unpack_from("<i", buffer, table)[0]
+    if 4 + 2 * index >= struct.unpack_from("<H", buffer, vtable)[0]:
+        return None
+    offset = struct.unpack_from("<H", buffer, vtable + 4 + 2 * index)[0]
+    return table + offset if offset else None
+
+
+def flatbuffer_offset(buffer: bytes, position: int) -> int:
+    return position + struct.unpack_from("<I", buffer, position)[0]
+
+
+def field_node_count(dtype: pa.DataType) -> int:
+    """The number of field nodes a column of this type has in a record batch, one for itself and each nested child"""
+    return 1 + sum(field_node_count(dtype.field(i).type) for i in range(dtype.num_fields))
+
+
+def ipc_null_counts(file_ref, schema: pa.Schema) -> Optional[Dict[str, int]]:
+    """Sums each column's null count over the record batch headers of an arrow IPC file without reading their bodies
+
+    Args:
+        file_ref: A path or file object of an arrow IPC file
+        schema: The file's schema
+
+    Returns:
+        The null count of each top level column, or None if the messages couldn't be read
+
+    Raises:
+
+    """
+    # Top level columns are followed by the field nodes of their children
+    node_indexes = list(accumulate((field_node_count(field.type) for field in schema), initial=0))[:-1]
+    null_counts = dict.fromkeys(schema.names, 0)
+
+    opened = isinstance(file_ref, (str, os.PathLike))
+    file = open(file_ref, "rb") if opened else file_ref
+    try:
+        # Messages follow the 8 byte magic header, each prefixed by a continuation token and its metadata length
+        file.seek(8)
+        while True:
+            (length,) = struct.unpack("<i", file.read(4))
+            if length == -1:
+                (length,) = struct.unpack("<i", file.read(4))
+            if length == 0:
+                return null_counts
+
+            message = file.read(length)
+            root = flatbuffer_offset(message, 0)
+            header_type = flatbuffer_field(message, root, 1)
+            body_length = flatbuffer_field(message, root, 3)
+            if header_type is not None and message[header_type] == RECORD_BATCH_MESSAGE:
+                batch = flatbuffer_offset(message, flatbuffer_field(message, root, 2))
+                nodes = flatbuffer_offset(message, flatbuffer_field(message, batch, 1))
+                for name, index in zip(schema.names, node_indexes):
+                    null_counts[name] += struct.unpack_from("<q", message, nodes + 4 + 16 * index + 8)[0]
+
+            if body_length is not None:
+                file.seek(struct.unpack_from("<q", message, body_length)[0], os.SEEK_CUR)
+    except (struct.error, TypeError, IndexError):
+        return None
+    finally:
+        if opened:
+            file.close()
+
+
+def common_dtype(a: Optional[np.dtype], b: np.dtype) -> np.dtype:
+    """The narrowest dtype able to hold values of both dtypes, falling back to object
+
+    Args:
+        a: The dtype seen so far if any
+        b: A newly observed dtype
+
+    Returns:
+
+    Raises:
+
+    """
+    if a is None:
+        return b
+
+    try:
+        return np.result_type(a, b)
+    except TypeError:
+        return np.dtype("object")
+
+
+def read_csv_schema(file_ref, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> FileSchema:
+    """Infers a csv file's column types from at most `sample_rows` rows read in fixed size chunks.
+
+    Only the running dtype and nullability of each column are kept between chunks so memory use is bounded by the
+    chunk size rather than the file size.
+
+    Args:
+        file_ref: A path or file object
+        sample_rows: The maximum number of rows to inspect
+
+    Returns:
+
+    Raises:
+
+    """
+    if sample_rows < 1:
+        raise ValueError(f"sample_rows must be a positive integer, got {sample_rows}")
+
+    dtypes: Dict[str, np.dtype] = {}
+    nullable: Dict[str, bool] = {}
+    rows_sampled = 0
+    with pd.read_csv(file_ref, chunksize=min(CSV_CHUNK_SIZE, sample_rows), nrows=sample_rows) as reader:
+        for chunk in reader:
+            rows_sampled += len(chunk)
+            for name, series in chunk.items():
+                dtypes[name] = common_dtype(dtypes.get(name), series.dtype)
+                nullable[name] = nullable.get(name, False) or bool(series.hasnans)
+
+    # A sample smaller than the budget means the whole file was read
+    row_count = rows_sampled if rows_sampled < sample_rows else None
+    return FileSchema(
+        dtypes={name: str(dtype) for name, dtype in dtypes.items()},
+        nullable=nullable,
+        rows_sampled=rows_sampled,
+        row_count=row_count,
+    )
+
+
+SCHEMA_READER_MAP = {".csv": read_csv_schema, ".parquet": read_parquet_schema, ".feather": read_feather_schema}
+
+
+def read_schema(file_ref, file_ext: str, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> FileSchema:
+    """
+
+    Args:
+        file_ref: A path or file object
+        file_ext: The type of file
+        sample_rows: The maximum number of rows to inspect for file types without a stored schema
+
+    Returns:
+
+    Raises:
+
+    """
+    assert file_ext in SCHEMA_READER_MAP, f"{file_ext} not supported. Choose one of {set(SCHEMA_READER_MAP.keys())}"
+    return SCHEMA_READER_MAP[file_ext](file_ref, sample_rows)
+
+
 def map_pandas_types(dtype) -> str:
     """
 
@@ -41,7 +277,7 @@ def map_pandas_types(dtype) -> str:
         return "integer"
     elif dtype.startswith("float"):
         return "float"
-    elif dtype.startswith("object"):
+    elif dtype.startswith("object") or dtype.startswith("str"):
         return "string"
     else:
         return dtype
@@ -116,7 +352,12 @@ def table_builder(namespace: str, table_name: str, file_location: str) -> Table:
 
 
 def build_nodes_and_edges(
-    file_ref: str, file_type: str, table_name: str, file_location: str, namespace: str
+    file_ref: str,
+    file_type: str,
+    table_name: str,
+    file_location: str,
+    namespace: str,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
 ) -> Tuple[List[Union[Table, Column]], List[Edge]]:
     """
 
@@ -126,19 +367,30 @@ def build_nodes_and_edges(
         table_name:
         file_location:
         namespace (str):
+        sample_rows: The maximum number of rows to inspect for file types without a stored schema
 
     Returns:
 
     Raises:
 
     """
-    df = load_file(file_ref, file_type)
-
-    builder = column_builder(namespace, table_name)
-    columns = [builder(df[col]) for col in df.columns]
+    schema = read_schema(file_ref, file_type, sample_rows)
+
+    columns = [
+        Column(
+            name=name,
+            namespace=namespace,
+            table=table_name,
+            data_type=map_pandas_types(dtype),
+            is_nullable=schema.nullable[name],
+        )
+        for name, dtype in schema.dtypes.items()
+    ]
 
     table = table_builder(namespace, table_name, file_location)
     table.columns = columns
+    table.rows_sampled = schema.rows_sampled
+    table.row_count = schema.row_count
 
     nodes = [table, *columns]
     return nodes, table.get_edges()
@@ -1,4 +1,4 @@
-from typing import List, Literal, Optional, Union
+from typing import Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -16,6 +16,8 @@ class Table(ID):
 
     file_name: str
     columns: Optional[List["Column"]] = None
+    rows_sampled: Optional[int] = None
+    row_count: Optional[int] = None
 
     @property
     def full_name(self):
@@ -58,6 +60,15 @@ class Column(ID):
         return f"{self.table}.{self.name}"
 
 
+class FileSchema(BaseModel):
+    """The column types of a file, read from its stored schema or inferred from a bounded sample of its rows"""
+
+    dtypes: Dict[str, str]
+    nullable: Dict[str, bool]
+    rows_sampled: int
+    row_count: Optional[int] = None
+
+
 class Edge(BaseModel):
     """ """
 
@@ -1,7 +1,12 @@
 import os
 
+import pandas as pd
+import pytest
+
+from grai_source_flat_file import loader
 from grai_source_flat_file.adapters import adapt_to_client
-from grai_source_flat_file.loader import build_nodes_and_edges
+from grai_source_flat_file.loader import build_nodes_and_edges, read_schema
+from grai_source_flat_file.models import Table
 
 
 class TestFileTypes:
@@ -84,3 +89,83 @@ def test_adapt_nodes(mock_data, mock_source):
         raise e
     finally:
         os.remove(file_name)
+
+
+class TestSchemaInference:
+    @pytest.fixture
+    def nullable_data(self):
+        return pd.DataFrame({"a": range(10), "b": ["t"] * 9 + [None], "c": [0.5] * 10})
+
+    def test_parquet_schema_from_metadata(self, nullable_data, tmp_path):
+        file_name = str(tmp_path / "test.parquet")
+        nullable_data.to_parquet(file_name, index=False)
+
+        schema = read_schema(file_name, ".parquet")
+
+        assert schema.dtypes == {"a": "int64", "b": "object", "c": "float64"}
+        assert schema.nullable == {"a": False, "b": True, "c": False}
+        assert schema.rows_sampled == 0
+        assert schema.row_count == 10
+
+    def test_feather_schema_from_metadata(self, nullable_data, tmp_path):
+        file_name = str(tmp_path / "test.feather")
+        nullable_data.to_feather(file_name)
+
+        schema = read_schema(file_name, ".feather")
+
+        assert schema.dtypes == {"a": "int64", "b": "object", "c": "float64"}
+        assert schema.nullable == {"a": False, "b": True, "c": False}
+        assert schema.rows_sampled == 0
+
+    @pytest.mark.parametrize("compression", ["uncompressed", "lz4"])
+    def test_feather_null_counts_cover_every_batch(self, nullable_data, tmp_path, compression):
+        file_name = str(tmp_path / "test.feather")
+        nullable_data.to_feather(file_name, compression=compression, chunksize=3)
+
+        with open(file_name, "rb") as file:
+            schema = read_schema(file, ".feather")
+
+        assert schema.nullable == {"a": False, "b": True, "c": False}
+
+    @pytest.mark.parametrize("dtype", ["object", "str", "string", "string[python]"])
+    def test_string_dtypes(self, dtype):
+        assert loader.map_pandas_types(dtype) == "string"
+
+    def test_csv_sample_is_bounded(self, tmp_path):
+        file_name = str(tmp_path / "test.csv")
+        pd.DataFrame({"a": range(1000), "b": ["t"] * 1000}).to_csv(file_name, index=False)
+
+        schema = read_schema(file_name, ".csv", sample_rows=250)
+
+        assert schema.dtypes == {"a": "int64", "b": "object"}
+        assert schema.rows_sampled == 250
+        assert schema.row_count is None
+
+    def test_csv_small_file_is_counted(self, nullable_data, tmp_path):
+        file_name = str(tmp_path / "test.csv")
+        nullable_data.to_csv(file_name, index=False)
+
+        schema = read_schema(file_name, ".csv")
+
+        assert schema.rows_sampled == 10
+        assert schema.row_count == 10
+        assert schema.nullable == {"a": False, "b": True, "c": False}
+
+    def test_csv_types_are_combined_across_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(loader, "CSV_CHUNK_SIZE", 5)
+        file_name = str(tmp_path / "test.csv")
+        pd.DataFrame({"a": [1] * 5 + [1.5] * 5, "b": [1] * 5 + ["x"] * 5}).to_csv(file_name, index=False)
+
+        schema = read_schema(file_name, ".csv")
+
+        assert schema.dtypes == {"a": "float64", "b": "object"}
+
+    def test_rows_sampled_reported(self, nullable_data, tmp_path):
+        file_name = str(tmp_path / "test.csv")
+        nullable_data.to_csv(file_name, index=False)
+
+        nodes, edges = build_nodes_and_edges(file_name, ".csv", "test", file_name, "test", sample_rows=5)
+        table = next(node for node in nodes if isinstance(node, Table))
+
+        assert table.rows_sampled == 5
+        assert len(table.columns) == 3
@@ -1,6 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from itertools import chain
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import looker_sdk
 from looker_sdk import api_settings
@@ -9,6 +10,7 @@ from pydantic import BaseSettings, SecretStr, validator
 from grai_source_looker.models import (
     Constraint,
     Dashboard,
+    Dimension,
     Edge,
     Explore,
     FieldID,
@@ -80,6 +82,7 @@ class LookerAPI:
         verify_ssl: Optional[bool] = None,
         namespace: Optional[str] = None,
         namespaces: Optional[Dict[str, str]] = None,
+        parallelization: int = 10,
     ):
         passthrough_kwargs = {
             "base_url": base_url,
@@ -94,17 +97,44 @@ class LookerAPI:
         settings = LookerSettings(self.config)
 
         self.sdk = looker_sdk.init40(config_settings=settings)
+        self.parallelization = parallelization
+
+        # Many queries share the same explore so both the API responses and the parsed explores are memoised
+        self._lookml_model_explores: Dict[Tuple[str, str], Dict] = {}
+        self._explores: Dict[Tuple[str, str, str], Explore] = {}
+        self._explore_dimensions: Dict[Tuple[str, str, str], Dict[str, Dimension]] = {}
+
+    def get_lookml_model_explore(self, lookml_model_name: str, explore_name: str) -> Dict:
+        key = (lookml_model_name, explore_name)
+        if key not in self._lookml_model_explores:
+            self._lookml_model_explores[key] = self.sdk.lookml_model_explore(lookml_model_name, explore_name)
+        return self._lookml_model_explores[key]
 
     def get_model_explore(self, lookml_model_name: str, explore_name: str, namespace: str) -> Explore:
-        return Explore(
-            namespace=namespace,
-            **self.sdk.lookml_model_explore(lookml_model_name, explore_name),
-        )
+        key = (lookml_model_name, explore_name, namespace)
+        if key not in self._explores:
+            self._explores[key] = Explore(
+                namespace=namespace,
+                **self.get_lookml_model_explore(lookml_model_name, explore_name),
+            )
+        return self._explores[key]
+
+    def get_explore_dimensions(self, lookml_model_name: str, explore_name: str, namespace: str) -> Dict[str, Dimension]:
+        key = (lookml_model_name, explore_name, namespace)
+        if key not in self._explore_dimensions:
+            explore = self.get_model_explore(lookml_model_name, explore_name, namespace)
+            dimensions = {}
+            for dimension in explore.fields.dimensions:
+                dimensions.setdefault(dimension.name, dimension)
+            self._explore_dimensions[key] = dimensions
+        return self._explore_dimensions[key]
 
     @cached_property
     def dashboards(self) -> List[Dashboard]:
         result = self.sdk.all_dashboards()
-        return [Dashboard(namespace=self.config.namespace, **self.sdk.dashboard(item.id)) for item in result]
+        with ThreadPoolExecutor(max_workers=self.parallelization) as executor:
+            dashboards = executor.map(lambda item: self.sdk.dashboard(item.id), result)
+            return [Dashboard(namespace=self.config.namespace, **dashboard) for dashboard in dashboards]
 
     @cached_property
     def queries(self) -> List:
@@ -134,6 +164,7 @@ class LookerAPI:
                 continue
 
             nodes.append(explore)
+            dimensions = self.get_explore_dimensions(query.model, query.view, explore_namespace)
 
             for field in query.fields:
                 dynamic_field = query.dynamic_fields_map.get(field, None)
@@ -141,9 +172,7 @@ class LookerAPI:
                 if dynamic_field:
                     field = dynamic_field
 
-                field_dimension = (dimension for dimension in explore.fields.dimensions if dimension.name == field)
-
-                if not (dimension := next(field_dimension, False)):
+                if not (dimension := dimensions.get(field, False)):
                     print(f"Dimension not found {field}")
                     print(query.dynamic_fields)
                     continue
@@ -1,3 +1,6 @@
+import threading
+from types import SimpleNamespace
+
 import pytest
 from grai_schemas import config as core_config
 from grai_schemas.v1 import SourcedEdgeV1, SourcedNodeV1
@@ -8,6 +11,7 @@ from grai_schemas.v1.metadata.nodes import ColumnMetadata
 from grai_schemas.v1.metadata.nodes import Metadata as NodeV1Metadata
 from grai_schemas.v1.metadata.nodes import NodeMetadataTypeLabels, TableMetadata
 
+from grai_source_looker.loader import LookerAPI
 from grai_source_looker.models import Edge, LookerNode
 from grai_source_looker.package_definitions import config
 
@@ -40,6 +44,60 @@ def test_loader_edge_types(app_edges):
     assert all(isinstance(edge, Edge) for edge in app_edges)
 
 
+class MockLookerSDK:
+    """A stand in for the Looker SDK which counts the requests made against it"""
+
+    def __init__(self, n_dashboards: int = 5):
+        self.n_dashboards = n_dashboards
+        self.lock = threading.Lock()
+        self.explore_calls = 0
+
+    def all_dashboards(self):
+        return [SimpleNamespace(id=str(i)) for i in range(self.n_dashboards)]
+
+    def dashboard(self, dashboard_id):
+        query = {"id": int(dashboard_id), "model": "model", "view": "explore", "fields": ["explore.a", "explore.b"]}
+        element = {
+            "id": int(dashboard_id),
+            "title": f"Element {dashboard_id}",
+            "result_maker": {"id": 1, "query": query},
+        }
+        return {"id": dashboard_id, "title": f"Dashboard {dashboard_id}", "dashboard_elements": [element]}
+
+    def lookml_model_explore(self, lookml_model_name, explore_name):
+        with self.lock:
+            self.explore_calls += 1
+
+        dimensions = [
+            {"name": f"explore.{name}", "label": name, "type": "string", "sql": f"${{TABLE}}.{name}"} for name in "abc"
+        ]
+        return {"id": explore_name, "name": explore_name, "fields": {"dimensions": dimensions}, "sql_table_name": "tbl"}
+
+
+class TestLookerAPI:
+    """ """
+
+    @pytest.fixture
+    def mock_api(self, loader_kwargs):
+        api = LookerAPI(**loader_kwargs)
+        api.sdk = MockLookerSDK()
+        return api
+
+    def test_dashboards_are_all_fetched(self, mock_api):
+        """ """
+        assert [dashboard.name for dashboard in mock_api.dashboards] == [str(i) for i in range(5)]
+
+    def test_explores_are_fetched_once(self, mock_api):
+        """ """
+        assert len(mock_api.explores) == 5
+        assert mock_api.sdk.explore_calls == 1
+
+    def test_dimension_lookup(self, mock_api):
+        """ """
+        dimensions = mock_api.get_explore_dimensions("model", "explore", "looker-namespace")
+        assert set(dimensions.keys()) == {"explore.a", "explore.b", "explore.c"}
+
+
 class TestConnector:
     """ """
 
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field, PrivateAttr
@@ -64,6 +65,7 @@ class Table(BaseModel):
     db_id: int
     description: Optional[str]
     db: TableDB
+    updated_at: Optional[datetime]
 
 
 class FingerPrintGlobal(BaseModel):
@@ -97,6 +99,7 @@ class TableMetadata(BaseModel):
     db_id: int
     display_name: str
     fields: Optional[List[TableMetadataField]]
+    updated_at: Optional[datetime]
 
 
 class Collection(BaseModel):
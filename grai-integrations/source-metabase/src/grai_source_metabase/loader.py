@@ -1,4 +1,5 @@
 import asyncio
+import random
 from functools import cached_property
 from itertools import chain
 from typing import Callable, Dict, List, Optional, Tuple, TypedDict, Union
@@ -51,6 +52,8 @@ class MetabaseAPI:
         username (str, optional): Metabase username. Defaults to None or returns value from environment variable.
         password (str, optional): Metabase password. Defaults to None or returns value from environment variable.
         endpoint (str, optional): Metabase API endpoint URL. Defaults to None.
+        parallelization (int, optional): The maximum number of concurrent table metadata requests. Defaults to 10.
+        max_retries (int, optional): The number of times a failed table metadata request is retried. Defaults to 3.
 
     """
 
@@ -59,6 +62,8 @@ class MetabaseAPI:
         username: Optional[str] = None,
         password: Optional[str] = None,
         endpoint: Optional[str] = None,
+        parallelization: int = 10,
+        max_retries: int = 3,
     ):
         passthrough_kwargs = {
             "username": username,
@@ -73,6 +78,9 @@ class MetabaseAPI:
         self.session.headers.update({"Content-Type": "application/json"})
         self.session.headers.update(self.authenticate())
 
+        self.parallelization = parallelization
+        self.max_retries = max_retries
+
     @retry(stop_max_attempt_number=3, wait_fixed=5000)
     def authenticate(self) -> Dict[str, str]:
         """
@@ -171,6 +179,48 @@ class MetabaseAPI:
         url = f"{self.api_endpoint}/table/{table_id}/query_metadata"
         return api.TableMetadata(**self.make_request(self.session.get, url))
 
+    def async_client(self) -> httpx.AsyncClient:
+        """Creates an HTTP/2 client whose connection pool is shared by every table metadata request"""
+        limits = httpx.Limits(max_connections=self.parallelization, max_keepalive_connections=self.parallelization)
+        return httpx.AsyncClient(headers=dict(self.session.headers), http2=True, limits=limits)
+
+    async def async_get_table_metadata(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, table_id: int
+    ) -> api.TableMetadata:
+        """Retrieves metadata for a single table, retrying transient failures with a jittered exponential backoff
+
+        Args:
+            client: A shared httpx client.
+            semaphore: Bounds the number of requests in flight at once.
+            table_id: A table id to retrieve metadata for from Metabase.
+
+        Returns:
+
+        Raises:
+            requests.RequestException: If the request still fails after `max_retries` retries.
+
+        """
+        url = f"{self.api_endpoint}/table/{table_id}/query_metadata"
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                try:
+                    response = await client.get(url)
+                except httpx.TransportError as e:
+                    reason = str(e)
+                else:
+                    if response.status_code == 200:
+                        return api.TableMetadata.parse_raw(response.content)
+                    reason = f"status code `{response.status_code}`"
+
+            await asyncio.sleep(min(2**attempt, 30) * random.uniform(0.5, 1.5))
+
+        message = (
+            f"While retrieving table metadata from `{url}` the Metabase API failed {self.max_retries + 1} times, "
+            f"most recently with {reason}. This does not appear to be an issue with Grai, please check your Metabase "
+            f"instance."
+        )
+        raise requests.RequestException(message)
+
     async def get_all_table_metadata(self, table_ids: List[int]) -> List[api.TableMetadata]:
         """
 
@@ -180,17 +230,10 @@ class MetabaseAPI:
         Returns:
 
         """
-        async with httpx.AsyncClient(headers=self.session.headers) as client:
-            urls = [f"{self.api_endpoint}/table/{table_id}/query_metadata" for table_id in table_ids]
-            responses = await asyncio.gather(*[client.get(url) for url in urls], return_exceptions=True)
-
-        for i, response in enumerate(responses):
-            if not hasattr(response, "status_code") or response.status_code != 200:
-                response = self.session.get(url=urls[i])
-                assert response.status_code == 200, f"Request error to `{urls[i]}`. Got {response.status_code}"
-                responses[i] = response
-
-        return [api.TableMetadata(**response.json()) for response in responses]
+        semaphore = asyncio.Semaphore(self.parallelization)
+        async with self.async_client() as client:
+            tasks = [self.async_get_table_metadata(client, semaphore, table_id) for table_id in table_ids]
+            return await asyncio.gather(*tasks)
 
     def get_dbs(self) -> List[api.DB]:
         """Retrieves the list of databases from the Metabase API.
@@ -236,6 +279,8 @@ class MetabaseConnector(MetabaseAPI):
     Args:
         namespaces: A mapping of database IDs to their corresponding namespace names. Defaults to None.
         default_namespace: The default namespace to be used when a table or question does not have a specific namespace. Defaults to None.
+        table_metadata_cache: Table metadata from a previous run keyed by table id. Tables whose `updated_at` is
+            unchanged are served from the cache rather than being requested again. Defaults to None.
         *args: Additional positional arguments to be passed to the base class constructor.
         **kwargs: Additional keyword arguments to be passed to the base class constructor.
 
@@ -252,6 +297,7 @@ class MetabaseConnector(MetabaseAPI):
         namespace_map: A mapping of database IDs to their corresponding namespace names.
         question_table_map: A mapping of question IDs to their corresponding table IDs.
         table_db_map: A mapping of table IDs to their corresponding database IDs.
+        table_metadata_cache: The most recent metadata for every table, suitable for passing to the next run.
 
     """
 
@@ -259,6 +305,7 @@ class MetabaseConnector(MetabaseAPI):
         self,
         metabase_namespace: str,
         namespace_map: Optional[Union[str, Dict[int, str]]] = None,
+        table_metadata_cache: Optional[Dict[int, api.TableMetadata]] = None,
         *args,
         **kwargs,
     ):
@@ -279,6 +326,9 @@ class MetabaseConnector(MetabaseAPI):
         super().__init__(*args, **kwargs)
         self.base_namespace_map = namespace_map
         self.metabase_namespace = metabase_namespace
+        self.table_metadata_cache: Dict[int, api.TableMetadata] = (
+            {} if table_metadata_cache is None else dict(table_metadata_cache)
+        )
 
     @cached_property
     def dbs_map(self) -> Dict[int, api.DB]:
@@ -301,12 +351,19 @@ class MetabaseConnector(MetabaseAPI):
     def tables_map(self) -> Dict[int, Table]:
         return {table.id: table for table in self.tables}
 
+    def is_table_metadata_stale(self, table: Table) -> bool:
+        cached = self.table_metadata_cache.get(table.id, None)
+        return cached is None or table.updated_at is None or cached.updated_at != table.updated_at
+
     @cached_property
     def table_metadata_map(self) -> Dict[int, TableMetadata]:
-        table_metas = asyncio.run(self.get_all_table_metadata(list(self.tables_map.keys())))
+        stale_ids = [table.id for table in self.tables if self.is_table_metadata_stale(table)]
+        for meta in asyncio.run(self.get_all_table_metadata(stale_ids)):
+            self.table_metadata_cache[meta.id] = meta
+
         table_metas = (
-            TableMetadata(namespace=table.namespace, **meta.dict())
-            for meta, table in zip(table_metas, self.tables_map.values())
+            TableMetadata(namespace=table.namespace, **self.table_metadata_cache[table_id].dict())
+            for table_id, table in self.tables_map.items()
         )
         return {meta.id: meta for meta in table_metas}
 
@@ -1,6 +1,10 @@
+import asyncio
+import time
 from typing import get_args
 
+import httpx
 import pytest
+import requests
 from grai_schemas import config as core_config
 from grai_schemas.v1 import EdgeV1, NodeV1, SourcedEdgeV1, SourcedNodeV1
 from grai_schemas.v1.metadata.edges import BaseEdgeMetadataV1
@@ -8,8 +12,12 @@ from grai_schemas.v1.metadata.edges import Metadata as EdgeV1Metadata
 from grai_schemas.v1.metadata.nodes import Metadata as NodeV1Metadata
 
 from grai_source_metabase import api
-from grai_source_metabase.loader import MetabaseConnector, build_namespace_map
-from grai_source_metabase.models import Edge, NodeTypes
+from grai_source_metabase.loader import (
+    MetabaseAPI,
+    MetabaseConnector,
+    build_namespace_map,
+)
+from grai_source_metabase.models import Edge, NodeTypes, Table
 
 
 def test_loader_node_types(app_nodes):
@@ -306,3 +314,103 @@ class TestConnector:
 
         for edge in edges:
             assert isinstance(getattr(edge.spec.metadata, core_config.metadata_id), get_args(EdgeV1Metadata))
+
+
+class TestTableMetadataFetch:
+    """ """
+
+    @staticmethod
+    def table_metadata(table_id, updated_at="2023-01-01T00:00:00Z"):
+        return {
+            "id": table_id,
+            "name": f"table_{table_id}",
+            "schema": "public",
+            "active": True,
+            "db_id": 1,
+            "display_name": f"Table {table_id}",
+            "fields": [],
+            "updated_at": updated_at,
+        }
+
+    @pytest.fixture
+    def mock_api(self, monkeypatch):
+        """Builds a MetabaseAPI whose requests are served by `handler` rather than a live instance"""
+
+        def make_api(handler, **kwargs):
+            monkeypatch.setattr(MetabaseAPI, "authenticate", lambda self: {})
+            monkeypatch.setattr(asyncio, "sleep", self.no_sleep)
+            metabase = MetabaseAPI(username="user", password="password", endpoint="http://metabase.local", **kwargs)
+            monkeypatch.setattr(
+                metabase, "async_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            return metabase
+
+        return make_api
+
+    @staticmethod
+    async def no_sleep(delay):
+        pass
+
+    def test_concurrency_is_bounded(self, mock_api):
+        """ """
+        active = {"current": 0, "max": 0}
+
+        async def handler(request):
+            active["current"] += 1
+            active["max"] = max(active["max"], active["current"])
+            await asyncio.get_running_loop().run_in_executor(None, time.sleep, 0.01)
+            active["current"] -= 1
+            table_id = int(request.url.path.split("/")[-2])
+            return httpx.Response(200, json=self.table_metadata(table_id))
+
+        metabase = mock_api(handler, parallelization=3)
+        results = asyncio.run(metabase.get_all_table_metadata(list(range(20))))
+
+        assert [result.id for result in results] == list(range(20))
+        assert active["max"] <= 3
+
+    def test_failures_are_retried(self, mock_api):
+        """ """
+        attempts = {}
+
+        def handler(request):
+            attempts[request.url.path] = attempts.get(request.url.path, 0) + 1
+            if attempts[request.url.path] < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json=self.table_metadata(1))
+
+        metabase = mock_api(handler, max_retries=2)
+        results = asyncio.run(metabase.get_all_table_metadata([1]))
+        assert results[0].id == 1
+
+    def test_retries_are_exhausted(self, mock_api):
+        """ """
+        metabase = mock_api(lambda request: httpx.Response(503), max_retries=1)
+        with pytest.raises(requests.RequestException):
+            asyncio.run(metabase.get_all_table_metadata([1]))
+
+    def test_unchanged_tables_are_skipped(self, mock_api):
+        """ """
+        requested = []
+
+        def handler(request):
+            table_id = int(request.url.path.split("/")[-2])
+            requested.append(table_id)
+            return httpx.Response(200, json=self.table_metadata(table_id, "2023-02-01T00:00:00Z"))
+
+        metabase = mock_api(handler)
+        connector = MetabaseConnector.__new__(MetabaseConnector)
+        connector.__dict__.update(metabase.__dict__)
+        connector.table_metadata_cache = {
+            1: api.TableMetadata(**self.table_metadata(1)),
+            2: api.TableMetadata(**self.table_metadata(2)),
+        }
+        db = api.TableDB(id=1, name="db", engine="postgres")
+        connector.tables = [
+            Table(id=1, name="table_1", schema="public", db_id=1, db=db, updated_at="2023-01-01T00:00:00Z"),
+            Table(id=2, name="table_2", schema="public", db_id=1, db=db, updated_at="2023-02-01T00:00:00Z"),
+        ]
+
+        assert set(connector.table_metadata_map.keys()) == {1, 2}
+        assert requested == [2]
+        assert connector.table_metadata_cache[2].updated_at == connector.tables[1].updated_at
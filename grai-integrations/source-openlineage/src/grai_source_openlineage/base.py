@@ -20,7 +20,7 @@ class OpenLineageIntegration(GraiIntegrationImplementation):
 
     def __init__(
         self,
-        lineage_data: Union[str, dict],
+        lineage_data: Union[str, dict, List[dict]],
         source: SourceV1,
         version: Optional[str] = None,
         namespace: Optional[str] = "default",
@@ -29,7 +29,7 @@ class OpenLineageIntegration(GraiIntegrationImplementation):
         """Initializes the dbt integration.
 
         Args:
-            lineage_data: Either a string path to a manifest.json file, or a dictionary parsing of a manifest.json file
+            lineage_data: Either a string path to an OpenLineage json file, a single OpenLineage event, or a list of events to process as one batch
             source: The Grai data source to associate with output from the integration. More information about source objects is available in the `grai_schemas` library.
             version: The Grai data version to associate with output from the integration
             namespace: The Grai namespace to associate with output from the integration
@@ -14,19 +14,25 @@ class OpenLineageProcessor:
 
     def __init__(
         self,
-        lineage: Union[str, dict],
+        lineage: Union[str, dict, List[dict]],
         namespaces: Optional[Dict[str, str]],
         namespace: str,
         source: SourceSpec,
     ):
         if isinstance(lineage, str):
-            lineage = json.load(lineage)
+            with open(lineage, "r") as f:
+                lineage = json.load(f)
 
         self.lineage = lineage
         self.namespaces = namespaces
         self.namespace = namespace
         self.source = source
 
+    @property
+    def events(self) -> List[dict]:
+        """The OpenLineage events being processed, a batch of events is processed as a single update"""
+        return self.lineage if isinstance(self.lineage, list) else [self.lineage]
+
     @cached_property
     def adapted_nodes(self) -> List[SourcedNodeV1]:
         """
@@ -93,9 +99,15 @@ class OpenLineageProcessor:
 
         tables: Set[Table] = set()
         columns: Set[Column] = set()
-        edges: List[Edge] = []
+        # Events in a batch frequently repeat the same datasets, edges are deduplicated on their endpoints
+        edges: Dict[Tuple[str, str, str, str], Edge] = {}
+
+        def add_edge(source: NodeTypes, destination: NodeTypes, constraint_type: Constraint):
+            key = (source.namespace, source.name, destination.namespace, destination.name)
+            if key not in edges:
+                edges[key] = Edge(source=source, destination=destination, constraint_type=constraint_type)
 
-        outputs = self.lineage.get("outputs", [])
+        outputs = (output for event in self.events for output in event.get("outputs", []))
 
         for output in outputs:
             facets = output.get("facets")
@@ -119,19 +131,12 @@ class OpenLineageProcessor:
                     table_name=output_name,
                 )
                 columns.add(column)
-                edges.append(
-                    Edge(
-                        source=table,
-                        destination=column,
-                        constraint_type=Constraint("bt"),
-                    )
-                )
+                add_edge(table, column, Constraint("bt"))
 
                 for input_field in field.get("inputFields", []):
                     namespace = get_namespace(input_field["namespace"])
                     name = input_field["name"]
-                    field = input_field["field"]
-                    input_column_full_name = f"{name}.{field}"
+                    input_column_full_name = f"{name}.{input_field['field']}"
 
                     input_table = Table(name=name, namespace=namespace)
                     tables.add(input_table)
@@ -141,21 +146,9 @@ class OpenLineageProcessor:
                         table_name=name,
                     )
                     columns.add(input_column)
-                edges.append(
-                    Edge(
-                        source=input_table,
-                        destination=input_column,
-                        constraint_type=Constraint("bt"),
-                    )
-                )
-                edges.append(
-                    Edge(
-                        source=input_column,
-                        destination=column,
-                        constraint_type=Constraint("f"),
-                    )
-                )
+                    add_edge(input_table, input_column, Constraint("bt"))
+                    add_edge(input_column, column, Constraint("f"))
 
         nodes = list(tables) + list(columns)
 
-        return nodes, edges
+        return nodes, list(edges.values())
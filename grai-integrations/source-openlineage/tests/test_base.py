@@ -1,3 +1,5 @@
+import json
+
 from grai_source_openlineage.processor import OpenLineageProcessor
 
 
@@ -41,7 +43,34 @@ class TestOpenLineageProcessor:
         assert processor.lineage == openlineage_test_full_event
 
         assert len(processor.adapted_nodes) == 5
-        assert len(processor.adapted_edges) == 6
+        assert len(processor.adapted_edges) == 5
+
+    @staticmethod
+    def test_processing_batched_events(openlineage_test_event, openlineage_test_full_event, mock_source):
+        processor = OpenLineageProcessor(
+            lineage=[openlineage_test_full_event, openlineage_test_event, openlineage_test_full_event],
+            source=mock_source.spec,
+            namespace="default",
+            namespaces={},
+        )
+
+        assert len(processor.events) == 3
+        assert len(processor.adapted_nodes) == 5
+        assert len(processor.adapted_edges) == 5
+
+    @staticmethod
+    def test_processing_multiple_input_fields(openlineage_test_full_event, mock_source):
+        event = json.loads(json.dumps(openlineage_test_full_event))
+        field = event["outputs"][0]["facets"]["columnLineage"]["fields"]["order_day_of_week"]
+        field["inputFields"].append(
+            {"field": "customer_id", "name": "public.orders", "namespace": "postgres://postgres:5432"}
+        )
+
+        processor = OpenLineageProcessor(lineage=event, source=mock_source.spec, namespace="default", namespaces={})
+
+        edges = {(edge.source.name, edge.destination.name) for edge in processor.edges}
+        assert ("public.orders.customer_id", "workshop.public.taxes-out.order_day_of_week") in edges
+        assert ("public.top_delivery_times.order_placed_on", "workshop.public.taxes-out.order_day_of_week") in edges
 
 
 def test_column_facet(test_data_getter):
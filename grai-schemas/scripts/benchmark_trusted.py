@@ -0,0 +1,57 @@
+"""Compares the build rate of validated and trusted construction for nodes and edges shaped like server responses.
+
+Rows are generated in chunks from mock templates so a million objects can be built without holding them all at once.
+
+Usage: python scripts/benchmark_trusted.py [trusted rows, default 1000000] [validated rows, default 100000]
+"""
+
+import copy
+import json
+import sys
+import time
+import uuid
+
+from grai_schemas.serializers import dump_json
+from grai_schemas.v1.edge import EdgeV1
+from grai_schemas.v1.mock import MockV1
+from grai_schemas.v1.node import NodeV1
+
+CHUNK_SIZE = 10_000
+NUM_TEMPLATES = 100
+
+trusted_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+validated_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+mock = MockV1()
+templates = {
+    NodeV1: [json.loads(dump_json(mock.node.node(spec=mock.node.id_node_spec()).spec)) for _ in range(NUM_TEMPLATES)],
+    EdgeV1: [json.loads(dump_json(mock.edge.edge(spec=mock.edge.id_edge_spec()).spec)) for _ in range(NUM_TEMPLATES)],
+}
+
+
+def chunks(model, total: int):
+    for start in range(0, total, CHUNK_SIZE):
+        rows = []
+        for i in range(start, min(start + CHUNK_SIZE, total)):
+            row = copy.deepcopy(templates[model][i % NUM_TEMPLATES])
+            row["id"], row["name"] = str(uuid.uuid4()), f"{row['name']}_{i}"
+            rows.append(row)
+        yield rows
+
+
+def rate(model, total: int, build) -> float:
+    elapsed = 0.0
+    for rows in chunks(model, total):
+        start = time.perf_counter()
+        build(rows)
+        elapsed += time.perf_counter() - start
+    return total / elapsed
+
+
+for model in (NodeV1, EdgeV1):
+    validated = rate(model, validated_rows, lambda rows: [model.from_spec(row) for row in rows])
+    trusted = rate(model, trusted_rows, model.from_trusted_rows)
+    print(
+        f"{model.__name__}: validated={validated:,.0f}/s ({validated_rows:,} rows) "
+        f"trusted={trusted:,.0f}/s ({trusted_rows:,} rows) speedup={trusted / validated:.1f}x"
+    )
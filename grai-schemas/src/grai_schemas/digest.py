@@ -0,0 +1,102 @@
+"""Deterministic digests of the content of Grai objects.
+
+The `hash` of a Grai model is derived from its identity, or its name and namespace, so it can't be persisted or used
+to tell whether an object changed. A content digest is instead the sha256 of a canonical JSON encoding of the object:
+
+* mapping keys are sorted and keys without a value are dropped so a missing value and an explicit null agree
+* tags are de-duplicated and sorted since their order carries no meaning
+* models, UUIDs, enums, and dates are encoded as `GraiEncoder` would encode them
+
+The encoding of a pydantic model and of the JSON it was saved as are therefore identical, so digests computed by a
+client, the server, or from a database row can all be compared with one another.
+"""
+
+import hashlib
+import json
+from typing import Any, Mapping, Optional
+
+from grai_schemas.serializers import GraiEncoder
+from pydantic import BaseModel
+
+# Keys whose list values are compared as sets
+UNORDERED_KEYS = frozenset({"tags"})
+
+
+def canonical_json(value: Any) -> str:
+    """Encode a value as canonical JSON
+
+    Args:
+        value: Any value `GraiEncoder` can encode
+
+    Returns:
+        The canonical JSON encoding of the value
+    """
+    return json.dumps(normalize(value), cls=GraiEncoder, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def normalize(value: Any) -> Any:
+    """Convert a value into the plain structure encoded by `canonical_json`"""
+    if isinstance(value, BaseModel):
+        # Models which customise `dict` e.g. malformed metadata are saved as their `dict`
+        value = value.__dict__ if type(value).dict is BaseModel.dict else value.dict()
+
+    if isinstance(value, Mapping):
+        return {
+            str(key): normalize_unordered(item) if key in UNORDERED_KEYS else normalize(item)
+            for key, item in value.items()
+            if item is not None
+        }
+    elif isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    elif isinstance(value, (set, frozenset)):
+        return normalize_unordered(value)
+    return value
+
+
+def normalize_unordered(value: Any) -> Any:
+    if not isinstance(value, (list, tuple, set, frozenset)):
+        return normalize(value)
+
+    items = {canonical_json(item): item for item in value}
+    return [normalize(items[key]) for key in sorted(items)]
+
+
+def content_digest(value: Any) -> str:
+    """A deterministic sha256 digest of a value's canonical JSON encoding
+
+    Args:
+        value: Any value `GraiEncoder` can encode
+
+    Returns:
+        The hex digest
+    """
+    return hashlib.sha256(canonical_json(value).encode("utf-8")).hexdigest()
+
+
+def spec_digest(
+    name: Optional[str], namespace: Optional[str], display_name: Optional[str], is_active: Optional[bool], metadata: Any
+) -> str:
+    """The content digest of a node or edge
+
+    Only the values a node or edge stores itself are included. Identifiers and relationships like the workspace, data
+    sources, or an edge's source and destination are not part of an object's content. The display name defaults to
+    the name as it does when the object is saved.
+
+    Args:
+        name: The object's name
+        namespace: The object's namespace
+        display_name: The object's display name
+        is_active: Whether the object is active
+        metadata: The object's metadata as a model or as the dictionary it was saved as
+
+    Returns:
+        The hex digest
+    """
+    values = {
+        "name": name,
+        "namespace": namespace,
+        "display_name": display_name or name,
+        "is_active": is_active,
+        "metadata": metadata,
+    }
+    return content_digest(values)
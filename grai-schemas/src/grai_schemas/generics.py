@@ -1,6 +1,7 @@
-from typing import Any, Dict, Literal, Optional, TypeVar, Union
+from typing import Any, Dict, Literal, Optional, Type, TypeVar, Union
 from uuid import UUID
 
+from grai_schemas import trusted
 from grai_schemas.serializers import dump_json, load_json
 from grai_schemas.utilities import merge
 from pydantic import BaseModel, dataclasses, root_validator, validator
@@ -53,6 +54,24 @@ class GraiBaseModel(HashableBaseModel):
         values = self.dict()
         return type(self)(**merge(values, new_values))
 
+    @classmethod
+    def from_trusted(cls: Type[T], values: Dict) -> T:
+        """Build an instance from data which has already been validated without validating it again
+
+        Intended for data produced by Grai itself e.g. database rows or API responses from the server. Values which
+        don't fit the model's shape are validated as usual so the result is always a valid instance.
+
+        Args:
+            values: Previously validated data
+
+        Returns:
+            An instance of the current model
+
+        Raises:
+
+        """
+        return trusted.construct(cls, values)
+
     class Config:
         """ """
 
@@ -1,6 +1,8 @@
+import io
 import json
 import os
 import pathlib
+from contextlib import contextmanager
 from datetime import date, datetime, timezone
 from enum import Enum
 from json import JSONEncoder
@@ -11,6 +13,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -23,6 +26,9 @@ import yaml
 from pydantic import BaseModel
 from pydantic.json import pydantic_encoder
 
+# libyaml's C parser is several times faster than the pure python parser, PyYAML only ships it when built against libyaml
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def to_ecma262(dt: datetime) -> str:
     """Convert a datetime to a string in ECMA-262 format
@@ -100,6 +106,28 @@ def load_json(v: str) -> Any:
     return json.loads(v)
 
 
+@contextmanager
+def open_stream(stream: Union[str, Path, IO], extensions: Sequence[str]) -> Iterator[IO]:
+    """Opens a path for reading, raw strings are wrapped in a buffer and file-like objects are passed through unchanged
+
+    Args:
+        stream: A Path, a string which is either a file path or raw content, or a file-like object.
+        extensions: File extensions which mark a string as a path even if the file doesn't exist.
+
+    Returns:
+        A readable file-like object
+    """
+    if isinstance(stream, Path) or (
+        isinstance(stream, str) and (stream.endswith(extensions) or os.path.exists(stream))
+    ):
+        with open(stream, "r") as file:
+            yield file
+    elif isinstance(stream, str):
+        yield io.StringIO(stream)
+    else:
+        yield stream
+
+
 class GraiYamlSerializer:
     """A YAML serializer for Grai
 
@@ -107,8 +135,27 @@ class GraiYamlSerializer:
 
     """
 
-    @staticmethod
-    def load(stream: Union[str, Path, IO]) -> Union[Dict, List[Dict]]:
+    extensions = (".yml", ".yaml")
+
+    @classmethod
+    def load_all(cls, stream: Union[str, Path, IO]) -> Iterator[Dict]:
+        """Lazily load each document of a multi-document YAML stream
+
+        Only one document is held in memory at a time.
+
+        Args:
+            stream: The stream to load from. This can be a string, a Path, or a file-like object.
+
+        Returns:
+            An iterator over the documents in the stream
+        Raises:
+
+        """
+        with open_stream(stream, cls.extensions) as file:
+            yield from yaml.load_all(file, Loader=YamlLoader)
+
+    @classmethod
+    def load(cls, stream: Union[str, Path, IO]) -> Union[Dict, List[Dict]]:
         """
 
         Args:
@@ -119,14 +166,7 @@ class GraiYamlSerializer:
         Raises:
 
         """
-        if isinstance(stream, Path):
-            with open(stream, "r") as file:
-                result = list(yaml.safe_load_all(file))
-        elif isinstance(stream, str) and (stream.endswith((".yml", ".yaml")) or os.path.exists(stream)):
-            with open(stream, "r") as file:
-                result = list(yaml.safe_load_all(file))
-        else:
-            result = list(yaml.safe_load_all(stream))
+        result = list(cls.load_all(stream))
 
         if len(result) == 1:
             result = result[0]
@@ -178,3 +218,84 @@ class GraiYamlSerializer:
             return list(load_json(dump_json(item)) for item in data)
         else:
             return load_json(dump_json(data))
+
+
+class GraiJsonLinesSerializer:
+    """A JSON lines serializer for Grai
+
+    Each line holds a single JSON object serialized with Grai's serialization rules. Unlike YAML, a JSON lines file can
+    be read one line at a time without a parser holding any state between objects.
+
+    """
+
+    extensions = (".jsonl", ".ndjson")
+
+    @classmethod
+    def load_all(cls, stream: Union[str, Path, IO]) -> Iterator[Dict]:
+        """Lazily load each object in a JSON lines stream, blank lines are skipped
+
+        Args:
+            stream: The stream to load from. This can be a string, a Path, or a file-like object.
+
+        Returns:
+            An iterator over the objects in the stream
+        Raises:
+
+        """
+        with open_stream(stream, cls.extensions) as file:
+            for line in file:
+                if line.strip():
+                    yield load_json(line)
+
+    @classmethod
+    def load(cls, stream: Union[str, Path, IO]) -> List[Dict]:
+        """
+
+        Args:
+            stream: The stream to load from. This can be a string, a Path, or a file-like object.
+
+        Returns:
+            A list of dictionaries
+        Raises:
+
+        """
+        return list(cls.load_all(stream))
+
+    @classmethod
+    def dump(cls, item: Any, stream: Optional[Union[IO, str, Path]] = None) -> Optional[str]:
+        """Dump an object, or each object of a sequence, as a line of JSON following Grai's serialization rules
+
+        Args:
+            item: The object or sequence of objects to dump
+            stream: The stream to dump to. If None, the result is returned as a string.
+
+        Returns:
+            The JSON lines string if no stream was provided
+
+        Raises:
+
+        """
+        items = item if isinstance(item, Sequence) and not isinstance(item, str) else [item]
+        lines = (f"{dump_json(obj)}\n" for obj in items)
+
+        if stream is None:
+            return "".join(lines)
+        elif isinstance(stream, (str, Path)):
+            with open(stream, "w") as file:
+                file.writelines(lines)
+        else:
+            stream.writelines(lines)
+
+
+def get_serializer(name: Union[str, Path]) -> Union[Type[GraiYamlSerializer], Type[GraiJsonLinesSerializer]]:
+    """Selects a serializer by file extension, defaulting to YAML
+
+    Args:
+        name: A file name or path
+
+    Returns:
+        The serializer class for the file
+    """
+    if str(name).endswith(GraiJsonLinesSerializer.extensions):
+        return GraiJsonLinesSerializer
+    return GraiYamlSerializer
@@ -0,0 +1,251 @@
+"""Construction of Grai models from data which has already been validated.
+
+Validating a pydantic model runs every validator of every nested model and tries each member of a `Union` in turn
+until one succeeds. That's wasted work for data the Grai server produced itself e.g. database rows or API responses.
+`construct` instead compiles the model's type annotations into builder functions once per class, resolving each
+`Union` by its `Literal` discriminators and required fields, and populates every nested model the way
+`BaseModel.construct` does.
+
+Data which doesn't match the shape of the model is never trusted blindly, `construct` falls back to regular
+validation whenever a value can't be unambiguously placed.
+"""
+
+import gc
+from functools import lru_cache
+from inspect import isclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+
+from pydantic import BaseModel, Extra
+from pydantic.fields import ModelField
+
+M = TypeVar("M", bound=BaseModel)
+
+NoneType = type(None)
+Builder = Callable[[Any], Any]
+
+
+class UntrustedValue(Exception):
+    """Raised when a value doesn't fit the shape of the model it's being constructed as"""
+
+
+class FieldPlan(NamedTuple):
+    name: str
+    alias: str
+    builder: Optional[Builder]
+    field: ModelField
+
+
+@lru_cache(maxsize=None)
+def literal_fields(model: Type[BaseModel]) -> Tuple[Tuple[str, Tuple, bool], ...]:
+    """The `Literal` fields of a model as (alias, allowed values, required) used to discriminate between models"""
+    return tuple(
+        (field.alias, get_args(field.annotation), field.required)
+        for field in model.__fields__.values()
+        if get_origin(field.annotation) is Literal
+    )
+
+
+@lru_cache(maxsize=None)
+def required_fields(model: Type[BaseModel]) -> Tuple[Tuple[str, bool], ...]:
+    """The required fields of a model as (alias, allows None)"""
+    return tuple((field.alias, field.allow_none) for field in model.__fields__.values() if field.required)
+
+
+def matches(model: Type[BaseModel], values: Dict) -> bool:
+    for alias, allowed, required in literal_fields(model):
+        if alias in values:
+            if values[alias] not in allowed:
+                return False
+        elif required:
+            return False
+
+    for alias, allow_none in required_fields(model):
+        if values.get(alias) is None and not (allow_none and alias in values):
+            return False
+    return True
+
+
+def is_model(annotation: Any) -> bool:
+    return isclass(annotation) and issubclass(annotation, BaseModel)
+
+
+def to_uuid(value: Any) -> UUID:
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+@lru_cache(maxsize=None)
+def compile_builder(annotation: Any) -> Optional[Builder]:
+    """Compiles a function building values of `annotation` without validation, once per annotation.
+
+    None is returned for annotations whose values are used as is e.g. `str` or `Optional[bool]`.
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union:
+        members = [arg for arg in args if arg is not NoneType]
+        models = tuple(arg for arg in members if is_model(arg))
+        others = [arg for arg in members if not is_model(arg)]
+        if not models:
+            if len(others) == 1:
+                return compile_builder(others[0])
+            return to_uuid if others == [UUID] else None
+        elif len(models) == 1 and not others:
+            return compile_builder(models[0])
+
+        other_builder = compile_builder(others[0]) if len(others) == 1 else None
+
+        def build_union(value: Any) -> Any:
+            # Checking for a plain dict first avoids the comparatively slow isinstance checks of pydantic's metaclass
+            if type(value) is dict:
+                return model_builder(choose_model(models, value))(value)
+            elif isinstance(value, models):
+                return value
+            elif isinstance(value, dict):
+                return model_builder(choose_model(models, value))(value)
+            elif len(others) == 1:
+                return value if other_builder is None else other_builder(value)
+            raise UntrustedValue(f"Unable to resolve {value!r} as a {annotation}")
+
+        return build_union
+    elif origin in (list, List):
+        item_builder = compile_builder(args[0]) if args else None
+        if item_builder is None:
+            return list
+        return lambda value: [item_builder(item) for item in value]
+    elif origin in (dict, Dict):
+        item_builder = compile_builder(args[1]) if args else None
+        if item_builder is None:
+            return dict
+        return lambda value: {key: item_builder(item) for key, item in value.items()}
+    elif origin is Literal:
+
+        def build_literal(value: Any) -> Any:
+            if value not in args:
+                raise UntrustedValue(f"{value!r} is not one of {args}")
+            return value
+
+        return build_literal
+    elif is_model(annotation):
+        return model_builder(annotation)
+    elif annotation is UUID:
+        return to_uuid
+
+    return None
+
+
+def choose_model(models: Tuple[Type[BaseModel], ...], values: Dict) -> Type[BaseModel]:
+    """Picks the first member of a union whose discriminators and required fields match, as validation would"""
+    for model in models:
+        if matches(model, values):
+            return model
+    raise UntrustedValue(f"No member of {models} matches {values}")
+
+
+@lru_cache(maxsize=None)
+def model_builder(model: Type[M]) -> Callable[[Any], M]:
+    """Compiles a function building `model` from a dict without validation, once per class"""
+    # Pre root validators rewrite their input so their models can only be built by validating
+    if model.__pre_root_validators__:
+        return lambda values: values if isinstance(values, model) else model.parse_obj(values)
+
+    keep_extra = model.__config__.extra is Extra.allow
+    has_private_attributes = bool(model.__private_attributes__)
+    known = {key for name, field in model.__fields__.items() for key in (name, field.alias)}
+    plans: List[FieldPlan] = []
+
+    def build_model(values: Any) -> M:
+        if type(values) is not dict:
+            if isinstance(values, model):
+                return values
+            elif not isinstance(values, dict):
+                raise UntrustedValue(f"Expected a dict to build a {model.__name__} not {type(values)}")
+
+        # Fields are compiled on first use rather than up front so self referencing models terminate
+        if not plans:
+            plans.extend(
+                FieldPlan(name, field.alias, compile_builder(field.annotation), field)
+                for name, field in model.__fields__.items()
+            )
+
+        fields_values = {}
+        fields_set = set()
+        for name, alias, builder, field in plans:
+            if alias in values:
+                value = values[alias]
+            elif name in values:
+                value = values[name]
+            elif field.required:
+                raise UntrustedValue(f"{model.__name__} is missing the required field `{alias}`")
+            else:
+                fields_values[name] = field.get_default()
+                continue
+
+            fields_values[name] = value if builder is None or value is None else builder(value)
+            fields_set.add(name)
+
+        if keep_extra:
+            fields_values.update({key: value for key, value in values.items() if key not in known})
+
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", fields_values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        if has_private_attributes:
+            instance._init_private_attributes()
+        return instance
+
+    return build_model
+
+
+def construct(model: Type[M], values: Dict) -> M:
+    """Builds a model from trusted data, falling back to validation if the data doesn't fit the model's shape
+
+    Args:
+        model: The pydantic model to build
+        values: Previously validated data e.g. a database row or an API response from the Grai server
+
+    Returns:
+        An instance of `model`
+    """
+    try:
+        return model_builder(model)(values)
+    except (UntrustedValue, ValueError, TypeError, AttributeError):
+        return model.parse_obj(values)
+
+
+def construct_many(model: Type[M], rows: Iterable[Dict]) -> List[M]:
+    """Builds a model from each of many trusted rows
+
+    The garbage collector is paused while building. The new objects contain no reference cycles, but allocating
+    millions of them would otherwise trigger repeated full collections.
+
+    Args:
+        model: The pydantic model to build
+        rows: Previously validated data
+
+    Returns:
+        A list of `model` instances
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return [construct(model, row) for row in rows]
+    finally:
+        if gc_enabled:
+            gc.enable()
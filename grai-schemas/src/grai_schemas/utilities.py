@@ -11,6 +11,7 @@ from typing import (
     Tuple,
     TypeVar,
     Union,
+    get_args,
 )
 
 from multimethod import multimethod
@@ -45,6 +46,7 @@ def unpack_object(obj: Union[Dict, BaseModel]) -> Dict:
 
 
 atomic = Union[int, float, complex, str, bool, uuid.UUID]
+simple_types = frozenset((*get_args(atomic), type(None)))
 
 
 @multimethod
@@ -100,6 +102,27 @@ def merge_missing(a: T, b: None) -> T:
     return a
 
 
+def merge_values(a: Any, b: Any) -> Any:
+    """Merge two values, resolving pairs of atomic or missing values directly rather than dispatching through `merge`
+
+    These are the vast majority of values in a Grai object so skipping dispatch for them avoids most of its overhead.
+    Any other pair of values is merged by `merge` as usual.
+
+    Args:
+        a: The first object to merge
+        b: The second object to merge
+
+    Returns:
+        The merged value
+
+    Raises:
+
+    """
+    if type(a) in simple_types and type(b) in simple_types:
+        return a if b is None else b
+    return merge(a, b)
+
+
 @merge.register
 def merge_dict_item(a: Dict, b: Dict) -> Dict:
     """Merge two dictionaries
@@ -115,7 +138,7 @@ def merge_dict_item(a: Dict, b: Dict) -> Dict:
 
     """
     result = {**a, **b}
-    result.update({key: merge(a[key], b[key]) for key in a.keys() & b.keys()})
+    result.update({key: merge_values(a[key], b[key]) for key in a.keys() & b.keys()})
     return result
 
 
@@ -223,6 +246,61 @@ def merge_models(a: T, b: T) -> T:
     return a_type(**merged)
 
 
+def same_reference(a: Any, b: Any) -> bool:
+    """Whether two ids e.g. an edge's source are known to refer to the same object, by their ids or else their names"""
+    if a is None or b is None:
+        return a is b
+    if a.id is not None and b.id is not None:
+        return a.id == b.id
+    return None not in (a.name, a.namespace) and (a.name, a.namespace) == (b.name, b.namespace)
+
+
+def includes_source(data_sources: List, data_source: Any) -> bool:
+    """Whether a list of data sources, given as ids or source specs, contains `data_source`"""
+    for source in data_sources:
+        if isinstance(source, uuid.UUID):
+            if source == data_source.id:
+                return True
+        elif (source.id is not None and source.id == data_source.id) or source.name == data_source.name:
+            return True
+    return False
+
+
+def has_changed(item: SpecProto, active_item: SpecProto) -> bool:
+    """Whether applying an item would change the corresponding active item
+
+    Items are compared by the content digests of their specs. Digests leave out relationships like an edge's source
+    and destination or an object's data sources, so those are compared as well. A sourced item e.g. a SourcedNodeV1 is
+    compared with only the metadata its data source previously contributed to the active item, and is changed if the
+    active item isn't linked to its data source. Items without content digests are compared for equality.
+
+    Args:
+        item: The new graph item
+        active_item: The current graph item with the same name and namespace
+
+    Returns:
+        True if the item differs from the active item
+
+    Raises:
+
+    """
+    if not (hasattr(item.spec, "content_digest") and hasattr(active_item.spec, "content_digest")):
+        return item != active_item
+
+    data_source = getattr(item.spec, "data_source", None)
+    if data_source is not None and not hasattr(active_item.spec, "data_source"):
+        if item.spec.content_digest() != active_item.spec.content_digest(source=data_source.name):
+            return True
+        return not (
+            same_reference(getattr(item.spec, "source", None), getattr(active_item.spec, "source", None))
+            and same_reference(getattr(item.spec, "destination", None), getattr(active_item.spec, "destination", None))
+            and includes_source(active_item.spec.data_sources, data_source)
+        )
+
+    # A matching digest only rules out content changes, equality also covers the relationships
+    return item.spec.content_digest() != active_item.spec.content_digest() or item != active_item
+
+
 def compute_graph_changes(
     items: List[SpecProto], active_items: List[SpecProto]
 ) -> Tuple[List[SpecProto], List[SpecProto], List[SpecProto]]:
@@ -248,6 +326,6 @@ def compute_graph_changes(
     deleted_from_sources = [active_item_map[k] for k in deleted_source_item_keys]
 
     new_items: List[SpecProto] = [item_map[k] for k in new_item_keys]
-    updated_items = [item_map[k] for k in updated_item_keys if item_map[k] != active_item_map[k]]
+    updated_items = [item_map[k] for k in updated_item_keys if has_changed(item_map[k], active_item_map[k])]
 
     return new_items, updated_items, deleted_from_sources
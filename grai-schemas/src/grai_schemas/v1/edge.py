@@ -1,6 +1,8 @@
-from typing import Callable, Dict, List, Literal, Optional, Type, Union
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Type, Union
 from uuid import UUID
 
+from grai_schemas import trusted
+from grai_schemas.digest import spec_digest
 from grai_schemas.v1.generics import GraiBaseModel, NamedID, UuidID
 from grai_schemas.v1.metadata.edges import GenericEdgeMetadataV1, Metadata
 from grai_schemas.v1.metadata.metadata import EdgeMetadataV1, GraiEdgeMetadataV1
@@ -57,6 +59,16 @@ class BaseSourcedEdgeSpec(GraiBaseModel):
             return GraiEdgeMetadataV1(grai=GenericEdgeMetadataV1(edge_type="Generic"))
         raise ValueError(f"Invalid metadata: {v}. Expected either None, a dict, or a MetadataV1 instance.")
 
+    def content_digest(self) -> str:
+        """A deterministic digest of the edge's content, see `grai_schemas.digest`
+
+        It matches `content_digest(source=...)` of a edge whose metadata from this data source is the same.
+
+        Returns:
+            A hex digest
+        """
+        return spec_digest(self.name, self.namespace, self.display_name, self.is_active, self.metadata)
+
     def __str__(self) -> str:
         return f"Edge[Node({self.source}) -> Node({self.destination})]"
 
@@ -175,6 +187,19 @@ class BaseEdgeSpec(GraiBaseModel):
             return EdgeMetadataV1(grai=GenericEdgeMetadataV1(edge_type="Generic"), sources={})
         raise ValueError(f"Invalid metadata: {v}. Expected either None, a dict, or a MetadataV1 instance.")
 
+    def content_digest(self, source: Optional[str] = None) -> str:
+        """A deterministic digest of the edge's content, see `grai_schemas.digest`
+
+        Args:
+            source: Limit the metadata to that contributed by this data source. The digest is then comparable with the
+                `content_digest` of the corresponding sourced edge.
+
+        Returns:
+            A hex digest
+        """
+        metadata = self.metadata if source is None else self.metadata.sources.get(source)
+        return spec_digest(self.name, self.namespace, self.display_name, self.is_active, metadata)
+
     def __str__(self):
         return f"Edge[Node({self.source}) -> Node({self.destination})]"
 
@@ -223,5 +248,35 @@ class EdgeV1(GraiBaseModel):
         """
         return cls(version="v1", type="Edge", spec=spec_dict)
 
+    @classmethod
+    def from_trusted_spec(cls, spec_dict: Dict) -> "EdgeV1":
+        """Build a EdgeV1 from a spec which has already been validated e.g. one produced by the Grai server
+
+        Args:
+            spec_dict (Dict):
+
+        Returns:
+            A EdgeV1 instance
+
+        Raises:
+
+        """
+        return cls.from_trusted({"version": "v1", "type": "Edge", "spec": spec_dict})
+
+    @classmethod
+    def from_trusted_rows(cls, rows: Iterable[Dict]) -> List["EdgeV1"]:
+        """Build a EdgeV1 from each of many previously validated specs without validating them again
+
+        Args:
+            rows (Iterable[Dict]):
+
+        Returns:
+            A list of EdgeV1 instances
+
+        Raises:
+
+        """
+        return trusted.construct_many(cls, ({"version": "v1", "type": "Edge", "spec": row} for row in rows))
+
     def __hash__(self):
         return hash(self.spec)
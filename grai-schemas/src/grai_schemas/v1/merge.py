@@ -1,15 +1,16 @@
-import copy
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, TypeVar, Union
 
 from grai_schemas.generics import MalformedMetadata, Metadata
-from grai_schemas.utilities import merge
+from grai_schemas.utilities import merge, merge_values
 from grai_schemas.v1.edge import EdgeSpec, EdgeV1, SourcedEdgeSpec, SourcedEdgeV1
 from grai_schemas.v1.generics import Code
 from grai_schemas.v1.metadata.edges import BaseEdgeMetadataV1
 from grai_schemas.v1.metadata.nodes import BaseNodeMetadataV1
 from grai_schemas.v1.node import NodeSpec, NodeV1, SourcedNodeSpec, SourcedNodeV1
+from pydantic import BaseModel
 
 MetadataType = Union[BaseNodeMetadataV1, BaseEdgeMetadataV1]
+M = TypeVar("M", bound=BaseModel)
 
 
 @merge.register
@@ -53,6 +54,74 @@ def merge_tags(a: Optional[list], b: Optional[list]) -> list:
     return list(a_tag.union(b_tag))
 
 
+def merge_model_fields(model: M, other_model: BaseModel, **merged_fields: Any) -> M:
+    """Merge the fields of two models of the same class one level deep without validating the result
+
+    Values are merged with `merge_values` so only nested objects are dispatched through `merge`. Values left unchanged
+    by the merge are shared with the original models rather than copied.
+
+    Args:
+        model: The model to merge into
+        other_model: The model to merge from, it must be of the same class as `model`
+        **merged_fields: Fields whose merged values have already been computed
+
+    Returns:
+        A new instance of the model's class
+    """
+    values = {**model.__dict__, **merged_fields}
+    for key, value in other_model.__dict__.items():
+        if key not in merged_fields:
+            values[key] = merge_values(values[key], value) if key in values else value
+    return type(model).construct(**values)
+
+
+def merge_same_v1_metadata(metadata: MetadataType, other_metadata: MetadataType, attributes_field: str) -> MetadataType:
+    """Merge two grai metadata objects of the same class whose attributes are also of the same class
+
+    The merged values are the same as those of the generic merge, but they're merged without the recursive dispatch
+    and the result is built without validation. That's safe because the merged values already fit the class.
+
+    Args:
+        metadata: The metadata to merge into
+        other_metadata: The metadata to merge from
+        attributes_field: The name of the node or edge attributes field
+
+    Returns:
+        The merged metadata
+    """
+    attributes = merge_model_fields(getattr(metadata, attributes_field), getattr(other_metadata, attributes_field))
+    tags = merge_tags(metadata.tags, other_metadata.tags)
+    return merge_model_fields(metadata, other_metadata, **{attributes_field: attributes, "tags": tags})
+
+
+def is_same_shape(metadata: MetadataType, other_metadata: MetadataType, attributes_field: str) -> bool:
+    return type(metadata) is type(other_metadata) and type(getattr(metadata, attributes_field)) is type(
+        getattr(other_metadata, attributes_field)
+    )
+
+
+def replace_metadata(spec: M, grai: MetadataType, sources: Dict) -> M:
+    """Copy a spec with new grai and sources metadata, sharing every other value with the original spec
+
+    Grai metadata of a different class than the spec's current grai metadata is validated on assignment so it's
+    converted to the appropriate metadata class.
+
+    Args:
+        spec: The node or edge spec to copy
+        grai: The new grai metadata
+        sources: The new sources metadata
+
+    Returns:
+        The updated copy of the spec
+    """
+    metadata = spec.metadata.copy(update={"sources": sources})
+    if type(grai) is type(spec.metadata.grai):
+        metadata = metadata.copy(update={"grai": grai})
+    else:
+        metadata.grai = grai
+    return spec.copy(update={"metadata": metadata})
+
+
 @merge.register
 def merge_grai_node_v1_metadata(metadata: BaseNodeMetadataV1, other_metadata: BaseNodeMetadataV1) -> BaseNodeMetadataV1:
     """Merge two grai node metadata objects
@@ -64,6 +133,9 @@ def merge_grai_node_v1_metadata(metadata: BaseNodeMetadataV1, other_metadata: Ba
     Returns:
         The merged node metadata
     """
+    if is_same_shape(metadata, other_metadata, "node_attributes"):
+        return merge_same_v1_metadata(metadata, other_metadata, "node_attributes")
+
     new_metadata = merge(dict(metadata), dict(other_metadata))
     new_metadata["tags"] = merge_tags(metadata.tags, other_metadata.tags)
     return BaseNodeMetadataV1(**new_metadata)
@@ -80,6 +152,9 @@ def merge_grai_edge_v1_metadata(metadata: BaseEdgeMetadataV1, other_metadata: Ba
     Returns:
         The merged edge metadata
     """
+    if is_same_shape(metadata, other_metadata, "edge_attributes"):
+        return merge_same_v1_metadata(metadata, other_metadata, "edge_attributes")
+
     new_metadata = merge(dict(metadata), dict(other_metadata))
     new_metadata["tags"] = merge_tags(metadata.tags, other_metadata.tags)
     return BaseEdgeMetadataV1(**new_metadata)
@@ -97,9 +172,7 @@ def merge_node_sourced_node(node: NodeV1, source_node: SourcedNodeV1) -> NodeV1:
         The merged NodeV1
 
     """
-    new_node = node.copy()
-    new_node.spec = merge(node.spec, source_node.spec)
-    return new_node
+    return node.copy(update={"spec": merge(node.spec, source_node.spec)})
 
 
 @merge.register
@@ -114,9 +187,7 @@ def merge_edge_sourced_edge(edge: EdgeV1, source_edge: SourcedEdgeV1) -> EdgeV1:
         The merged EdgeV1
 
     """
-    new_edge = edge.copy()
-    new_edge.spec = merge(edge.spec, source_edge.spec)
-    return new_edge
+    return edge.copy(update={"spec": merge(edge.spec, source_edge.spec)})
 
 
 @merge.register
@@ -131,10 +202,9 @@ def merge_grai_node_into_node_metadata(spec: NodeSpec, source_spec: SourcedNodeS
         The merged node spec
 
     """
-    new_spec = copy.deepcopy(spec)
-    new_spec.metadata.grai = merge(new_spec.metadata.grai, source_spec.metadata.grai)
-    new_spec.metadata.sources[source_spec.data_source.name] = source_spec.metadata
-    return new_spec
+    grai = merge(spec.metadata.grai, source_spec.metadata.grai)
+    sources = {**spec.metadata.sources, source_spec.data_source.name: source_spec.metadata}
+    return replace_metadata(spec, grai, sources)
 
 
 @merge.register
@@ -148,10 +218,9 @@ def merge_grai_edge_into_edge_metadata(spec: EdgeSpec, source_spec: SourcedEdgeS
     Returns:
         The merged edge spec
     """
-    new_spec = copy.deepcopy(spec)
-    new_spec.metadata.grai = merge(new_spec.metadata.grai, source_spec.metadata.grai)
-    new_spec.metadata.sources[source_spec.data_source.name] = source_spec.metadata
-    return new_spec
+    grai = merge(spec.metadata.grai, source_spec.metadata.grai)
+    sources = {**spec.metadata.sources, source_spec.data_source.name: source_spec.metadata}
+    return replace_metadata(spec, grai, sources)
 
 
 @merge.register
@@ -1,6 +1,8 @@
-from typing import Dict, List, Literal, Optional, Union
+from typing import Dict, Iterable, List, Literal, Optional, Union
 from uuid import UUID
 
+from grai_schemas import trusted
+from grai_schemas.digest import spec_digest
 from grai_schemas.generics import GraiBaseModel
 from grai_schemas.v1.generics import ID, BaseID, NamedID, UuidID
 from grai_schemas.v1.metadata.metadata import (
@@ -56,6 +58,16 @@ class BaseSourcedNodeSpec(GraiBaseModel):
             return GraiNodeMetadataV1(grai=GenericNodeMetadataV1(node_type="Generic"))
         raise ValueError(f"Invalid metadata: {v}. Expected either None, a dict, or a MetadataV1 instance.")
 
+    def content_digest(self) -> str:
+        """A deterministic digest of the node's content, see `grai_schemas.digest`
+
+        It matches `content_digest(source=...)` of a node whose metadata from this data source is the same.
+
+        Returns:
+            A hex digest
+        """
+        return spec_digest(self.name, self.namespace, self.display_name, self.is_active, self.metadata)
+
 
 class NamedSourceSpec(NodeNamedID, BaseSourcedNodeSpec):
     """Class definition of NamedSourceSpec"""
@@ -164,6 +176,19 @@ class BaseNodeSpec(GraiBaseModel):
             return NodeMetadataV1(grai=GenericNodeMetadataV1(node_type="Generic"), sources={})
         raise ValueError(f"Invalid metadata: {v}. Expected either None, a dict, or a MetadataV1 instance.")
 
+    def content_digest(self, source: Optional[str] = None) -> str:
+        """A deterministic digest of the node's content, see `grai_schemas.digest`
+
+        Args:
+            source: Limit the metadata to that contributed by this data source. The digest is then comparable with the
+                `content_digest` of the corresponding sourced node.
+
+        Returns:
+            A hex digest
+        """
+        metadata = self.metadata if source is None else self.metadata.sources.get(source)
+        return spec_digest(self.name, self.namespace, self.display_name, self.is_active, metadata)
+
 
 class NamedSpec(NodeNamedID, BaseNodeSpec):
     """ """
@@ -208,6 +233,36 @@ class NodeV1(GraiBaseModel):
         """
         return cls(version="v1", type="Node", spec=spec_dict)
 
+    @classmethod
+    def from_trusted_spec(cls, spec_dict: Dict) -> "NodeV1":
+        """Build a NodeV1 from a spec which has already been validated e.g. one produced by the Grai server
+
+        Args:
+            spec_dict (Dict):
+
+        Returns:
+            A NodeV1 instance
+
+        Raises:
+
+        """
+        return cls.from_trusted({"version": "v1", "type": "Node", "spec": spec_dict})
+
+    @classmethod
+    def from_trusted_rows(cls, rows: Iterable[Dict]) -> List["NodeV1"]:
+        """Build a NodeV1 from each of many previously validated specs without validating them again
+
+        Args:
+            rows (Iterable[Dict]):
+
+        Returns:
+            A list of NodeV1 instances
+
+        Raises:
+
+        """
+        return trusted.construct_many(cls, ({"version": "v1", "type": "Node", "spec": row} for row in rows))
+
     def __hash__(self):
         return hash(self.spec)
 
@@ -1,6 +1,7 @@
-from typing import List, Literal, Optional, Union
+from typing import Dict, Iterable, List, Literal, Optional, Union
 from uuid import UUID
 
+from grai_schemas import trusted
 from grai_schemas.generics import GraiBaseModel
 from grai_schemas.v1.workspace import WorkspaceSpec
 from pydantic import validator
@@ -81,5 +82,35 @@ class SourceV1(GraiBaseModel):
         """
         return cls(version="v1", type="Source", spec=spec)
 
+    @classmethod
+    def from_trusted_spec(cls, spec_dict: Dict) -> "SourceV1":
+        """Build a SourceV1 from a spec which has already been validated e.g. one produced by the Grai server
+
+        Args:
+            spec_dict (Dict):
+
+        Returns:
+            A SourceV1 instance
+
+        Raises:
+
+        """
+        return cls.from_trusted({"version": "v1", "type": "Source", "spec": spec_dict})
+
+    @classmethod
+    def from_trusted_rows(cls, rows: Iterable[Dict]) -> List["SourceV1"]:
+        """Build a SourceV1 from each of many previously validated specs without validating them again
+
+        Args:
+            rows (Iterable[Dict]):
+
+        Returns:
+            A list of SourceV1 instances
+
+        Raises:
+
+        """
+        return trusted.construct_many(cls, ({"version": "v1", "type": "Source", "spec": row} for row in rows))
+
 
 __all__ = ["SourceSpec", "SourceV1", "DataSourceMixin", "DataSourcesMixin"]
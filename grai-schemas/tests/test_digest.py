@@ -0,0 +1,121 @@
+import json
+import uuid
+
+import pytest
+from grai_schemas.digest import canonical_json, content_digest, spec_digest
+from grai_schemas.serializers import dump_json
+from grai_schemas.utilities import compute_graph_changes, has_changed
+from grai_schemas.v1.edge import EdgeV1
+from grai_schemas.v1.mock import MockV1
+from grai_schemas.v1.node import NodeNamedID, NodeV1
+
+mock = MockV1()
+
+
+def named_endpoints() -> dict:
+    return {
+        "source": NodeNamedID(name="a-source-node", namespace="default"),
+        "destination": NodeNamedID(name="a-destination-node", namespace="default"),
+    }
+
+
+def test_canonical_json_sorts_keys_and_drops_missing_values():
+    assert canonical_json({"b": 1, "a": None, "c": {"e": [1, 2], "d": "x"}}) == '{"b":1,"c":{"d":"x","e":[1,2]}}'
+
+
+def test_content_digest_ignores_tag_order_and_duplicates():
+    assert content_digest({"tags": ["b", "a", "b"]}) == content_digest({"tags": ["a", "b"]})
+    assert content_digest({"values": ["b", "a"]}) != content_digest({"values": ["a", "b"]})
+
+
+def test_content_digest_of_uuids_matches_their_json():
+    value = uuid.uuid4()
+    assert content_digest({"id": value}) == content_digest({"id": str(value)})
+
+
+@pytest.mark.parametrize("make_item,model", [(mock.node.node, NodeV1), (mock.edge.edge, EdgeV1)])
+def test_spec_digest_matches_after_json_round_trip(make_item, model):
+    for _ in range(10):
+        item = make_item()
+        values = json.loads(dump_json(item.spec))
+        assert model.from_spec(values).spec.content_digest() == item.spec.content_digest()
+
+        row_digest = spec_digest(
+            values["name"], values["namespace"], values.get("display_name"), values["is_active"], values["metadata"]
+        )
+        assert row_digest == item.spec.content_digest()
+
+
+def test_spec_digest_changes_with_metadata():
+    node = mock.node.node()
+    updated = node.copy(deep=True)
+    updated.spec.metadata.grai.tags = [*(node.spec.metadata.grai.tags or []), "a-new-tag"]
+    assert updated.spec.content_digest() != node.spec.content_digest()
+
+
+@pytest.mark.parametrize("make_item", [mock.node.sourced_node, mock.edge.sourced_edge])
+def test_sourced_spec_digest_matches_source_metadata(make_item):
+    item = make_item()
+    converted = item.to_node() if item.type == "SourceNode" else item.to_edge()
+
+    assert item.spec.content_digest() == converted.spec.content_digest(source=item.spec.data_source.name)
+    assert item.spec.content_digest() != converted.spec.content_digest(source="another-source")
+
+
+def test_compute_graph_changes_skips_unchanged_sourced_items():
+    unchanged, changed = mock.node.sourced_node(), mock.node.sourced_node()
+    active_items = [unchanged.to_node(), changed.to_node()]
+    changed = changed.copy(deep=True)
+    changed.spec.metadata.grai.tags = ["a-new-tag"]
+
+    new_items, updated_items, deleted_items = compute_graph_changes([unchanged, changed], active_items)
+    assert new_items == []
+    assert deleted_items == []
+    assert updated_items == [changed]
+
+
+def test_compute_graph_changes_detects_changed_edge_endpoints():
+    edge = mock.edge.edge(spec=mock.edge.named_edge_spec(**named_endpoints()))
+    moved = edge.copy(deep=True)
+    moved.spec.destination = moved.spec.destination.copy(update={"name": "a-renamed-node"})
+
+    assert moved.spec.content_digest() == edge.spec.content_digest()
+    assert has_changed(moved, edge)
+    assert compute_graph_changes([moved], [edge])[1] == [moved]
+
+
+def test_has_changed_detects_changed_sourced_edge_endpoints():
+    sourced_edge = mock.edge.sourced_edge(spec=mock.edge.named_source_edge_spec(**named_endpoints()))
+    edge = sourced_edge.to_edge()
+    moved_source = sourced_edge.copy(deep=True)
+    moved_source.spec.source = moved_source.spec.source.copy(update={"name": "a-renamed-node"})
+    moved_destination = sourced_edge.copy(deep=True)
+    moved_destination.spec.destination = moved_destination.spec.destination.copy(update={"name": "a-renamed-node"})
+
+    assert not has_changed(sourced_edge, edge)
+    assert has_changed(moved_source, edge)
+    assert has_changed(moved_destination, edge)
+
+
+def test_has_changed_detects_endpoints_with_unknown_names():
+    sourced_edge = mock.edge.sourced_edge(spec=mock.edge.named_source_edge_spec(**named_endpoints()))
+    edge = sourced_edge.to_edge()
+    edge.spec.destination = edge.spec.destination.copy(update={"id": uuid.uuid4(), "name": None})
+
+    assert has_changed(sourced_edge, edge)
+
+
+def test_has_changed_detects_new_data_sources():
+    node = mock.node.node()
+    linked = node.copy(deep=True)
+    linked.spec.data_sources = [*node.spec.data_sources, mock.source.source_spec()]
+
+    assert has_changed(linked, node)
+
+
+def test_has_changed_detects_unlinked_data_source():
+    sourced_node = mock.node.sourced_node()
+    node = sourced_node.to_node()
+    node.spec.data_sources = []
+
+    assert has_changed(sourced_node, node)
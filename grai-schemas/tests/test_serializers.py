@@ -1,7 +1,16 @@
+import io
 import tempfile
 from pathlib import Path
 
-from grai_schemas.serializers import GraiYamlSerializer, dump_json, load_json
+import pytest
+import yaml
+from grai_schemas.serializers import (
+    GraiJsonLinesSerializer,
+    GraiYamlSerializer,
+    dump_json,
+    get_serializer,
+    load_json,
+)
 
 
 class TestGraiYamlSerializer:
@@ -66,3 +75,42 @@ class TestGraiYamlSerializer:
         data = [{"a": 1}, {"b": 2, "a": 3}]
         result = self.encoder.load(self.encoder.dump(data))
         assert result == data
+
+    def test_load_all_is_lazy(self):
+        stream = io.StringIO("a: 1\n---\nb: [\n")
+        documents = self.encoder.load_all(stream)
+        assert next(documents) == {"a": 1}
+        with pytest.raises(yaml.YAMLError):
+            next(documents)
+
+
+class TestGraiJsonLinesSerializer:
+    """ """
+
+    encoder = GraiJsonLinesSerializer()
+
+    def test_dump(self):
+        assert self.encoder.dump({"a": 1}) == '{"a": 1}\n'
+
+    def test_dump_sequence(self):
+        assert self.encoder.dump([{"a": 1}, {"b": 2}]) == '{"a": 1}\n{"b": 2}\n'
+
+    def test_load_from_path(self, tmp_path):
+        path = tmp_path / "objects.jsonl"
+        self.encoder.dump([{"a": 1}, {"b": 2}], path)
+        assert self.encoder.load(path) == [{"a": 1}, {"b": 2}]
+
+    def test_load_skips_blank_lines(self):
+        assert self.encoder.load('{"a": 1}\n\n{"b": 2}\n') == [{"a": 1}, {"b": 2}]
+
+    def test_load_all_is_lazy(self):
+        documents = self.encoder.load_all(io.StringIO('{"a": 1}\n{"b": \n'))
+        assert next(documents) == {"a": 1}
+        with pytest.raises(ValueError):
+            next(documents)
+
+
+def test_get_serializer():
+    assert get_serializer("objects.jsonl") is GraiJsonLinesSerializer
+    assert get_serializer(Path("objects.ndjson")) is GraiJsonLinesSerializer
+    assert get_serializer("objects.yaml") is GraiYamlSerializer
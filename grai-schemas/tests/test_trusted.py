@@ -0,0 +1,76 @@
+import json
+import uuid
+
+import pytest
+from grai_schemas.serializers import dump_json
+from grai_schemas.v1.edge import EdgeV1
+from grai_schemas.v1.mock import MockV1
+from grai_schemas.v1.node import NodeV1
+from grai_schemas.v1.source import SourceV1
+
+mock = MockV1()
+
+
+def as_json_spec(item) -> dict:
+    """The spec as it would be returned by the server's API"""
+    return json.loads(dump_json(item.spec))
+
+
+@pytest.mark.parametrize("make_node", [mock.node.node, lambda: mock.node.node(spec=mock.node.id_node_spec())])
+def test_trusted_node_matches_validated(make_node):
+    for _ in range(10):
+        spec = as_json_spec(make_node())
+        assert NodeV1.from_trusted_spec(spec) == NodeV1.from_spec(json.loads(json.dumps(spec)))
+
+
+@pytest.mark.parametrize("make_edge", [mock.edge.edge, lambda: mock.edge.edge(spec=mock.edge.id_edge_spec())])
+def test_trusted_edge_matches_validated(make_edge):
+    for _ in range(10):
+        spec = as_json_spec(make_edge())
+        assert EdgeV1.from_trusted_spec(spec) == EdgeV1.from_spec(json.loads(json.dumps(spec)))
+
+
+def test_trusted_source_matches_validated():
+    spec = {"id": str(uuid.uuid4()), "name": "source", "workspace": str(uuid.uuid4())}
+    assert SourceV1.from_trusted_spec(spec) == SourceV1.from_spec(spec)
+
+
+def test_trusted_rows():
+    nodes = [mock.node.node() for _ in range(5)]
+    assert NodeV1.from_trusted_rows(as_json_spec(node) for node in nodes) == nodes
+
+
+def test_trusted_resolves_union_members():
+    spec = {
+        "id": str(uuid.uuid4()),
+        "name": "column",
+        "namespace": "default",
+        "data_sources": [str(uuid.uuid4())],
+        "metadata": {
+            "grai": {"node_type": "Column", "node_attributes": {"data_type": "int"}},
+            "sources": {},
+        },
+    }
+    node = NodeV1.from_trusted_spec(spec)
+    assert type(node.spec).__name__ == "IDSpec"
+    assert type(node.spec.metadata.grai).__name__ == "ColumnMetadata"
+    assert isinstance(node.spec.id, uuid.UUID)
+    assert isinstance(node.spec.data_sources[0], uuid.UUID)
+
+
+def test_incomplete_data_falls_back_to_validation():
+    spec = {"name": "node", "namespace": "default", "data_sources": []}
+    node = NodeV1.from_trusted_spec(spec)
+    assert node == NodeV1.from_spec({"name": "node", "namespace": "default", "data_sources": []})
+    assert node.spec.metadata.grai.node_type == "Generic"
+
+
+def test_invalid_data_raises():
+    with pytest.raises(ValueError):
+        NodeV1.from_trusted_spec({"name": "node", "namespace": "default"})
+
+
+def test_extra_metadata_is_kept():
+    spec = as_json_spec(mock.node.node())
+    spec["metadata"]["custom"] = {"a": 1}
+    assert NodeV1.from_trusted_spec(spec).spec.metadata.custom == {"a": 1}
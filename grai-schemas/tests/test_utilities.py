@@ -1,7 +1,7 @@
 from copy import deepcopy
 
 import pytest
-from grai_schemas.utilities import merge
+from grai_schemas.utilities import merge, merge_values
 from grai_schemas.v1 import EdgeV1, NodeV1, SourcedEdgeV1, SourcedNodeV1
 from grai_schemas.v1.metadata.edges import BaseEdgeMetadataV1
 from grai_schemas.v1.metadata.metadata import (
@@ -11,7 +11,7 @@ from grai_schemas.v1.metadata.metadata import (
     MetadataV1,
     NodeMetadataV1,
 )
-from grai_schemas.v1.metadata.nodes import BaseNodeMetadataV1
+from grai_schemas.v1.metadata.nodes import BaseNodeMetadataV1, ColumnMetadata
 from pydantic import BaseModel
 
 
@@ -224,3 +224,36 @@ class TestMerge:
         expected_metadata.grai = merge(expected_metadata.grai, b.spec.metadata.grai)
 
         assert merge(a, b) == EdgeV1.from_spec({**a.spec.dict(), "metadata": expected_metadata})
+
+    @pytest.mark.parametrize(
+        "a,b,expected", [(1, 2, 2), ("a", None, "a"), (None, "b", "b"), (None, None, None), (True, 1.5, 1.5)]
+    )
+    def test_merge_values_of_atomic_types(self, a, b, expected):
+        assert merge_values(a, b) == expected
+        assert merge_values(a, b) == merge(a, b)
+
+    def test_merge_values_dispatches_other_types(self):
+        assert merge_values([1], [2]) == [1, 2]
+        assert merge_values({"a": 1}, None) == {"a": 1}
+
+    def test_merge_same_class_node_metadata(self):
+        a = ColumnMetadata(node_type="Column", node_attributes={"data_type": "int", "is_nullable": True}, tags=["1"])
+        b = ColumnMetadata(node_type="Column", node_attributes={"data_type": "str", "extra": "x"}, tags=["2"])
+
+        c = merge(a, b)
+        assert type(c) is ColumnMetadata
+        assert type(c.node_attributes) is type(a.node_attributes)
+        assert c.node_attributes.dict() == {**a.node_attributes.dict(), "data_type": "str", "extra": "x"}
+        assert set(c.tags) == {"1", "2"}
+
+    def test_merge_source_into_node_leaves_inputs_unchanged(self, mock_v1):
+        a = mock_v1.node.node()
+        b = mock_v1.node.sourced_node()
+        b.spec.metadata.grai = a.spec.metadata.grai.copy(update={"tags": ["new"]})
+        a_values, b_values = a.dict(), b.dict()
+
+        merged = merge(a, b)
+        assert a.dict() == a_values
+        assert b.dict() == b_values
+        assert merged.spec.metadata.sources[b.spec.data_source.name] == b.spec.metadata
+        assert "new" in merged.spec.metadata.grai.tags
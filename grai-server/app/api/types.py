@@ -38,6 +38,7 @@ from lineage.models import Event as EventModel
 from lineage.models import Filter as FilterModel
 from lineage.models import Node as NodeModel
 from lineage.models import Source as SourceModel
+from lineage.models import TableLineage as TableLineageModel
 from lineage.types import EdgeFilter, EdgeOrder, Filter, NodeFilter, NodeOrder
 from search.search import SearchClient
 from users.types import User, UserFilter
@@ -377,126 +378,24 @@ class Table(Node):
         return DataWrapper[Column](list(set([edge.destination for edge in self.edges_list])))
 
     @strawberry.django.field(
-        prefetch_related=(
-            Prefetch(
-                "source_edges",
-                queryset=EdgeModel.objects.exclude(metadata__grai__edge_type="TableToColumn").select_related(
-                    "destination"
-                ),
-                to_attr="sources_list",
-            ),
-            Prefetch(
-                "source_edges",
-                queryset=EdgeModel.objects.filter(metadata__grai__edge_type="TableToColumn")
-                .select_related("destination")
-                .prefetch_related(
-                    Prefetch(
-                        "destination__source_edges",
-                        queryset=EdgeModel.objects.exclude(metadata__grai__edge_type="TableToColumn")
-                        .select_related("destination")
-                        .prefetch_related(
-                            Prefetch(
-                                "destination__destination_edges",
-                                queryset=EdgeModel.objects.filter(
-                                    metadata__grai__edge_type="TableToColumn"
-                                ).select_related("source"),
-                                to_attr="tables",
-                            )
-                        ),
-                        to_attr="sources_list",
-                    ),
-                    Prefetch(
-                        "destination__destination_edges",
-                        queryset=EdgeModel.objects.exclude(metadata__grai__edge_type="TableToColumn")
-                        .select_related("source")
-                        .prefetch_related(
-                            Prefetch(
-                                "source__destination_edges",
-                                queryset=EdgeModel.objects.filter(
-                                    metadata__grai__edge_type="TableToColumn"
-                                ).select_related("source"),
-                                to_attr="tables",
-                            )
-                        ),
-                        to_attr="destination_list",
-                    ),
-                ),
-                to_attr="columns",
-            ),
+        prefetch_related=Prefetch(
+            "downstream_lineage",
+            queryset=TableLineageModel.objects.select_related("destination"),
+            to_attr="downstream_list",
         )
     )
     def source_tables(self) -> DataWrapper["Table"]:
-        tables = []
-
-        for source in self.sources_list:
-            tables.append(source.destination)
-
-        for column in self.columns:
-            for source in column.destination.sources_list:
-                for table in source.destination.tables:
-                    tables.append(table.source)
-
-        return DataWrapper["Table"](list(set(tables)))
+        return DataWrapper["Table"]([lineage.destination for lineage in self.downstream_list])
 
     @strawberry.django.field(
-        prefetch_related=(
-            Prefetch(
-                "destination_edges",
-                queryset=EdgeModel.objects.exclude(metadata__grai__edge_type="TableToColumn").select_related("source"),
-                to_attr="destinations_list",
-            ),
-            Prefetch(
-                "source_edges",
-                queryset=EdgeModel.objects.filter(metadata__grai__edge_type="TableToColumn")
-                .select_related("destination")
-                .prefetch_related(
-                    Prefetch(
-                        "destination__source_edges",
-                        queryset=EdgeModel.objects.exclude(metadata__grai__edge_type="TableToColumn")
-                        .select_related("destination")
-                        .prefetch_related(
-                            Prefetch(
-                                "destination__destination_edges",
-                                queryset=EdgeModel.objects.filter(
-                                    metadata__grai__edge_type="TableToColumn"
-                                ).select_related("source"),
-                                to_attr="tables",
-                            )
-                        ),
-                        to_attr="sources_list",
-                    ),
-                    Prefetch(
-                        "destination__destination_edges",
-                        queryset=EdgeModel.objects.exclude(metadata__grai__edge_type="TableToColumn")
-                        .select_related("source")
-                        .prefetch_related(
-                            Prefetch(
-                                "source__destination_edges",
-                                queryset=EdgeModel.objects.filter(
-                                    metadata__grai__edge_type="TableToColumn"
-                                ).select_related("source"),
-                                to_attr="tables",
-                            )
-                        ),
-                        to_attr="destination_list",
-                    ),
-                ),
-                to_attr="columns2",
-            ),
+        prefetch_related=Prefetch(
+            "upstream_lineage",
+            queryset=TableLineageModel.objects.select_related("source"),
+            to_attr="upstream_list",
         )
     )
     def destination_tables(self) -> DataWrapper["Table"]:
-        tables = []
-
-        for destination in self.destinations_list:
-            tables.append(destination.source)
-
-        for column in self.columns2:
-            for destination in column.destination.destination_list:
-                for table in destination.source.tables:
-                    tables.append(table.source)
-
-        return DataWrapper["Table"](list(set(tables)))
+        return DataWrapper["Table"]([lineage.source for lineage in self.upstream_list])
 
 
 @strawberry.django.type(SourceModel)
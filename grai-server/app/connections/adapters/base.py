@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from functools import cached_property
-from itertools import chain
-from typing import List, Tuple
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Tuple, TypeVar
 
 import sentry_sdk
 from django.db.models import Max
@@ -16,6 +16,17 @@ from lineage.models import Edge, Event, Node
 from .tools import TestResultCacheBase
 
 
+EVENT_BATCH_SIZE = 1000
+
+T = TypeVar("T")
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 class QuarantinedItemException(Exception):
     pass
 
@@ -93,29 +104,58 @@ class BaseAdapter(ABC):
 
         events = self.events(last_event_date)
 
-        existing_event_references = self.run.connection.events.values_list("reference", flat=True)
-
-        for event in events:
-            if str(event.reference) not in existing_event_references:
-                event_model = self.run.connection.events.create(
+        seen_references = set(self.run.connection.events.values_list("reference", flat=True))
+
+        for batch in batched(events, EVENT_BATCH_SIZE):
+            new_events = []
+            for event in batch:
+                reference = str(event.reference)
+                if reference not in seen_references:
+                    seen_references.add(reference)
+                    new_events.append(event)
+
+            if new_events:
+                self.create_events(new_events)
+
+    def create_events(self, events: list):
+        """Creates a batch of events and their node links with one query to resolve every referenced node."""
+        event_models = Event.objects.bulk_create(
+            [
+                Event(
+                    connection=self.run.connection,
                     workspace=self.run.workspace,
                     reference=event.reference,
                     date=event.date,
                     status=event.status,
                     metadata=event.metadata,
                 )
-
-                if event.nodes:
-                    nodes = Node.objects.filter(
-                        workspace=self.run.workspace,
-                        namespace=self.run.connection.namespace,
-                        name__in=event.nodes,
-                    )
-
-                    if len(nodes) != len(event.nodes):
-                        print("Some nodes not found")
-
-                    event_model.nodes.add(*nodes)
+                for event in events
+            ]
+        )
+
+        node_names = {name for event in events if event.nodes for name in event.nodes}
+        if not node_names:
+            return
+
+        node_ids = dict(
+            Node.objects.filter(
+                workspace=self.run.workspace,
+                namespace=self.run.connection.namespace,
+                name__in=node_names,
+            ).values_list("name", "id")
+        )
+
+        if len(node_ids) != len(node_names):
+            print("Some nodes not found")
+
+        EventNode = Event.nodes.through
+        links = [
+            EventNode(event_id=event_model.id, node_id=node_ids[name])
+            for event, event_model in zip(events, event_models)
+            for name in set(event.nodes or [])
+            if name in node_ids
+        ]
+        EventNode.objects.bulk_create(links, batch_size=EVENT_BATCH_SIZE, ignore_conflicts=True)
 
 
 class IntegrationAdapter(BaseAdapter):
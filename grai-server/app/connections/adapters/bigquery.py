@@ -1,5 +1,8 @@
 from grai_schemas.v1.source import SourceV1
 from grai_source_bigquery.base import BigQueryIntegration
+from grai_source_bigquery.loader import LoggingConnector
+
+from connections.models import Connection
 
 from .base import IntegrationAdapter
 
@@ -21,5 +24,16 @@ class BigqueryAdapter(IntegrationAdapter):
             credentials=secrets.get("credentials"),
             log_parsing=metadata.get("log_parsing", False),
             log_parsing_window=int(metadata.get("log_parsing_window", 7)),
+            region=metadata.get("region"),
+            log_state=(self.run.connection.state or {}).get("bigquery_logs"),
         )
         return integration
+
+    def run_update(self):
+        super().run_update()
+
+        connector = self.integration.integration.connector
+        if isinstance(connector, LoggingConnector):
+            state = {**(self.run.connection.state or {}), "bigquery_logs": connector.log_state}
+            # Avoids Connection.save which would also reschedule the connection
+            Connection.objects.filter(id=self.run.connection.id).update(state=state)
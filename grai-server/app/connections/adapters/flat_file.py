@@ -3,6 +3,7 @@ import os.path
 
 from grai_schemas.v1.source import SourceV1
 from grai_source_flat_file.base import FlatFileIntegration
+from grai_source_flat_file.loader import DEFAULT_SAMPLE_ROWS
 
 from .base import IntegrationAdapter
 
@@ -10,6 +11,7 @@ from .base import IntegrationAdapter
 class FlatFileAdapter(IntegrationAdapter):
     def get_integration(self) -> FlatFileIntegration:
         namespace = self.run.connection.namespace
+        metadata = self.run.connection.metadata
         run_file = self.run.files.first().file
         table_name, extension = os.path.splitext(run_file.name)
 
@@ -27,5 +29,6 @@ class FlatFileAdapter(IntegrationAdapter):
             file_location=run_file.name,
             source=source,
             namespace=namespace,
+            sample_rows=int(metadata.get("sample_rows") or DEFAULT_SAMPLE_ROWS),
         )
         return integration
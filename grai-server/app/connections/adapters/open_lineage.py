@@ -3,7 +3,9 @@ import json
 from grai_schemas.v1.source import SourceV1
 from grai_source_openlineage.base import OpenLineageIntegration
 
-from .base import IntegrationAdapter
+from connections.task_helpers import incremental_update
+
+from .base import IntegrationAdapter, capture_quarantined_errors
 
 
 class OpenLineageAdapter(IntegrationAdapter):
@@ -24,3 +26,11 @@ class OpenLineageAdapter(IntegrationAdapter):
             namespaces=json.loads(metadata["namespaces"]) if metadata.get("namespaces") else None,
         )
         return integration
+
+    def run_update(self):
+        # Each batch of events only describes the datasets it touched, so lineage is added rather than diffed
+        nodes, edges = self.integration.get_nodes_and_edges()
+        capture_quarantined_errors(self.integration, self.run)
+
+        incremental_update(self.run.workspace, self.run.source, nodes)
+        incremental_update(self.run.workspace, self.run.source, edges)
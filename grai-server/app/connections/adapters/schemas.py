@@ -85,6 +85,7 @@ def node_v1_spec_to_model(node: NodeSpec, workspace: Workspace) -> Node:
 
     result = Node(**values)
     result.set_names()
+    result.set_content_digest()
 
     return result
 
@@ -144,6 +145,7 @@ def edge_v1_spec_to_model(edge: EdgeSpec, workspace: Workspace) -> Edge:
 
     result = Edge(**values)
     result.set_names()
+    result.set_content_digest()
 
     return result
 
@@ -195,7 +197,7 @@ def model_to_schema(item, schema_type):
 
 @model_to_schema.register
 def source_model_to_source_schema(model: Source, schema_type: Literal["SourceV1"]) -> SourceV1:
-    return SourceV1.from_spec(model.__dict__)
+    return SourceV1.from_trusted_spec(model.__dict__)
 
 
 @model_to_schema.register
@@ -203,7 +205,7 @@ def node_model_to_node_v1_schema(model: Node, schema_type: Literal["NodeV1"]) ->
     # TODO: Add data_sources
 
     data_sources: list[SourceV1] = model_to_schema(model.data_sources.all(), "SourceV1")
-    result = NodeV1.from_spec({**model.__dict__, "data_sources": [source.spec for source in data_sources]})
+    result = NodeV1.from_trusted_spec({**model.__dict__, "data_sources": [source.spec for source in data_sources]})
     return result
 
 
@@ -217,12 +219,11 @@ def node_model_to_sourced_node_v1_schema(
 
 @model_to_schema.register
 def edge_model_to_edge_v1_schema(model: Edge, schema_type: Literal["EdgeV1"]) -> EdgeV1:
-    # TODO: Add data_sources
-    model_dict = {**model.__dict__, "data_sources": []}
+    data_sources: list[SourceV1] = model_to_schema(model.data_sources.all(), "SourceV1")
+    model_dict = {**model.__dict__, "data_sources": [source.spec for source in data_sources]}
     model_dict["source"] = NodeNamedID(**model.source.__dict__)
     model_dict["destination"] = NodeNamedID(**model.destination.__dict__)
-    model_dict["destination"] = {"id": model_dict.pop("destination_id")}
-    return EdgeV1.from_spec(model_dict)
+    return EdgeV1.from_trusted_spec(model_dict)
 
 
 @model_to_schema.register
@@ -1,8 +1,7 @@
-from itertools import tee
-from typing import Sequence
+from typing import Iterator
 
-from grai_schemas.schema import Schema
-from grai_schemas.serializers import GraiYamlSerializer
+from grai_schemas.schema import GraiType, Schema
+from grai_schemas.serializers import get_serializer
 from grai_schemas.v1.edge import SourcedEdgeV1
 from grai_schemas.v1.node import SourcedNodeV1
 
@@ -16,21 +15,27 @@ SUPPORTED_SCHEMA_TYPE_NAMES = {schema.__name__ for schema in SUPPORTED_SCHEMA_TY
 
 
 class YamlFileAdapter(BaseAdapter):
-    @staticmethod
-    def process_content(self, run_file: RunFile):
-        file_content = GraiYamlSerializer.load(run_file.file)
-        if isinstance(file_content, Sequence):
-            for item in file_content:
+    """Loads Grai objects from an uploaded multi-document yaml file or a json lines (`.jsonl`) file.
+
+    Files are parsed one document at a time so only the validated objects, never the raw file contents, are held in
+    memory.
+    """
+
+    def process_content(self, run_file: RunFile) -> Iterator[GraiType]:
+        serializer = get_serializer(run_file.name)
+        with run_file.file.open("rb") as file:
+            for item in serializer.load_all(file):
                 yield Schema(entity=item).entity
-        else:
-            yield Schema(entity=file_content).entity
 
     def get_nodes_and_edges(self):
         run_file = self.run.files.first()
 
-        iter_a, iter_b = tee(self.process_content(self.run, run_file), 2)
-        nodes = [obj for obj in iter_a if isinstance(obj, SourcedNodeV1)]
-        edges = [obj for obj in iter_b if isinstance(obj, SourcedEdgeV1)]
+        nodes, edges = [], []
+        for obj in self.process_content(run_file):
+            if isinstance(obj, SourcedNodeV1):
+                nodes.append(obj)
+            elif isinstance(obj, SourcedEdgeV1):
+                edges.append(obj)
 
         return nodes, edges
 
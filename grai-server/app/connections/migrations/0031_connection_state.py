@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("connections", "0030_alter_connector_options_connector_priority_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="connection",
+            name="state",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
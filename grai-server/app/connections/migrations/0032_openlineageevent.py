@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-19 15:05
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("workspaces", "0009_alter_workspace_ai_enabled"),
+        ("connections", "0031_connection_state"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OpenLineageEvent",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("body", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "connection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="open_lineage_events",
+                        to="connections.connection",
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="open_lineage_events",
+                        to="workspaces.workspace",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["connection", "created_at"], name="openlineage_event_created")],
+            },
+        ),
+    ]
@@ -104,6 +104,8 @@ class Connection(TenantModel):
     metadata = models.JSONField(default=dict)
     secrets = models.JSONField(default=dict, blank=True, null=True)
     schedules = models.JSONField(default=dict, blank=True, null=True)
+    # Bookkeeping carried between runs by incremental integrations
+    state = models.JSONField(default=dict, blank=True)
     task = models.ForeignKey(
         "django_celery_beat.PeriodicTask",
         related_name="connections",
@@ -264,3 +266,28 @@ class RunFile(models.Model):
         self.name = self.file.name
 
         super(RunFile, self).save(*args, **kwargs)
+
+
+class OpenLineageEvent(TenantModel):
+    """An OpenLineage event waiting to be merged into the next batched run of its connection"""
+
+    tenant_id = "workspace_id"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    connection = models.ForeignKey(
+        "Connection",
+        related_name="open_lineage_events",
+        on_delete=models.CASCADE,
+    )
+    workspace = models.ForeignKey(
+        "workspaces.Workspace",
+        related_name="open_lineage_events",
+        on_delete=models.CASCADE,
+    )
+    body = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["connection", "created_at"], name="openlineage_event_created"),
+        ]
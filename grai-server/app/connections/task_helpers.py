@@ -10,6 +10,7 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    Set,
     Tuple,
     TypedDict,
     TypeVar,
@@ -22,7 +23,7 @@ from django.db import models
 from django.db.models import Q, Value
 from django.db.models.functions import Coalesce
 from grai_schemas.schema import GraiType
-from grai_schemas.utilities import merge
+from grai_schemas.utilities import has_changed, merge
 from grai_schemas.v1 import EdgeV1, NodeV1, SourcedEdgeV1, SourcedNodeV1
 from grai_schemas.v1.node import NamedSpec as NodeNamedSpec
 from grai_schemas.v1.node import NodeNamedID
@@ -33,6 +34,7 @@ from pydantic import BaseModel
 from lineage.models import Edge as EdgeModel
 from lineage.models import Node as NodeModel
 from lineage.models import Source
+from lineage.table_lineage import refresh_table_lineage
 from workspaces.models import Workspace
 
 from .adapters.schemas import model_to_schema, schema_to_model
@@ -174,7 +176,16 @@ def get_edge_nodes_from_database(items: List[SourcedEdgeV1], workspace: Workspac
     return node_map
 
 
-def compute_graph_changes(items: List[T], active_items: List[P]) -> Tuple[List[T], List[P], List[P]]:
+def compute_graph_changes(
+    items: List[T], active_items: List[P], linked_ids: Optional[Set[UUID]] = None
+) -> Tuple[List[T], List[P], List[P]]:
+    """Splits items into new items, deactivated items, and merged updates of the active items.
+
+    Active items whose ids are in `linked_ids`, i.e. those already belonging to the items' source, are left out of
+    the updates without merging them when the item's content digest matches the metadata the source contributed last
+    time. Items are only skipped when they're known to be linked so a source re-adding an item always relinks it.
+    Without `linked_ids` every item which isn't equal to its active item is updated.
+    """
     current_item_map: Dict[Tuple[str, str], P] = {(item.spec.name, item.spec.namespace): item for item in active_items}
     item_map: Dict[Tuple[str, str], T] = {(item.spec.name, item.spec.namespace): item for item in items}
 
@@ -182,11 +193,15 @@ def compute_graph_changes(items: List[T], active_items: List[P]) -> Tuple[List[T
     new_item_keys = item_map.keys() - updated_item_keys
     deactivated_item_keys = current_item_map.keys() - updated_item_keys
 
+    def is_updated(key: Tuple[str, str]) -> bool:
+        item, current_item = item_map[key], current_item_map[key]
+        if linked_ids is None:
+            return item != current_item
+        return current_item.spec.id not in linked_ids or has_changed(item, current_item)
+
     new_items = [item_map[k] for k in new_item_keys]
     deactivated_items = [current_item_map[k] for k in deactivated_item_keys]
-    updated_items: List[P] = [
-        merge(current_item_map[k], item_map[k]) for k in updated_item_keys if item_map[k] != current_item_map[k]
-    ]
+    updated_items: List[P] = [merge(current_item_map[k], item_map[k]) for k in updated_item_keys if is_updated(k)]
     return new_items, deactivated_items, updated_items
 
 
@@ -205,12 +220,16 @@ def process_source_nodes(
         active_nodes = existing_nodes
     elif existing_nodes is None:
         query = build_item_query_filter(items, workspace)
-        current_item_generator = chain(NodeModel.objects.filter(query).all(), source.nodes.all())
+        current_item_generator = chain(
+            NodeModel.objects.filter(query).prefetch_related("data_sources"),
+            source.nodes.prefetch_related("data_sources"),
+        )
         active_nodes = [model_to_schema(item, "NodeV1") for item in current_item_generator]
     else:
         raise ValueError("existing_nodes must be a list of NodeV1 or None")
 
-    new_items, deactivated_items, updated_items = compute_graph_changes(items, active_nodes)
+    linked_ids = set(source.nodes.values_list("id", flat=True))
+    new_items, deactivated_items, updated_items = compute_graph_changes(items, active_nodes, linked_ids)
 
     new = [schema_to_model(item, workspace) for item in new_items]
     deactivated = [schema_to_model(item, workspace) for item in deactivated_items]
@@ -234,12 +253,16 @@ def process_source_edges(
         active_edges = existing_edges
     elif existing_edges is None:
         query = build_item_query_filter(items, workspace)
-        current_item_generator = chain(EdgeModel.objects.filter(query).all(), source.edges.all())
+        current_item_generator = chain(
+            EdgeModel.objects.filter(query).select_related("source", "destination").prefetch_related("data_sources"),
+            source.edges.select_related("source", "destination").prefetch_related("data_sources"),
+        )
         active_edges = [model_to_schema(item, "EdgeV1") for item in current_item_generator]
     else:
         raise ValueError("existing_edges must be a list of EdgeV1 or None")
 
-    new_items, deactivated_items, updated_items = compute_graph_changes(items, active_edges)
+    linked_ids = set(source.edges.values_list("id", flat=True))
+    new_items, deactivated_items, updated_items = compute_graph_changes(items, active_edges, linked_ids)
 
     edge_map = get_edge_nodes_from_database(new_items, workspace)
     for item in new_items:
@@ -297,7 +320,7 @@ def update(
     new_items, deactivated_items, updated_items = process_updates(workspace, source, items, active_items)
 
     Model.objects.bulk_create(new_items)
-    Model.objects.bulk_update(updated_items, ["metadata"])
+    Model.objects.bulk_update(updated_items, ["metadata", "content_digest"])
 
     relationship.add(*new_items, *updated_items)
 
@@ -308,8 +331,33 @@ def update(
         deletable_nodes = NodeModel.objects.filter(empty_source_query)
         deleted_edge_query = Q(source__in=deletable_nodes) | Q(destination__in=deletable_nodes) | empty_source_query
 
-        EdgeModel.objects.filter(deleted_edge_query).delete()
+        deleted_edges = EdgeModel.objects.filter(deleted_edge_query)
+        deleted_node_ids = {
+            node_id for pair in deleted_edges.values_list("source_id", "destination_id") for node_id in pair
+        }
+        deleted_edges.delete()
         deletable_nodes.delete()
+        refresh_table_lineage(workspace.id, deleted_node_ids)
+
+
+def incremental_update(workspace: Workspace, source: Source, items: List[T]):
+    """Adds or updates items in a source without deactivating the items of the source which are absent from `items`.
+
+    Only the existing items sharing a name and namespace with `items` are loaded for comparison rather than the whole
+    source, so the cost scales with the size of the update rather than the size of the source.
+    """
+    if not items:
+        return
+
+    if items[0].type in ["Node", "SourceNode"]:
+        Model, schema_type = NodeModel, "NodeV1"
+    else:
+        Model, schema_type = EdgeModel, "EdgeV1"
+
+    query = build_item_query_filter(items, workspace)
+    active_items = [model_to_schema(item, schema_type) for item in Model.objects.filter(query)]
+
+    update(workspace, source, items, active_items)
 
 
 def modelToSchema(model, Schema, type):
@@ -2,6 +2,9 @@ import traceback
 from enum import Enum
 from typing import Type
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 from grai_schemas.integrations.errors import (
     IncorrectPasswordError,
@@ -29,7 +32,7 @@ from connections.adapters.cube import CubeAdapter
 from installations.github import Github
 from notifications.notifications import send_notification
 
-from .models import Connection, Connector, Run, ConnectorSlugs
+from .models import Connection, Connector, Run, ConnectorSlugs, OpenLineageEvent
 import logging
 
 
@@ -52,6 +55,80 @@ def run_connection_schedule(connectionId):
     execute_run(run)
 
 
+OPEN_LINEAGE_LOCK_TIMEOUT = 60 * 15
+
+
+def open_lineage_flush_key(connection_id) -> str:
+    return f"open_lineage:flush:{connection_id}"
+
+
+def open_lineage_lock_key(connection_id) -> str:
+    return f"open_lineage:lock:{connection_id}"
+
+
+def schedule_open_lineage_events(connection_id, pending: int):
+    """Schedules a batched run for a connection's buffered OpenLineage events.
+
+    A full batch is processed immediately, otherwise at most one delayed run is scheduled per connection per window so
+    every event arriving within the window is merged into it.
+    """
+    if pending >= settings.OPEN_LINEAGE_BATCH_SIZE and pending % settings.OPEN_LINEAGE_BATCH_SIZE == 0:
+        process_open_lineage_events.delay(connection_id)
+    elif cache.add(open_lineage_flush_key(connection_id), True, timeout=settings.OPEN_LINEAGE_BATCH_WINDOW):
+        process_open_lineage_events.apply_async((connection_id,), countdown=settings.OPEN_LINEAGE_BATCH_WINDOW)
+
+
+def buffer_open_lineage_event(connection: Connection, body: dict) -> OpenLineageEvent:
+    event = OpenLineageEvent.objects.create(connection=connection, workspace=connection.workspace, body=body)
+    pending = OpenLineageEvent.objects.filter(connection=connection).count()
+    schedule_open_lineage_events(connection.id, pending)
+
+    return event
+
+
+@shared_task
+def process_open_lineage_events(connectionId):
+    # Runs for the same connection are serialised so concurrent batches don't race to create the same nodes
+    lock_key = open_lineage_lock_key(connectionId)
+    if not cache.add(lock_key, True, timeout=OPEN_LINEAGE_LOCK_TIMEOUT):
+        process_open_lineage_events.apply_async((connectionId,), countdown=settings.OPEN_LINEAGE_BATCH_WINDOW)
+        return
+
+    try:
+        connection = Connection.objects.get(pk=connectionId)
+        with transaction.atomic():
+            events = list(
+                OpenLineageEvent.objects.filter(connection=connection)
+                .order_by("created_at")
+                .values_list("id", "body")[: settings.OPEN_LINEAGE_BATCH_SIZE]
+            )
+            if not events:
+                return
+
+            event_ids, bodies = zip(*events)
+            run = Run.objects.create(
+                workspace=connection.workspace,
+                connection=connection,
+                status="queued",
+                input=list(bodies),
+                action=Run.UPDATE,
+                source=connection.source,
+            )
+            OpenLineageEvent.objects.filter(id__in=event_ids).delete()
+
+        execute_run(run)
+    finally:
+        cache.delete(lock_key)
+
+        # Events which arrived while this batch was running aren't covered by an already scheduled run
+        pending = OpenLineageEvent.objects.filter(connection_id=connectionId).count()
+        if pending >= settings.OPEN_LINEAGE_BATCH_SIZE:
+            process_open_lineage_events.delay(connectionId)
+        elif pending > 0:
+            cache.delete(open_lineage_flush_key(connectionId))
+            schedule_open_lineage_events(connectionId, pending)
+
+
 def get_adapter(slug: str) -> Type[BaseAdapter]:
     if slug == ConnectorSlugs.POSTGRESQL:
         return PostgresAdapter
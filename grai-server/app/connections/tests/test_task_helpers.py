@@ -570,6 +570,39 @@ class TestUpdate:
         assert Source.objects.filter(name=source.name, workspace=test_workspace).exists()
         assert Node.objects.filter(name=nodes[0].name, namespace=nodes[0].namespace).exists()
 
+    @pytest.mark.django_db
+    def test_update_skips_unchanged_items(self, test_workspace, test_source):
+        nodes = [mock_node(test_workspace) for _ in range(2)]
+        schema_nodes = [mock_node_schema(node, test_source) for node in nodes]
+        update(test_workspace, test_source, schema_nodes)
+
+        changed_node = schema_nodes[1].copy(deep=True)
+        changed_node.spec.metadata.grai.tags = ["a-new-tag"]
+        new, deactivated, updated = process_updates(test_workspace, test_source, [schema_nodes[0], changed_node])
+
+        assert new == []
+        assert deactivated == []
+        assert [node.name for node in updated] == [nodes[1].name]
+
+    @pytest.mark.django_db
+    def test_update_relinks_unchanged_items(self, test_workspace, test_source):
+        nodes = [mock_node(test_workspace) for _ in range(2)]
+        schema_nodes = [mock_node_schema(node, test_source) for node in nodes]
+        update(test_workspace, test_source, schema_nodes)
+        test_source.nodes.remove(*Node.objects.filter(name=nodes[0].name))
+
+        new, deactivated, updated = process_updates(test_workspace, test_source, schema_nodes)
+        assert [node.name for node in updated] == [nodes[0].name]
+
+    @pytest.mark.django_db
+    def test_update_stores_content_digest(self, test_workspace, test_source):
+        node = mock_node(test_workspace)
+        schema_node = mock_node_schema(node, test_source)
+        update(test_workspace, test_source, [schema_node])
+
+        stored_node = Node.objects.get(name=node.name, namespace=node.namespace)
+        assert stored_node.content_digest == schema_node.to_node().spec.content_digest()
+
 
 class TestGetEdgeNodesFromDatabase:
     @staticmethod
@@ -5,12 +5,20 @@ from datetime import date
 import pytest
 from decouple import config
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from grai_schemas.integrations.errors import NoConnectionError
 from grai_source_dbt_cloud.loader import Event
 
-from connections.models import Connection, Connector, Run, RunFile, ConnectorSlugs
-from connections.tasks import get_adapter, process_run, run_connection_schedule
+from connections.models import Connection, Connector, Run, RunFile, ConnectorSlugs, OpenLineageEvent
+from connections.tasks import (
+    buffer_open_lineage_event,
+    get_adapter,
+    open_lineage_lock_key,
+    process_open_lineage_events,
+    process_run,
+    run_connection_schedule,
+)
 from installations.models import Branch, Commit, PullRequest, Repository
 from installations.tests.test_github import mocked_requests_post
 from lineage.models import Edge, Node, Source
@@ -426,6 +434,25 @@ class TestUpdateServer:
 
             get_adapter(run.connection.connector.slug)
 
+    def test_yaml_file_adapter_reads_json_lines(self, test_workspace, test_yaml_file_connector, test_source):
+        connection = Connection.objects.create(
+            name=str(uuid.uuid4()),
+            connector=test_yaml_file_connector,
+            workspace=test_workspace,
+            source=test_source,
+        )
+
+        contents = {}
+        for name in ["test.yaml", "test.jsonl"]:
+            with open(os.path.join(__location__, name)) as reader:
+                run = Run.objects.create(connection=connection, workspace=test_workspace, source=test_source)
+                run_file = RunFile.objects.create(run=run, file=UploadedFile(reader, name=name))
+
+            contents[name] = list(get_adapter(connection.connector.slug)(run).process_content(run_file))
+
+        assert len(contents["test.yaml"]) == 3
+        assert contents["test.yaml"] == contents["test.jsonl"]
+
     def test_get_flat_file_connector(self, test_workspace, test_flat_file_connector, test_source):
         Node.objects.create(workspace=test_workspace, namespace="default", name="table1")
 
@@ -957,6 +984,40 @@ class TestEventsTests:
 
         process_run(str(run.id))
 
+    def test_dbt_cloud_dedupes_and_links_nodes(self, test_workspace, test_dbt_cloud_connector, mocker, test_source):
+        connection = Connection.objects.create(
+            name=str(uuid.uuid4()),
+            connector=test_dbt_cloud_connector,
+            workspace=test_workspace,
+            metadata={},
+            secrets={"api_key": "abc1234"},
+            source=test_source,
+        )
+        nodes = [
+            Node.objects.create(workspace=test_workspace, namespace=connection.namespace, name=name) for name in "ab"
+        ]
+        connection.events.create(workspace=test_workspace, reference="1", date=date.today())
+
+        mock = mocker.patch("grai_source_dbt_cloud.base.DbtCloudIntegration.events")
+        mock.return_value = [
+            Event(reference=reference, date=date.today(), metadata={}, status="success", nodes=node_names)
+            for reference, node_names in [("1", ["a"]), ("2", ["a", "b", "missing"]), ("2", ["a"]), ("3", ["b"])]
+        ]
+        run = Run.objects.create(
+            connection=connection,
+            workspace=test_workspace,
+            action=Run.EVENTS,
+            source=test_source,
+        )
+
+        process_run(str(run.id))
+
+        events = {event.reference: event for event in connection.events.all()}
+        assert sorted(events) == ["1", "2", "3"]
+        assert set(events["2"].nodes.all()) == set(nodes)
+        assert list(events["3"].nodes.all()) == [nodes[1]]
+        assert events["1"].nodes.count() == 0
+
 
 @pytest.mark.django_db
 class TestEventsAllTests:
@@ -1024,3 +1085,102 @@ class TestEventsAllTests:
         )
 
         process_run(str(run.id))
+
+
+def open_lineage_event(output: str, column: str, input_table: str) -> dict:
+    return {
+        "eventType": "COMPLETE",
+        "outputs": [
+            {
+                "namespace": "warehouse",
+                "name": output,
+                "facets": {
+                    "columnLineage": {
+                        "fields": {
+                            column: {
+                                "inputFields": [{"namespace": "warehouse", "name": input_table, "field": column}],
+                            }
+                        }
+                    }
+                },
+            }
+        ],
+    }
+
+
+@pytest.mark.django_db
+class TestOpenLineageEvents:
+    @pytest.fixture
+    def connection(self, test_workspace, test_openlineage_connector, test_source):
+        return Connection.objects.create(
+            name=str(uuid.uuid4()),
+            connector=test_openlineage_connector,
+            workspace=test_workspace,
+            metadata={},
+            source=test_source,
+        )
+
+    def test_events_are_buffered(self, connection, mocker, settings):
+        mock = mocker.patch("connections.tasks.process_open_lineage_events")
+
+        for i in range(3):
+            buffer_open_lineage_event(connection, open_lineage_event(f"out_{i}", "id", "in"))
+
+        assert OpenLineageEvent.objects.filter(connection=connection).count() == 3
+        assert Run.objects.filter(connection=connection).count() == 0
+        mock.delay.assert_not_called()
+        mock.apply_async.assert_called_once_with((connection.id,), countdown=settings.OPEN_LINEAGE_BATCH_WINDOW)
+
+    def test_full_batch_is_processed_immediately(self, connection, mocker, settings):
+        settings.OPEN_LINEAGE_BATCH_SIZE = 2
+        mock = mocker.patch("connections.tasks.process_open_lineage_events")
+
+        buffer_open_lineage_event(connection, open_lineage_event("out_1", "id", "in"))
+        buffer_open_lineage_event(connection, open_lineage_event("out_2", "id", "in"))
+
+        mock.delay.assert_called_once_with(connection.id)
+
+    def test_lock_is_released_for_a_missing_connection(self):
+        connection_id = uuid.uuid4()
+
+        with pytest.raises(Connection.DoesNotExist):
+            process_open_lineage_events(connection_id)
+
+        assert cache.get(open_lineage_lock_key(connection_id)) is None
+
+    def test_batch_is_merged_into_one_run(self, connection, test_workspace):
+        for i in range(3):
+            OpenLineageEvent.objects.create(
+                connection=connection, workspace=test_workspace, body=open_lineage_event(f"out_{i}", "id", "in")
+            )
+
+        process_open_lineage_events(connection.id)
+
+        run = Run.objects.get(connection=connection)
+        assert run.status == "success"
+        assert len(run.input) == 3
+        assert not OpenLineageEvent.objects.filter(connection=connection).exists()
+        assert Node.objects.filter(workspace=test_workspace, name="in").count() == 1
+        assert Node.objects.filter(workspace=test_workspace, name__in=["out_0", "out_1", "out_2"]).count() == 3
+
+    def test_batches_add_lineage_incrementally(self, connection, test_workspace):
+        OpenLineageEvent.objects.create(
+            connection=connection, workspace=test_workspace, body=open_lineage_event("first", "id", "in")
+        )
+        process_open_lineage_events(connection.id)
+
+        OpenLineageEvent.objects.create(
+            connection=connection, workspace=test_workspace, body=open_lineage_event("second", "id", "in")
+        )
+        process_open_lineage_events(connection.id)
+
+        source_nodes = set(connection.source.nodes.values_list("name", flat=True))
+        assert {"first", "second", "in", "first.id", "second.id", "in.id"} <= source_nodes
+        assert Edge.objects.filter(
+            workspace=test_workspace, source__name="in.id", destination__name="first.id"
+        ).exists()
+
+    def test_no_events(self, connection):
+        process_open_lineage_events(connection.id)
+
+        assert not Run.objects.filter(connection=connection).exists()
@@ -695,6 +695,7 @@ def test_openlineage(client, test_connection_openlineage, workspace_api_key):
     assert response.status_code == 200, f"verb `get` failed on workspaces with status {response.status_code}"
     data = response.json()
     assert data["status"] == "ok"
+    assert test_connection_openlineage.open_lineage_events.count() == 1
 
 
 @pytest.mark.django_db
@@ -15,7 +15,7 @@ from rest_framework.decorators import (
 from rest_framework.response import Response
 
 from common.permissions.multitenant import Multitenant
-from connections.tasks import process_run
+from connections.tasks import buffer_open_lineage_event, process_run
 from installations.github import Github
 from installations.models import Branch, Commit, PullRequest, Repository
 from lineage.models import Source
@@ -314,16 +314,8 @@ def open_lineage(request, connection: Connection):
     # if connection.secrets.get("api_secret") != secret:
     #     return Response({"status": "Invalid secret"})
 
-    run = Run.objects.create(
-        workspace=connection.workspace,
-        connection=connection,
-        status="queued",
-        input=body,
-        action=Run.UPDATE,
-        source=connection.source,
-    )
-
-    process_run.delay(run.id)
+    # Events are merged into a batched run rather than each triggering its own update
+    buffer_open_lineage_event(connection, body)
 
     return Response({"status": "ok"})
 
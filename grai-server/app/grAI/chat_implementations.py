@@ -1,6 +1,7 @@
 import json
 import logging
 import uuid
+from collections import OrderedDict
 
 from typing import Any, Callable, ParamSpec, TypeVar, Coroutine
 
@@ -38,7 +39,7 @@ from grAI.tools import (
     SourceLookupAPI,
 )
 from grAI.summarization import ProgressiveSummarization, ToolSummarization, GraiSummarization
-from grAI.utils import compute_total_tokens
+from grAI.utils import TokenCounter
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -50,6 +51,9 @@ R = TypeVar("R")
 P = ParamSpec("P")
 
 
+CONVERSATION_STATE_VERSION = 1
+
+
 class SummaryPrompt:
     def __init__(self, encoder: tiktoken.Encoding):
         prompt_str = """
@@ -80,6 +84,7 @@ class BaseConversation:
         self.client = client
         self.model_type = model_type
         self.encoder = tiktoken.encoding_for_model(self.model_type)
+        self.token_counter = TokenCounter(self.encoder)
         # self.encoder = FakeEncoder()
 
         self.chat_id = chat_id
@@ -105,27 +110,46 @@ class BaseConversation:
 
     @property
     async def cached_messages(self) -> list[SupportedMessageTypes]:
-        cache_result = cache.get(self.cache_id, None)
+        """The condensed conversation history, including any summaries, shared between workers through the cache.
 
-        if cache_result is None:
+        Token counts are cached alongside the messages so a conversation restored on another worker doesn't need to
+        re-encode its history.
+        """
+        state = cache.get(self.cache_id, None)
+
+        if not isinstance(state, dict) or state.get("version") != CONVERSATION_STATE_VERSION:
             return await self.hydrate_chat()
-        else:
-            return [ChatMessage(message=message).message for message in cache_result]
+
+        messages = [ChatMessage(message=message).message for message in state["messages"]]
+        for message, token_count in zip(messages, state["token_counts"]):
+            if message.content is not None:
+                self.token_counter.prime(message.content, token_count)
+
+        return messages
 
     @cached_messages.setter
     def cached_messages(self, values: list[SupportedMessageTypes]):
-        cache.set(self.cache_id, [v.dict(exclude_none=True) for v in values])
+        state = {
+            "version": CONVERSATION_STATE_VERSION,
+            "messages": [v.dict(exclude_none=True) for v in values],
+            "token_counts": [self.token_counter.message_tokens(v) for v in values],
+        }
+        # Every request rewrites the state so the timeout slides, evicting conversations which have gone idle
+        cache.set(self.cache_id, state, timeout=settings.GRAI_CONVERSATION_CACHE_TIMEOUT)
 
     @database_sync_to_async
     def hydrate_chat(self) -> list[SupportedMessageTypes]:
         """
         Hydration doesn't currently capture function call context or summarization and will need to be updated to do so.
         """
-        messages_iter = (
-            ChatMessage(message={"role": m.role, "content": m.message}).message
-            for m in Message.objects.filter(chat_id=self.chat_id).order_by("-created_at").all()
-        )
-        messages = [self.prompt_message, *messages_iter]
+        stored_messages = Message.objects.filter(chat_id=self.chat_id).order_by("created_at").all()
+
+        messages = [self.prompt_message]
+        for m in stored_messages:
+            if m.token_count is not None:
+                self.token_counter.prime(m.message, m.token_count)
+            messages.append(ChatMessage(message={"role": m.role, "content": m.message}).message)
+
         self.cached_messages = messages
         return messages
 
@@ -164,11 +188,13 @@ class BaseConversation:
 
         user_query = UserMessage(content=user_input)
         messages.append(user_query)
+        total_tokens = self.token_counter.total(messages)
 
         final_response: str | None = None
         while final_response is None:
-            if compute_total_tokens(messages, self.encoder) > self.max_tokens:
+            if total_tokens > self.max_tokens:
                 messages = await self.evaluate_summary(messages)
+                total_tokens = self.token_counter.total(messages)
 
             response = await self.model(messages)
             response_choice = response.choices[0]
@@ -177,10 +203,12 @@ class BaseConversation:
                 final_response = response_choice.message.content
             elif response_choice.finish_reason == "length":
                 messages = await self.evaluate_summary(messages)
+                total_tokens = self.token_counter.total(messages)
             elif response_choice.finish_reason == "content_filter":
                 final_response = "Warning: This message was filtered by the content filter."
             elif response_choice.finish_reason == "tool_calls":
                 messages.append(response_choice.message)
+                total_tokens += self.token_counter.message_tokens(response_choice.message)
                 for i, tool_call in enumerate(response_choice.message.tool_calls):
                     func_id = tool_call.function.name
                     func_kwargs = json.loads(tool_call.function.arguments)
@@ -193,6 +221,7 @@ class BaseConversation:
                         args=func_kwargs,
                     )
                     messages.append(message)
+                    total_tokens += self.token_counter.message_tokens(message)
             else:
                 logging.error(f"Encountered an unknown openai finish reason {response_choice.finish_reason}")
                 final_response = response_choice.message.content
@@ -201,9 +230,38 @@ class BaseConversation:
         return final_response
 
 
+class ConversationPool:
+    """A bounded, least recently used pool of conversations kept by each worker.
+
+    Reconnecting sockets reuse the conversation, and its token counts, rather than rebuilding it.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.conversations: OrderedDict[tuple, BaseConversation] = OrderedDict()
+
+    def get(self, key: tuple) -> BaseConversation | None:
+        if (conversation := self.conversations.get(key)) is not None:
+            self.conversations.move_to_end(key)
+        return conversation
+
+    def set(self, key: tuple, conversation: BaseConversation):
+        self.conversations[key] = conversation
+        self.conversations.move_to_end(key)
+        if len(self.conversations) > self.max_size:
+            self.conversations.popitem(last=False)
+
+
+conversation_pool = ConversationPool(settings.GRAI_CONVERSATION_POOL_SIZE)
+
+
 async def get_chat_conversation(
     chat_id: str | uuid.UUID, workspace: Workspace | uuid.UUID, model_type: str = settings.OPENAI_PREFERRED_MODEL
 ):
+    pool_key = (str(chat_id), str(workspace.id), workspace.ai_enabled, model_type)
+    if (conversation := conversation_pool.get(pool_key)) is not None:
+        return conversation
+
     chat_prompt = """
     You are a helpful assistant with domain expertise about an organizations data and data infrastructure.
     All of that context is embedded in a graph where nodes represent individual data concepts like a database column or
@@ -245,4 +303,5 @@ async def get_chat_conversation(
     conversation = BaseConversation(
         prompt=chat_prompt, model_type=model_type, functions=functions, chat_id=str(chat_id), client=client
     )
+    conversation_pool.set(pool_key, conversation)
     return conversation
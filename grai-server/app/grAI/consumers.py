@@ -126,6 +126,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
             chat_id=event.chat_id, message=event.message, role=MessageRoles.USER.value, visible=True
         )
         response_message = Message(chat_id=event.chat_id, message=response, role=agent, visible=True)
+        if (conversation := self.conversations.get(event.chat_id)) is not None:
+            inbound_message.token_count = conversation.token_counter.count(event.message)
+            response_message.token_count = conversation.token_counter.count(response)
 
         response = {"message": response, "chat_id": str(event.chat_id)}
         broadcast_response = {
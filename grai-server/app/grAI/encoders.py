@@ -1,3 +1,6 @@
+import asyncio
+import random
+import time
 import tiktoken
 import openai
 from typing import TypeVar
@@ -7,7 +10,27 @@ from django.conf import settings
 R = TypeVar("R")
 
 
-class OpenAIEmbedder:
+class BaseEmbedder:
+    """The interface the node embedding pipeline expects from an embedding provider.
+
+    Providers truncate content to fit a single input (`prepare_content`) and embed many inputs per request
+    (`get_embeddings`). The batch limits bound how many inputs and tokens are sent in a single request.
+    """
+
+    max_batch_size: int = 2048
+    max_batch_tokens: int = 250_000
+    max_concurrency: int = 4
+
+    def prepare_content(self, content: str) -> tuple[str, int]:
+        raise NotImplementedError
+
+    async def get_embeddings(self, contents: list[str]) -> list[list[float]]:
+        raise NotImplementedError
+
+
+class OpenAIEmbedder(BaseEmbedder):
+    max_retries: int = 6
+
     def __init__(self, model: str, context_window: int, client: openai.AsyncOpenAI | None = None):
         self.model = model
         self.model_context_window = context_window
@@ -17,6 +40,7 @@ class OpenAIEmbedder:
         self.client: openai.AsyncOpenAI = client
 
         self.heuristic_max_length = int(self.model_context_window * 4 * 0.85)
+        self.rate_limited_until = 0.0
 
     def get_encoding(self, content: str) -> list[int]:
         return self.encoder.encode(content)
@@ -35,10 +59,34 @@ class OpenAIEmbedder:
         else:
             return self.decode(encoded[: self.model_context_window])
 
+    def prepare_content(self, content: str) -> tuple[str, int]:
+        encoded = self.get_encoding(content)
+        if len(encoded) < self.model_context_window:
+            return content, len(encoded)
+
+        return self.decode(encoded[: self.model_context_window]), self.model_context_window
+
     async def get_embedding(self, content: str) -> R:
         content = self.get_max_length_content(content)
         return await self.client.embeddings.create(input=content, model=self.model)
 
+    async def get_embeddings(self, contents: list[str]) -> list[list[float]]:
+        # A rate limit on any request pauses every concurrent request rather than letting them each hit the limit
+        for attempt in range(self.max_retries):
+            while (delay := self.rate_limited_until - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                response = await self.client.embeddings.create(input=contents, model=self.model)
+                break
+            except openai.RateLimitError:
+                if attempt == self.max_retries - 1:
+                    raise
+                backoff = min(2**attempt, 60) * random.uniform(0.5, 1.5)
+                self.rate_limited_until = max(self.rate_limited_until, time.monotonic() + backoff)
+
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
 
 if settings.HAS_OPENAI:
     Embedder = OpenAIEmbedder("text-embedding-ada-002", 8100)
@@ -0,0 +1,65 @@
+import asyncio
+import time
+import uuid
+
+from django.core.management.base import CommandParser
+from django_tqdm import BaseCommand
+
+from grAI.chat_types import FunctionMessage
+from grAI.mocks import FakeCompletionClient
+from grAI.summarization import Map, MapReduceSummarization, Reduce
+
+
+class Command(BaseCommand):
+    help = "Benchmark map reduce summarization wall clock time against the number of chunks using a fake client"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--chunks", type=int, nargs="+", default=[1, 4, 16, 64])
+        parser.add_argument("--latency", type=float, default=0.1)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--model", type=str, default="gpt-3.5-turbo")
+        parser.add_argument("--max-tokens", type=int, default=1000)
+
+    def handle(self, *args, **options) -> None:
+        for n_chunks in options["chunks"]:
+            asyncio.run(self.benchmark(n_chunks, **options))
+
+    def summarizer(self, client: FakeCompletionClient, **options) -> MapReduceSummarization:
+        kwargs = {
+            "model": options["model"],
+            "client": client,
+            "max_tokens": options["max_tokens"],
+            "max_concurrency": options["concurrency"],
+        }
+        return MapReduceSummarization(
+            model=options["model"],
+            client=client,
+            max_tokens=options["max_tokens"],
+            map=Map(**kwargs),
+            reduce=Reduce(**kwargs),
+        )
+
+    async def benchmark(self, n_chunks: int, **options):
+        client = FakeCompletionClient(latency=options["latency"])
+        summarizer = self.summarizer(client, **options)
+
+        # A unique tool response roughly n_chunks map windows long, so nothing is served from the summary cache
+        words = options["max_tokens"] * n_chunks
+        content = " ".join(f"{uuid.uuid4().hex[:6]}" for _ in range(words // 4))
+        message = FunctionMessage(content=content, name="benchmark", tool_call_id=str(uuid.uuid4()), args={})
+
+        start = time.perf_counter()
+        await summarizer.call([message])
+        cold = time.perf_counter() - start
+        cold_calls = client.calls
+
+        start = time.perf_counter()
+        await summarizer.call([message])
+        warm = time.perf_counter() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{n_chunks} chunks: cold {cold:.2f}s ({cold_calls} completions, peak concurrency {client.max_active}), "
+                f"cached {warm:.2f}s ({client.calls - cold_calls} completions)"
+            )
+        )
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 12:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("grAI", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="message",
+            name="token_count",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
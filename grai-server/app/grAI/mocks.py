@@ -1,3 +1,68 @@
+import asyncio
+import hashlib
+from types import SimpleNamespace
+
+from openai.types.chat import ChatCompletion
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_message import ChatCompletionMessage
+
+from grAI.encoders import BaseEmbedder
+
+
 class FakeEncoder:
     def encode(self, text):
         return [1, 2, 3, 4]
+
+
+class FakeEmbedder(BaseEmbedder):
+    """A deterministic local embedding provider for tests and benchmarks which never leaves the process."""
+
+    def __init__(self, dimensions: int = 1536, max_batch_size: int = 2048, max_batch_tokens: int = 250_000):
+        self.dimensions = dimensions
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.requests: list[list[str]] = []
+
+    def prepare_content(self, content: str) -> tuple[str, int]:
+        return content, len(content) // 4 + 1
+
+    def embed(self, content: str) -> list[float]:
+        digest = hashlib.sha256(content.encode("utf-8")).digest()
+        return [digest[i % len(digest)] / 255 for i in range(self.dimensions)]
+
+    async def get_embeddings(self, contents: list[str]) -> list[list[float]]:
+        self.requests.append(contents)
+        return [self.embed(content) for content in contents]
+
+
+class FakeCompletionClient:
+    """A stand in for `openai.AsyncOpenAI` whose chat completions sleep for `latency` seconds and return a short summary.
+
+    Records the number of completions and the peak number running at once.
+    """
+
+    def __init__(self, latency: float = 0.05, response: str = "summary"):
+        self.latency = latency
+        self.response = response
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, model: str, messages: list[dict], **kwargs) -> ChatCompletion:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+
+        message = ChatCompletionMessage(role="assistant", content=self.response)
+        return ChatCompletion(
+            id=f"fake-{self.calls}",
+            choices=[Choice(finish_reason="stop", index=0, message=message)],
+            created=0,
+            model=model,
+            object="chat.completion",
+        )
@@ -31,6 +31,7 @@ class Message(models.Model):
     message = models.TextField()
     visible = models.BooleanField()
     role = models.CharField(max_length=255, choices=MessageRoles.choices(), default=MessageRoles.USER)
+    token_count = models.IntegerField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
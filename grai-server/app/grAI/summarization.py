@@ -5,7 +5,10 @@ from typing import Any, TypeVar, Coroutine
 import openai
 from openai import AsyncOpenAI
 from django.conf import settings
-from asyncio import gather
+from asyncio import Semaphore, gather
+import hashlib
+import json
+from django.core.cache import cache
 from grAI.chat_types import SupportedMessageTypes, SystemMessage, FunctionMessage, UserMessage
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from openai.types.chat import ChatCompletion
@@ -43,6 +46,7 @@ class BaseSummarizer(ABC):
         prompt_string: str,
         client: AsyncOpenAI | None = None,
         max_tokens: int | None = None,
+        max_concurrency: int = 8,
     ):
         if client is None:
             client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY, organization=settings.OPENAI_ORG_ID)
@@ -51,10 +55,12 @@ class BaseSummarizer(ABC):
         self.model = model
         self.max_tokens = get_token_limit(self.model) if max_tokens is None else max_tokens
         self.encoder = tiktoken.encoding_for_model(self.model)
+        self.semaphore = Semaphore(max_concurrency)
 
     async def completion(self, messages: list[dict] | dict) -> ChatCompletion:
         messages = [messages] if isinstance(messages, dict) else messages
-        return await self.client.chat.completions.create(model=self.model, messages=messages)
+        async with self.semaphore:
+            return await self.client.chat.completions.create(model=self.model, messages=messages)
 
     def prompt(self, content: SupportedMessageTypes):
         return self.prompt_string.format(content=content.content, role=content.role)
@@ -80,8 +86,15 @@ class BasicSummarizer(BaseSummarizer):
         client: AsyncOpenAI | None = None,
         prompt_string: str | None = DEFAULT_SUMMARIZER_PROMPT,
         max_tokens: int | None = None,
+        max_concurrency: int = 8,
     ):
-        super().__init__(prompt_string=prompt_string, model=model, client=client, max_tokens=max_tokens)
+        super().__init__(
+            prompt_string=prompt_string,
+            model=model,
+            client=client,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+        )
 
     async def call(self, input_obj: SupportedMessageTypes) -> str:
         query = self.query(input_obj)
@@ -91,7 +104,7 @@ class BasicSummarizer(BaseSummarizer):
 
     def validate(self, content: str) -> list[int]:
         encoding = self.encoder.encode(content)
-        if enc_size := len(encoding) < self.max_tokens:
+        if (enc_size := len(encoding)) > self.max_tokens:
             message = (
                 f"The provided prompt is {enc_size} tokens long but the chosen model {self.model} only supports"
                 f"a maximum of {self.max_tokens} tokens. Please reduce the prompt size."
@@ -108,8 +121,15 @@ class ConversationSummarizer(BasicSummarizer):
         prompt_string: str,
         client: AsyncOpenAI | None = None,
         max_tokens: int | None = None,
+        max_concurrency: int = 8,
     ):
-        super().__init__(prompt_string=prompt_string, model=model, client=client, max_tokens=max_tokens)
+        super().__init__(
+            prompt_string=prompt_string,
+            model=model,
+            client=client,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+        )
 
     def prompt(self, content: str | list[SupportedMessageTypes], **kwargs) -> str:
         if isinstance(content, list):
@@ -143,8 +163,15 @@ class Reduce(ConversationSummarizer):
         prompt_string: str = DEFAULT_REDUCE_PROMPT,
         client: AsyncOpenAI | None = None,
         max_tokens: int | None = None,
+        max_concurrency: int = 8,
     ):
-        super().__init__(prompt_string=prompt_string, model=model, client=client, max_tokens=max_tokens)
+        super().__init__(
+            prompt_string=prompt_string,
+            model=model,
+            client=client,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+        )
 
     async def call(self, items: list[SupportedMessageTypes], **kwargs) -> str:
         query = self.query(items, **kwargs)
@@ -154,7 +181,7 @@ class Reduce(ConversationSummarizer):
 
     def validate(self, content: str) -> list[int]:
         encoding = self.encoder.encode(content)
-        if enc_size := len(encoding) < self.max_tokens:
+        if (enc_size := len(encoding)) > self.max_tokens:
             message = (
                 f"The provided prompt is {enc_size} tokens long but the chosen model {self.model} only supports"
                 f"a maximum of {self.max_tokens} tokens. Please reduce the prompt size."
@@ -162,6 +189,30 @@ class Reduce(ConversationSummarizer):
             raise ContentLengthError(message)
         return encoding
 
+    def windows(self, summaries: list[str], **kwargs) -> list[list[str]]:
+        """Packs summaries, in order, into groups which each fit in a single reduce prompt.
+
+        Summaries too long to fit on their own are split across windows.
+        """
+        overhead = len(self.encoder.encode(self.prompt(content=[], **kwargs))) + 50
+        window_size = max(self.max_tokens - overhead, 1)
+        separator_tokens = len(self.encoder.encode("\nsystem\n---\n\n---\n"))
+
+        windows: list[list[str]] = [[]]
+        window_tokens = 0
+        for summary in summaries:
+            encoding = self.encoder.encode(summary)
+            pieces = [encoding] if len(encoding) <= window_size else list(chunker(encoding, window_size))
+            for piece in pieces:
+                size = len(piece) + separator_tokens
+                if windows[-1] and window_tokens + size > window_size:
+                    windows.append([])
+                    window_tokens = 0
+                windows[-1].append(summary if len(pieces) == 1 else self.encoder.decode(piece))
+                window_tokens += size
+
+        return windows
+
 
 DEFAULT_MAP_PROMPT = DEFAULT_SUMMARIZER_PROMPT
 
@@ -173,15 +224,47 @@ class Map(ConversationSummarizer):
         prompt_string: str = DEFAULT_MAP_PROMPT,
         client: AsyncOpenAI | None = None,
         max_tokens: int | None = None,
+        max_concurrency: int = 8,
     ):
-        super().__init__(prompt_string=prompt_string, model=model, client=client, max_tokens=max_tokens)
+        super().__init__(
+            prompt_string=prompt_string,
+            model=model,
+            client=client,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+        )
+
+    cache_timeout = 60 * 60 * 24
+
+    def chunk_cache_key(self, chunk: str, **kwargs) -> str:
+        content = json.dumps([self.model, self.prompt_string, chunk, sorted(kwargs.items())])
+        return f"grAI:summary:{hashlib.sha256(content.encode('utf-8')).hexdigest()}"
+
+    async def summarize_chunk(self, chunk: str, **kwargs) -> str:
+        response = await self.completion(self.query(chunk, **kwargs))
+        return response.choices[0].message.content
 
     async def call(self, items: list[SupportedMessageTypes], **kwargs) -> list[str]:
+        """Summarises fixed size chunks of the conversation concurrently.
+
+        Chunks are taken from the start of the conversation so as it grows only the final chunk and any new ones
+        change. Summaries are cached by chunk so the unchanged chunks aren't summarised again.
+        """
         encoding = self.encoder.encode(self.prompt_content(items))
+        overhead = len(self.encoder.encode(self.prompt(content=[], **kwargs))) + 50
+        chunks = [self.encoder.decode(chunk) for chunk in chunker(encoding, max(self.max_tokens - overhead, 1))]
+
+        keys = [self.chunk_cache_key(chunk, **kwargs) for chunk in chunks]
+        cached = await cache.aget_many(keys)
 
-        queries = (self.query(self.encoder.decode(chunk)) for chunk in chunker(encoding, self.max_tokens - 50))
-        responses = await gather(*[self.completion(query) for query in queries])
-        return [resp.choices[0].message.content for resp in responses]
+        missing = [(key, chunk) for key, chunk in zip(keys, chunks) if key not in cached]
+        responses = await gather(*[self.summarize_chunk(chunk, **kwargs) for _, chunk in missing])
+
+        summaries = {key: response for (key, _), response in zip(missing, responses)}
+        if summaries:
+            await cache.aset_many(summaries, timeout=self.cache_timeout)
+
+        return [cached.get(key, summaries.get(key)) for key in keys]
 
 
 class MapReduceSummarization(BaseChat):
@@ -191,16 +274,16 @@ class MapReduceSummarization(BaseChat):
         super().__init__(*args, **kwargs)
 
     async def call(self, items: list[SupportedMessageTypes], **kwargs) -> str:
-        reduction: str | None = None
-        while reduction is None:
-            items = [SystemMessage(content=content) for content in await self.map.call(items, **kwargs)]
+        summaries = await self.map.call(items, **kwargs)
 
-            try:
-                reduction = await self.reduce.call(items, **kwargs)
-            except ContentLengthError:
-                pass
+        # Reduce as a tree: while the summaries don't fit in one prompt each window is reduced concurrently
+        while len(windows := self.reduce.windows(summaries, **kwargs)) > 1:
+            summaries = await gather(*[self.reduce_window(window, **kwargs) for window in windows])
 
-        return reduction
+        return await self.reduce_window(windows[0], **kwargs)
+
+    async def reduce_window(self, window: list[str], **kwargs) -> str:
+        return await self.reduce.call([SystemMessage(content=content) for content in window], **kwargs)
 
 
 DEFAULT_PROGRESSIVE_PROMPT = DEFAULT_SUMMARIZER_PROMPT
@@ -219,14 +302,22 @@ class ProgressiveSummarization(ConversationSummarizer):
     async def call(self, items: list[SupportedMessageTypes], **kwargs) -> str:
         content = self.prompt(items, **kwargs)
         encoding = self.encoder.encode(content)
-        while len(encoding) > self.max_tokens:
-            query = self.query(self.encoder.decode(encoding[: self.max_tokens]), **kwargs)
+        if len(encoding) <= self.max_tokens:
+            return content
+
+        # The conversation is encoded once, after which each round only encodes the new summary and splices it onto
+        # the remaining tokens rather than re-encoding everything that's left.
+        prompt_tokens = len(self.encoder.encode(self.prompt_string.format(content="", **kwargs)))
+        separator = self.encoder.encode("\n")
+        chunk_size = max(self.max_tokens - prompt_tokens, 1)
+        while prompt_tokens + len(encoding) > self.max_tokens:
+            query = self.query(self.encoder.decode(encoding[:chunk_size]), **kwargs)
             response = await self.completion(query)
 
-            content = "\n".join([response.choices[0].message.content, self.encoder.decode(encoding[self.max_tokens :])])
-            encoding = self.encoder.encode(self.prompt_string.format(content=content, **kwargs))
+            summary = self.encoder.encode(response.choices[0].message.content)
+            encoding = [*summary, *separator, *encoding[chunk_size:]]
 
-        return content
+        return self.encoder.decode(encoding)
 
 
 class ToolSummarization(BaseChat):
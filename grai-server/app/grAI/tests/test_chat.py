@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+
+from grAI.chat_implementations import BaseConversation, ConversationPool
+from grAI.chat_types import UserMessage
+
+
+def make_conversation(chat_id: str) -> BaseConversation:
+    return BaseConversation(chat_id=chat_id, prompt="You are a helpful assistant", client=object(), model_type="gpt-4")
+
+
+class TestConversationPool:
+    def test_least_recently_used_are_evicted(self):
+        pool = ConversationPool(max_size=2)
+        pool.set(("a",), "conversation a")
+        pool.set(("b",), "conversation b")
+        pool.get(("a",))
+        pool.set(("c",), "conversation c")
+
+        assert pool.get(("a",)) == "conversation a"
+        assert pool.get(("b",)) is None
+        assert pool.get(("c",)) == "conversation c"
+
+
+class TestConversationState:
+    async def test_state_is_shared_between_conversations(self):
+        chat_id = str(uuid.uuid4())
+        conversation = make_conversation(chat_id)
+        messages = [conversation.prompt_message, UserMessage(content="Where does the users table come from?")]
+        conversation.cached_messages = messages
+
+        restored = make_conversation(chat_id)
+
+        assert await restored.cached_messages == messages
+
+    async def test_token_counts_are_restored(self):
+        chat_id = str(uuid.uuid4())
+        conversation = make_conversation(chat_id)
+        message = UserMessage(content="Where does the users table come from?")
+        conversation.cached_messages = [conversation.prompt_message, message]
+
+        restored = make_conversation(chat_id)
+        await restored.cached_messages
+
+        assert restored.token_counter.counts[message.content] == conversation.token_counter.count(message.content)
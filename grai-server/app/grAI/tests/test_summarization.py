@@ -0,0 +1,52 @@
+import uuid
+
+from grAI.chat_types import FunctionMessage
+from grAI.mocks import FakeCompletionClient
+from grAI.summarization import Map, MapReduceSummarization, Reduce
+
+MODEL = "gpt-3.5-turbo"
+
+
+def make_message(n_words: int) -> FunctionMessage:
+    content = " ".join(uuid.uuid4().hex[:6] for _ in range(n_words))
+    return FunctionMessage(content=content, name="test", tool_call_id=str(uuid.uuid4()), args={})
+
+
+class TestMap:
+    async def test_concurrency_is_bounded(self):
+        client = FakeCompletionClient(latency=0.01)
+        mapper = Map(model=MODEL, client=client, max_tokens=200, max_concurrency=2)
+
+        summaries = await mapper.call([make_message(1000)])
+
+        assert len(summaries) == client.calls > 2
+        assert client.max_active == 2
+
+    async def test_unchanged_chunks_are_cached(self):
+        client = FakeCompletionClient(latency=0)
+        mapper = Map(model=MODEL, client=client, max_tokens=200)
+        message = make_message(1000)
+
+        await mapper.call([message])
+        first_calls = client.calls
+        message.content = f"{message.content} {make_message(10).content}"
+        await mapper.call([message])
+
+        assert client.calls - first_calls == 1
+
+
+class TestMapReduceSummarization:
+    async def test_large_inputs_are_reduced_as_a_tree(self):
+        client = FakeCompletionClient(latency=0, response=" ".join(["summary"] * 60))
+        kwargs = {"model": MODEL, "client": client, "max_tokens": 300}
+        summarizer = MapReduceSummarization(**kwargs, map=Map(**kwargs), reduce=Reduce(**kwargs))
+        message = make_message(3000)
+
+        n_chunks = len(await summarizer.map.call([message]))
+        map_calls = client.calls
+        result = await summarizer.call([message])
+
+        assert result == client.response
+        # Map results are cached, so every call here is a reduction and there is more than the final one
+        assert client.calls - map_calls > 1
+        assert n_chunks > 1
@@ -2,7 +2,8 @@ from grAI.tools import NHopQueryAPI
 import asyncio
 from workspaces.models import Workspace, Organisation
 import pytest
-from lineage.models import Node
+from channels.db import database_sync_to_async
+from lineage.models import Edge, Node
 from django_multitenant.utils import set_current_tenant
 
 
@@ -15,3 +16,33 @@ from django_multitenant.utils import set_current_tenant
 #     call_args = api.schema_model(name="grai_bigquery_demo.customers", namespace="default", request_context="")
 #     result = asyncio.run(api.call(**call_args.dict()))
 #
+
+
+@pytest.mark.django_db
+async def test_n_hop_query(workspace):
+    def create_graph():
+        nodes = [Node.objects.create(workspace=workspace, name=name) for name in ["a", "b", "c"]]
+        for source, destination in zip(nodes, nodes[1:]):
+            Edge.objects.create(workspace=workspace, source=source, destination=destination)
+
+    await database_sync_to_async(create_graph)()
+    api = NHopQueryAPI(workspace.id)
+
+    result, message = await api.call(name="b", namespace="default", n=1, request_context="")
+
+    assert message is None
+    assert sorted(result) == [
+        (("a", "default"), ("b", "default"), None),
+        (("b", "default"), ("c", "default"), None),
+    ]
+    assert api.serialize(sorted(result)) == "(a,default),(b,default),None\n(b,default),(c,default),None"
+
+
+@pytest.mark.django_db
+async def test_n_hop_query_missing_node(workspace):
+    api = NHopQueryAPI(workspace.id)
+
+    result, message = await api.call(name="missing", namespace="default", n=1, request_context="")
+
+    assert result == []
+    assert message == "No results found matching these query conditions."
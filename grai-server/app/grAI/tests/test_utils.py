@@ -1,4 +1,4 @@
-from grAI.utils import tool_segments
+from grAI.utils import TokenCounter, tool_segments
 from grAI.chat_types import SystemMessage, AIMessage, FunctionMessage, UserMessage
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMessageToolCall
@@ -148,3 +148,46 @@ class TestToolSegmentation:
             UserMessage(content="Hello 1"),
         ]
         result = list(tool_segments(messages))
+
+
+class CountingEncoder:
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return text.split()
+
+
+class TestTokenCounter:
+    def test_counts_are_cached(self):
+        encoder = CountingEncoder()
+        counter = TokenCounter(encoder)
+        messages = [UserMessage(content="Hello there"), AIMessage(content="General Kenobi")]
+
+        assert counter.total(messages) == 4
+        assert counter.total(messages) == 4
+        assert encoder.calls == 2
+
+    def test_primed_counts_skip_encoding(self):
+        encoder = CountingEncoder()
+        counter = TokenCounter(encoder)
+        counter.prime("Hello there", 10)
+
+        assert counter.message_tokens(UserMessage(content="Hello there")) == 10
+        assert encoder.calls == 0
+
+    def test_tool_calls_are_counted(self):
+        counter = TokenCounter(CountingEncoder())
+
+        assert counter.message_tokens(chat_completion) == len(example_tool_call.json().split())
+
+    def test_cache_is_bounded(self):
+        encoder = CountingEncoder()
+        counter = TokenCounter(encoder, max_size=2)
+        for content in ["a", "b", "c"]:
+            counter.count(content)
+
+        assert list(counter.counts) == ["b", "c"]
+        counter.count("a")
+        assert encoder.calls == 4
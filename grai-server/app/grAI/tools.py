@@ -1,12 +1,12 @@
 import uuid
 from abc import ABC, abstractmethod
 
+from lineage.filter import N_HOP_EDGE_LIMIT, get_n_hop_edges
 from lineage.models import Edge, Node, NodeEmbeddings, Source
 from pydantic import BaseModel, Field
 from grai_schemas.serializers import GraiYamlSerializer
 from django.db.models import Q
 from channels.db import database_sync_to_async
-from pgvector.django import MaxInnerProduct
 
 from typing import Annotated, Any, Callable, Literal, ParamSpec, Type, TypeVar, Union
 from connections.adapters.schemas import model_to_schema
@@ -263,57 +263,34 @@ class NHopQueryAPI(API):
 
         return message
 
-    @staticmethod
-    def filter(queryset: list[Edge], source_nodes: list[Node], dest_nodes: list[Node]) -> tuple[list[Node], list[Node]]:
-        def get_id(node: Edge | Node) -> tuple[str, str]:
-            return node.name, node.namespace
-
-        source_ids: set[T] = {get_id(node) for node in source_nodes}
-        dest_ids: set[T] = {get_id(node) for node in dest_nodes}
-        query_hashes: set[tuple[T, T]] = {(get_id(node.source), get_id(node.destination)) for node in queryset}
+    def serialize(self, result) -> str:
+        if isinstance(result, str):
+            return result
 
-        source_resp = [n.destination for n, hashes in zip(queryset, query_hashes) if hashes[0] in source_ids]
-        dest_resp = [n.source for n, hashes in zip(queryset, query_hashes) if hashes[1] in dest_ids]
-        return source_resp, dest_resp
+        return "\n".join(f"({s[0]},{s[1]}),({d[0]},{d[1]}),{edge_type}" for s, d, edge_type in result)
 
     @database_sync_to_async
-    def call(self, **kwargs) -> (list[dict], str | None):
-        def filter_edge(edge: EdgeV1) -> dict:
-            result = {
-                "name": edge.spec.name,
-                "namespace": edge.spec.namespace,
-                "source": edge.spec.source,
-                "destination": edge.spec.destination,
-                "edge_type": edge.spec.metadata.grai.edge_type,
-            }
-            return result
-
+    def call(self, **kwargs) -> (list[tuple], str | None):
         try:
             inp = self.schema_model(**kwargs)
         except Exception as e:
             return [], f"Invalid input: {e}"
 
-        source_node = Node.objects.filter(workspace__id=self.workspace, name=inp.name, namespace=inp.namespace).first()
+        source_node = (
+            Node.objects.filter(workspace__id=self.workspace, name=inp.name, namespace=inp.namespace)
+            .values_list("id", flat=True)
+            .first()
+        )
         if source_node is None:
             return [], self.response_message([])
 
-        source_nodes = [source_node]
-        dest_nodes = [source_node]
-
-        return_edges = []
-        for i in range(inp.n):
-            query = Q(source__in=source_nodes) | Q(destination__in=dest_nodes)
-            edges = Edge.objects.filter(query).prefetch_related("source", "destination").all()
+        edges = get_n_hop_edges(self.workspace, source_node, inp.n)
 
-            source_nodes, dest_nodes = self.filter(edges, source_nodes, dest_nodes)
-            return_edges.extend(list(edges))
+        message = self.response_message(edges)
+        if len(edges) == N_HOP_EDGE_LIMIT:
+            message = f"Results were truncated to the {N_HOP_EDGE_LIMIT} nearest edges."
 
-            if len(source_nodes) == 0 and len(dest_nodes) == 0:
-                break
-
-        results = set(model_to_schema(return_edges, "EdgeV1"))
-        results = [filter_edge(item) for item in results]
-        return results, self.response_message(return_edges)
+        return edges, message
 
 
 class EmbeddingSearchSchema(BaseModel):
@@ -344,11 +321,7 @@ class EmbeddingSearchAPI(API):
 
     @database_sync_to_async
     def nearest_neighbor_search(self, vector_query: list[int], limit=10) -> list[Node]:
-        node_result = (
-            NodeEmbeddings.objects.filter(node__workspace__id=self.workspace)
-            .order_by(MaxInnerProduct("embedding", vector_query))
-            .select_related("node")[:limit]
-        )
+        node_result = NodeEmbeddings.objects.nearest_neighbors(self.workspace, vector_query, limit)
 
         return [n.node for n in node_result]
 
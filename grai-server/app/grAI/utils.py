@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from itertools import islice
 from multimethod import multimethod
 import tiktoken
@@ -35,6 +36,44 @@ def chunker(it, size):
         yield chunk
 
 
+class TokenCounter:
+    """Memoises token counts by content so each message is only encoded once over the life of a conversation.
+
+    Counts read from storage can be seeded with `prime` to avoid encoding hydrated messages at all.
+    """
+
+    def __init__(self, encoder: tiktoken.Encoding, max_size: int = 10_000):
+        self.encoder = encoder
+        self.max_size = max_size
+        self.counts: OrderedDict[str, int] = OrderedDict()
+
+    def prime(self, content: str, count: int):
+        self.counts[content] = count
+        self.counts.move_to_end(content)
+        if len(self.counts) > self.max_size:
+            self.counts.popitem(last=False)
+
+    def count(self, content: str) -> int:
+        if (count := self.counts.get(content)) is not None:
+            self.counts.move_to_end(content)
+            return count
+
+        count = len(self.encoder.encode(content))
+        self.prime(content, count)
+        return count
+
+    def message_tokens(self, message: SupportedMessageTypes) -> int:
+        if message.content is not None:
+            return self.count(message.content)
+        elif isinstance(message, ChatCompletionMessage) and message.tool_calls is not None:
+            return sum(self.count(call.json()) for call in message.tool_calls)
+        else:
+            raise ValueError("Message must have either content or tool_calls")
+
+    def total(self, messages: Iterable[SupportedMessageTypes]) -> int:
+        return sum(self.message_tokens(message) for message in messages)
+
+
 def get_message_token_count(message, encoder) -> int:
     if message.content is not None:
         return len(encoder.encode(message.content))
@@ -52,6 +52,73 @@ FROM list_nodes""",
     return [node.id for node in nodes]
 
 
+N_HOP_EDGE_LIMIT = 500
+
+N_HOP_TRAVERSAL = """{name}(node_id, depth) AS (
+      SELECT %(node_id)s::uuid, 0
+    UNION
+      SELECT edges.{next}, traversal.depth + 1
+      FROM {name} traversal
+      INNER JOIN public.lineage_edge edges
+        ON edges.{previous} = traversal.node_id AND edges.workspace_id = %(workspace_id)s
+      WHERE traversal.depth < %(n)s - 1
+    )"""
+
+
+def get_n_hop_edges(
+    workspace_id, node_id, n: int, limit: int = N_HOP_EDGE_LIMIT
+) -> list[tuple[tuple[str, str], tuple[str, str], str | None]]:
+    """Returns the edges within `n` hops upstream or downstream of a node as compact tuples.
+
+    The traversal is a single recursive query in each direction. `UNION` discards any (node, depth) pair that has
+    already been reached so dense graphs don't fan out into duplicate paths, and only the first `limit` edges, nearest
+    first, are returned.
+
+    Returns:
+        A list of `((source name, source namespace), (destination name, destination namespace), edge_type)`
+    """
+    if n < 1:
+        return []
+
+    downstream = N_HOP_TRAVERSAL.format(name="downstream", previous="source_id", next="destination_id")
+    upstream = N_HOP_TRAVERSAL.format(name="upstream", previous="destination_id", next="source_id")
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""WITH RECURSIVE {downstream}, {upstream},
+    hops AS (
+      SELECT edges.id, MIN(traversal.depth) AS depth
+      FROM downstream traversal
+      INNER JOIN public.lineage_edge edges ON edges.source_id = traversal.node_id
+      WHERE edges.workspace_id = %(workspace_id)s
+      GROUP BY edges.id
+    UNION ALL
+      SELECT edges.id, MIN(traversal.depth) AS depth
+      FROM upstream traversal
+      INNER JOIN public.lineage_edge edges ON edges.destination_id = traversal.node_id
+      WHERE edges.workspace_id = %(workspace_id)s
+      GROUP BY edges.id
+    ),
+    nearest AS (
+      SELECT id, MIN(depth) AS depth
+      FROM hops
+      GROUP BY id
+      ORDER BY depth, id
+      LIMIT %(limit)s
+    )
+SELECT source.name, source.namespace, destination.name, destination.namespace, edges.metadata->'grai'->>'edge_type'
+FROM nearest
+INNER JOIN public.lineage_edge edges ON edges.id = nearest.id
+INNER JOIN public.lineage_node source ON source.id = edges.source_id
+INNER JOIN public.lineage_node destination ON destination.id = edges.destination_id
+ORDER BY nearest.depth, nearest.id""",
+            {"workspace_id": str(workspace_id), "node_id": str(node_id), "n": n, "limit": limit},
+        )
+        rows = cursor.fetchall()
+
+    return [((row[0], row[1]), (row[2], row[3]), row[4]) for row in rows]
+
+
 async def apply_table_filter(queryset: QuerySet, filter: Filter):
     q_filter = Q()
 
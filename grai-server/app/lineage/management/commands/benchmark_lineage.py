@@ -0,0 +1,246 @@
+import json
+import random
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import CommandError, CommandParser
+from django.db import transaction
+from django.db.models import Prefetch
+from django_tqdm import BaseCommand
+from grai_schemas.v1.node import SourcedNodeV1
+
+from api.types import Workspace as WorkspaceType
+from connections.task_helpers import update
+from lineage.extended_graph_cache import ExtendedGraphCache
+from lineage.filter import get_ascestor_ids_by_tag
+from lineage.models import Edge, Node, Source, TableLineage
+from lineage.query_plans import check_plans, plan_failures
+from lineage.table_lineage import refresh_table_lineage
+from workspaces.models import Organisation, Workspace
+
+BATCH_SIZE = 5000
+TAG = "benchmark-tag"
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the lineage hot paths and check their query plans against seeded synthetic workspaces. Results are "
+        "written as JSON and the command fails if a hot path query falls back to a sequential scan."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+        parser.add_argument("--columns", type=int, default=10, help="Columns per table")
+        parser.add_argument("--upstream", type=int, default=3, help="Maximum upstream tables per table")
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--update-size", type=int, default=1000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--graph-cache", action="store_true", help="Populate and time the redis graph cache")
+        parser.add_argument("--output", type=str, default=None, help="Write the JSON results here, not to stdout")
+
+    def handle(self, *args, **options) -> None:
+        self.options = options
+        self.rng = random.Random(options["seed"])
+        results = []
+
+        # Everything is seeded inside a transaction which is always rolled back
+        try:
+            with transaction.atomic():
+                organisation = Organisation.objects.create(name=f"benchmark-{uuid.uuid4()}")
+                for size in options["sizes"]:
+                    results.append(self.benchmark_workspace(organisation, size))
+                raise Rollback()
+        except Rollback:
+            pass
+
+        failures = {
+            result["size"]: plan_failures(result["plans"]) for result in results if plan_failures(result["plans"])
+        }
+        report = json.dumps({"seed": options["seed"], "results": results, "plan_failures": failures}, indent=2)
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(report)
+        else:
+            self.stdout.write(report)
+
+        if failures:
+            raise CommandError(f"Hot path queries fell back to sequential scans: {failures}")
+
+    def seed_workspace(self, organisation: Organisation, size: int) -> Workspace:
+        """Seeds tables with `--columns` columns each, where every table reads from up to `--upstream` earlier tables.
+
+        Each table to table edge is accompanied by a column to column edge between a random pair of their columns and
+        one table in a hundred is tagged. The default managers' graph cache bookkeeping is skipped.
+        """
+        workspace = Workspace.objects.create(name=f"benchmark-{size}", organisation=organisation)
+        source = Source.objects.create(name="benchmark", workspace=workspace)
+        columns_per_table = self.options["columns"]
+        num_tables = max(size // (columns_per_table + 1), 2)
+
+        def node(node_type: str, **metadata) -> Node:
+            name = str(uuid.uuid4())
+            grai = {"node_type": node_type, **metadata}
+            return Node(
+                name=name, display_name=name, namespace="benchmark", workspace=workspace, metadata={"grai": grai}
+            )
+
+        def edge(source_id, destination_id, edge_type: str) -> Edge:
+            name = str(uuid.uuid4())
+            return Edge(
+                name=name,
+                display_name=name,
+                namespace="benchmark",
+                workspace=workspace,
+                source_id=source_id,
+                destination_id=destination_id,
+                metadata={"grai": {"edge_type": edge_type}},
+            )
+
+        node_tqdm = self.tqdm(total=num_tables * (columns_per_table + 1), desc=f"Seeding {size} nodes")
+        tables: List[uuid.UUID] = []
+        columns: Dict[uuid.UUID, List[uuid.UUID]] = {}
+        for start in range(0, num_tables, max(BATCH_SIZE // (columns_per_table + 1), 1)):
+            count = min(max(BATCH_SIZE // (columns_per_table + 1), 1), num_tables - start)
+            batch_tables = [node("Table", tags=[TAG] if self.rng.random() < 0.01 else []) for _ in range(count)]
+            batch_columns = {table.id: [node("Column") for _ in range(columns_per_table)] for table in batch_tables}
+            nodes = Node._base_manager.bulk_create(
+                [*batch_tables, *(column for table_columns in batch_columns.values() for column in table_columns)]
+            )
+            # Through rows are created directly so the graph cache isn't updated by the m2m signal
+            Source.nodes.through.objects.bulk_create(
+                [Source.nodes.through(source_id=source.id, node_id=node.id) for node in nodes]
+            )
+
+            Edge._base_manager.bulk_create(
+                [
+                    edge(table_id, column.id, "TableToColumn")
+                    for table_id, table_columns in batch_columns.items()
+                    for column in table_columns
+                ]
+            )
+            tables.extend(table.id for table in batch_tables)
+            columns.update({table_id: [column.id for column in cols] for table_id, cols in batch_columns.items()})
+            node_tqdm.update(len(nodes))
+
+        lineage_edges = []
+        for index, table_id in enumerate(tables[1:], start=1):
+            upstream = self.rng.randint(1, self.options["upstream"])
+            for upstream_id in {tables[self.rng.randrange(index)] for _ in range(upstream)}:
+                lineage_edges.append(edge(upstream_id, table_id, "TableToTable"))
+                if columns_per_table:
+                    column_pair = self.rng.choice(columns[upstream_id]), self.rng.choice(columns[table_id])
+                    lineage_edges.append(edge(*column_pair, "ColumnToColumn"))
+
+        for start in range(0, len(lineage_edges), BATCH_SIZE):
+            Edge._base_manager.bulk_create(lineage_edges[start : start + BATCH_SIZE])
+
+        edge_ids = Edge.objects.filter(workspace=workspace).values_list("id", flat=True).iterator(chunk_size=BATCH_SIZE)
+        Source.edges.through.objects.bulk_create(
+            (Source.edges.through(source_id=source.id, edge_id=edge_id) for edge_id in edge_ids), batch_size=BATCH_SIZE
+        )
+        return workspace
+
+    def timed(self, fn: Callable, repeat: int | None = None) -> Dict[str, float]:
+        latencies = []
+        for _ in range(repeat or self.options["repeat"]):
+            start = time.perf_counter()
+            fn()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        return {
+            "runs": len(latencies),
+            "min_ms": round(min(latencies), 3),
+            "p50_ms": round(statistics.median(latencies), 3),
+            "p95_ms": round(statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0], 3),
+        }
+
+    def benchmark_workspace(self, organisation: Organisation, size: int) -> Dict:
+        start = time.perf_counter()
+        workspace = self.seed_workspace(organisation, size)
+        seed_seconds = time.perf_counter() - start
+
+        timings = {"table_lineage_rebuild": self.timed(lambda: refresh_table_lineage(workspace.id), repeat=1)}
+
+        tables = list(Node.objects.filter(workspace=workspace, metadata__grai__node_type="Table").order_by("?")[:100])
+        sample = [self.rng.choice(tables) for _ in range(self.options["repeat"])]
+
+        def source_tables():
+            table = Node.objects.prefetch_related(
+                Prefetch(
+                    "downstream_lineage",
+                    queryset=TableLineage.objects.select_related("destination"),
+                    to_attr="downstream_list",
+                )
+            ).get(id=sample.pop().id)
+            return [lineage.destination for lineage in table.downstream_list]
+
+        timings["table_source_tables"] = self.timed(source_tables)
+        timings["get_ascestor_ids_by_tag"] = self.timed(lambda: get_ascestor_ids_by_tag(TAG), repeat=3)
+
+        source_graph = WorkspaceType.source_graph.base_resolver.wrapped_func
+
+        async def resolve_source_graph():
+            return await source_graph(workspace)
+
+        timings["workspace_source_graph"] = self.timed(async_to_sync(resolve_source_graph), repeat=3)
+        timings.update(self.benchmark_update(workspace))
+
+        if self.options["graph_cache"]:
+            timings.update(self.benchmark_graph_cache(workspace, tables))
+
+        return {
+            "size": size,
+            "nodes": Node.objects.filter(workspace=workspace).count(),
+            "edges": Edge.objects.filter(workspace=workspace).count(),
+            "table_lineage": TableLineage.objects.filter(workspace=workspace).count(),
+            "seed_seconds": round(seed_seconds, 3),
+            "timings": timings,
+            "plans": check_plans(tables[0]),
+        }
+
+    def benchmark_update(self, workspace: Workspace) -> Dict:
+        """Times an update from a fresh source creating nodes, then the same update again with nothing changed"""
+        source = Source.objects.create(name=f"benchmark-update-{uuid.uuid4()}", workspace=workspace)
+        items = [
+            SourcedNodeV1.from_spec(
+                {
+                    "name": str(uuid.uuid4()),
+                    "namespace": "benchmark-update",
+                    "workspace": workspace.id,
+                    "metadata": {"grai": {"node_type": "Generic"}},
+                    "data_source": {"name": source.name},
+                }
+            )
+            for _ in range(self.options["update_size"])
+        ]
+
+        return {
+            "update_new": self.timed(lambda: update(workspace, source, items), repeat=1),
+            "update_unchanged": self.timed(lambda: update(workspace, source, items), repeat=3),
+        }
+
+    def benchmark_graph_cache(self, workspace: Workspace, tables: List[Node]) -> Dict:
+        cache = ExtendedGraphCache(workspace)
+        try:
+            for node in Node.objects.filter(workspace=workspace).iterator(chunk_size=BATCH_SIZE):
+                cache.cache_node(node)
+            for edge in Edge.objects.filter(workspace=workspace).iterator(chunk_size=BATCH_SIZE):
+                cache.cache_edge(edge)
+
+            table_id = str(tables[0].id)
+            return {
+                "graph_cache_table_ids": self.timed(cache.get_table_ids, repeat=3),
+                "graph_cache_tables": self.timed(cache.get_tables),
+                "graph_cache_table_edges": self.timed(cache.get_table_edges, repeat=3),
+                "graph_cache_table_graph": self.timed(lambda: cache.get_table_filtered_graph_result(table_id, 1)),
+            }
+        finally:
+            cache.clear_cache()
@@ -0,0 +1,94 @@
+import statistics
+import time
+import uuid
+
+import numpy as np
+from django.core.management.base import CommandParser
+from django.db import transaction
+from django_tqdm import BaseCommand
+from pgvector.django import MaxInnerProduct
+
+from lineage.managers import local_setting
+from lineage.models import Node, NodeEmbeddings
+from workspaces.models import Organisation, Workspace
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark workspace scoped vector search latency and recall against synthetic tenants"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+        parser.add_argument("--queries", type=int, default=50)
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument("--dimensions", type=int, default=1536)
+
+    def handle(self, *args, **options) -> None:
+        self.rng = np.random.default_rng(0)
+        self.dimensions = options["dimensions"]
+
+        # Everything is seeded inside a transaction which is always rolled back
+        try:
+            with transaction.atomic():
+                organisation = Organisation.objects.create(name=f"benchmark-{uuid.uuid4()}")
+                workspaces = [self.seed_workspace(organisation, size) for size in options["sizes"]]
+                for workspace, size in zip(workspaces, options["sizes"]):
+                    self.benchmark_workspace(workspace, size, options["queries"], options["limit"])
+                raise Rollback()
+        except Rollback:
+            pass
+
+    def random_vectors(self, n: int) -> np.ndarray:
+        vectors = self.rng.normal(size=(n, self.dimensions))
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def seed_workspace(self, organisation: Organisation, size: int) -> Workspace:
+        workspace = Workspace.objects.create(name=f"benchmark-{size}", organisation=organisation)
+        node_tqdm = self.tqdm(total=size, desc=f"Seeding {size} embeddings")
+
+        for start in range(0, size, 5000):
+            count = min(5000, size - start)
+            # The base manager skips the graph cache bookkeeping done by the default manager
+            nodes = Node._base_manager.bulk_create(
+                [Node(name=str(uuid.uuid4()), namespace="benchmark", workspace=workspace) for _ in range(count)]
+            )
+            NodeEmbeddings.objects.bulk_create(
+                [
+                    NodeEmbeddings(node=node, workspace=workspace, embedding=vector.tolist())
+                    for node, vector in zip(nodes, self.random_vectors(count))
+                ]
+            )
+            node_tqdm.update(count)
+
+        return workspace
+
+    def exact_neighbors(self, workspace: Workspace, vector: list[float], limit: int) -> set:
+        queryset = NodeEmbeddings.objects.filter(workspace=workspace).order_by(MaxInnerProduct("embedding", vector))
+        with local_setting("enable_indexscan", "off"):
+            return set(queryset.values_list("node_id", flat=True)[:limit])
+
+    def benchmark_workspace(self, workspace: Workspace, size: int, queries: int, limit: int):
+        latencies = []
+        recalls = []
+
+        for vector in self.random_vectors(queries):
+            vector = vector.tolist()
+
+            start = time.perf_counter()
+            results = NodeEmbeddings.objects.nearest_neighbors(workspace.id, vector, limit)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            expected = self.exact_neighbors(workspace, vector, limit)
+            found = {result.node_id for result in results}
+            recalls.append(len(found & expected) / max(len(expected), 1))
+
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else p50
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{size} embeddings: p50 {p50:.1f}ms, p95 {p95:.1f}ms, recall@{limit} {statistics.mean(recalls):.3f}"
+            )
+        )
@@ -1,17 +1,22 @@
+import math
 import uuid
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Sequence
 
+from django.conf import settings
 from django.core.cache import cache
-from django.db import models
+from django.db import connection, models, transaction
 from django_multitenant.models import TenantManagerMixin
+from pgvector.django import MaxInnerProduct
 from psqlextra.manager import PostgresManager
 
 from lineage.tasks import EmbeddingTaskStatus, update_node_vector_index
 
 from .graph_cache import GraphCache
+from .table_lineage import closure_depth, refresh_table_lineage
 
 if TYPE_CHECKING:
-    from lineage.models import Node
+    from lineage.models import Node, NodeEmbeddings
 
 
 class CacheManager(TenantManagerMixin, models.Manager):
@@ -60,6 +65,128 @@ class CacheManager(TenantManagerMixin, models.Manager):
         return result
 
 
+class EdgeManager(CacheManager):
+    @staticmethod
+    def update_table_lineage(objs: list):
+        node_ids = {node_id for obj in objs for node_id in (obj.source_id, obj.destination_id)}
+        refresh_table_lineage(objs[0].workspace_id, node_ids)
+
+    def bulk_create(self, objs: Iterable[Any], batch_size: int | None = None, **kwargs) -> List:
+        objs = list(objs)
+        result = super().bulk_create(objs, batch_size=batch_size, **kwargs)
+
+        if len(objs) > 0:
+            self.update_table_lineage(objs)
+
+        return result
+
+    def bulk_update(self, objs: Iterable[Any], fields: Sequence[str], **kwargs) -> int:
+        objs = list(objs)
+        result = super().bulk_update(objs, fields, **kwargs)
+
+        if len(objs) > 0:
+            self.update_table_lineage(objs)
+
+        return result
+
+
+LINEAGE_TRAVERSAL = """WITH RECURSIVE traversal(node_id, depth) AS (
+      SELECT %(node_id)s::uuid, 0
+    UNION
+      SELECT lineage.{next}, traversal.depth + 1
+      FROM traversal
+      INNER JOIN public.lineage_tablelineage lineage
+        ON lineage.{previous} = traversal.node_id AND lineage.workspace_id = %(workspace_id)s
+      WHERE traversal.depth < %(depth)s
+    )
+SELECT node_id, min(depth) FROM traversal WHERE depth > 0 GROUP BY node_id"""
+
+LINEAGE_REACHABLE = """WITH RECURSIVE traversal(node_id) AS (
+      SELECT lineage.destination_id
+      FROM public.lineage_tablelineage lineage
+      WHERE lineage.source_id = %(node_id)s::uuid AND lineage.workspace_id = %(workspace_id)s
+    UNION
+      SELECT lineage.destination_id
+      FROM traversal
+      INNER JOIN public.lineage_tablelineage lineage
+        ON lineage.source_id = traversal.node_id AND lineage.workspace_id = %(workspace_id)s
+    )
+SELECT 1 FROM traversal WHERE node_id = %(other_id)s::uuid LIMIT 1"""
+
+
+class TableLineageManager(TenantManagerMixin, models.Manager):
+    """Reads of the table lineage index.
+
+    Immediate neighbours are always a single index lookup. Deeper lookups read the closure index when it's maintained
+    to at least the requested depth and otherwise walk the adjacency index in one recursive query.
+    """
+
+    def downstream(self, workspace_id: uuid.UUID | str, table_id: uuid.UUID | str, depth: int = 1) -> dict:
+        """The tables `table_id` flows into within `depth` hops mapped to their distance"""
+        return self.traverse(workspace_id, table_id, depth, downstream=True)
+
+    def upstream(self, workspace_id: uuid.UUID | str, table_id: uuid.UUID | str, depth: int = 1) -> dict:
+        """The tables flowing into `table_id` within `depth` hops mapped to their distance"""
+        return self.traverse(workspace_id, table_id, depth, downstream=False)
+
+    def is_upstream(
+        self,
+        workspace_id: uuid.UUID | str,
+        table_id: uuid.UUID | str,
+        other_id: uuid.UUID | str,
+        depth: int | None = None,
+    ) -> bool:
+        """Whether data flows from `table_id` into `other_id`, within `depth` hops if given.
+
+        The closure index only holds paths up to its configured depth so an unbounded lookup it doesn't answer falls
+        back to walking the adjacency index.
+        """
+        if depth == 1:
+            return self.filter(workspace_id=workspace_id, source_id=table_id, destination_id=other_id).exists()
+
+        max_depth = closure_depth()
+        if max_depth > 0:
+            from lineage.models import TableLineageClosure
+
+            query = TableLineageClosure.objects.filter(
+                workspace_id=workspace_id, ancestor_id=table_id, descendant_id=other_id
+            )
+            if depth is not None and depth <= max_depth:
+                return query.filter(depth__lte=depth).exists()
+            elif query.exists():
+                return True
+
+        if depth is not None:
+            return str(other_id) in self.downstream(workspace_id, table_id, depth)
+
+        params = {"workspace_id": str(workspace_id), "node_id": str(table_id), "other_id": str(other_id)}
+        with connection.cursor() as cursor:
+            cursor.execute(LINEAGE_REACHABLE, params)
+            return cursor.fetchone() is not None
+
+    def traverse(self, workspace_id: uuid.UUID | str, table_id: uuid.UUID | str, depth: int, downstream: bool) -> dict:
+        this, other = ("source", "destination") if downstream else ("destination", "source")
+
+        if depth == 1:
+            query = self.filter(workspace_id=workspace_id, **{this: table_id}).values_list(f"{other}_id", flat=True)
+            return {str(node_id): 1 for node_id in query}
+
+        if 1 < depth <= closure_depth():
+            from lineage.models import TableLineageClosure
+
+            this, other = ("ancestor", "descendant") if downstream else ("descendant", "ancestor")
+            query = TableLineageClosure.objects.filter(
+                workspace_id=workspace_id, depth__lte=depth, **{this: table_id}
+            ).values_list(f"{other}_id", "depth")
+            return {str(node_id): distance for node_id, distance in query}
+
+        sql = LINEAGE_TRAVERSAL.format(next=f"{other}_id", previous=f"{this}_id")
+        params = {"workspace_id": str(workspace_id), "node_id": str(table_id), "depth": depth}
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return {str(node_id): distance for node_id, distance in cursor.fetchall()}
+
+
 class NodeEmbeddingManager(models.Manager):
     @staticmethod
     def obj_generator(objs: Iterable["Node"], task_id: uuid.UUID) -> Iterator["Node"]:
@@ -86,6 +213,82 @@ class NodeEmbeddingManager(models.Manager):
         return result
 
 
+# The largest `hnsw.ef_search` pgvector accepts
+HNSW_MAX_EF_SEARCH = 1000
+
+
+@contextmanager
+def local_setting(name: str, value: str) -> Iterator[None]:
+    """Overrides a postgres setting for the queries run inside the block.
+
+    `SET LOCAL` alone would last until the outermost transaction commits, so the previous value is restored on exit
+    in case this is nested inside a larger transaction.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting(%s, true)", [name])
+        previous = cursor.fetchone()[0]
+        cursor.execute("SELECT set_config(%s, %s, true)", [name, value])
+        try:
+            yield
+        finally:
+            if previous is not None:
+                cursor.execute("SELECT set_config(%s, %s, true)", [name, previous])
+
+
+class NodeEmbeddingSearchManager(models.Manager):
+    count_cache_timeout = 60 * 10
+
+    def cached_count(self, workspace_id: uuid.UUID | str | None = None) -> int:
+        cache_key = f"lineage:NodeEmbeddings:count:{workspace_id or 'all'}"
+        if (count := cache.get(cache_key, None)) is None:
+            queryset = self.all() if workspace_id is None else self.filter(workspace_id=workspace_id)
+            count = queryset.count()
+            cache.set(cache_key, count, timeout=self.count_cache_timeout)
+        return count
+
+    @staticmethod
+    def get_ef_search(limit: int, workspace_count: int, total_count: int) -> int | None:
+        """The HNSW candidate list size needed to leave roughly `limit` results after the workspace filter.
+
+        The HNSW scan visits vectors from every workspace so the candidate list is scaled by the inverse of the
+        workspace's share of all embeddings, bounded below by the configured recall setting. Returns None when that
+        exceeds pgvector's maximum, as the filtered scan could no longer fill `limit` results.
+        """
+        expected = math.ceil(2 * limit * total_count / max(workspace_count, 1))
+        if expected > HNSW_MAX_EF_SEARCH:
+            return None
+        return max(expected, settings.VECTOR_SEARCH_EF_SEARCH)
+
+    def nearest_neighbors(
+        self, workspace_id: uuid.UUID | str, vector: list[float], limit: int = 10
+    ) -> list["NodeEmbeddings"]:
+        """Returns the `limit` embeddings in a workspace with the largest inner product with `vector`.
+
+        Small workspaces are searched exactly through the workspace index, which is both faster and has perfect
+        recall. Larger workspaces use the HNSW index with an `ef_search` sized to the workspace's share of vectors,
+        unless that share is too small for any `ef_search` pgvector allows.
+        """
+        workspace_count = self.cached_count(workspace_id)
+        queryset = (
+            self.filter(workspace_id=workspace_id)
+            .order_by(MaxInnerProduct("embedding", vector))
+            .select_related("node")[:limit]
+        )
+
+        ef_search = None
+        if workspace_count > settings.VECTOR_SEARCH_EXACT_THRESHOLD:
+            ef_search = self.get_ef_search(limit, workspace_count, self.cached_count())
+
+        if ef_search is None:
+            # hnsw doesn't support bitmap scans so this leaves only the workspace index available
+            setting = local_setting("enable_indexscan", "off")
+        else:
+            setting = local_setting("hnsw.ef_search", str(ef_search))
+
+        with setting:
+            return list(queryset)
+
+
 class NodeManager(CacheManager):  # (NodeEmbeddingManager, CacheManager):
     pass
 
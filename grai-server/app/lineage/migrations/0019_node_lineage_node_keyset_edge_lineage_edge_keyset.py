@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lineage", "0018_nodeembeddings"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="node",
+            index=models.Index(fields=["workspace", "created_at", "id"], name="lineage_node_keyset"),
+        ),
+        migrations.AddIndex(
+            model_name="edge",
+            index=models.Index(fields=["workspace", "created_at", "id"], name="lineage_edge_keyset"),
+        ),
+    ]
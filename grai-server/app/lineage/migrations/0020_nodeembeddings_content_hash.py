@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 10:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lineage", "0019_node_lineage_node_keyset_edge_lineage_edge_keyset"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="nodeembeddings",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("workspaces", "0009_alter_workspace_ai_enabled"),
+        ("lineage", "0020_nodeembeddings_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="nodeembeddings",
+            name="workspace",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="workspaces.workspace",
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE lineage_nodeembeddings e
+                SET workspace_id = n.workspace_id
+                FROM lineage_node n
+                WHERE e.node_id = n.id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("lineage", "0021_nodeembeddings_workspace"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="edge",
+            name="content_digest",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name="node",
+            name="content_digest",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
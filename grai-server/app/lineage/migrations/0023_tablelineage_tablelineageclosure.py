@@ -0,0 +1,116 @@
+# Generated by Django 4.2.7 on 2026-10-19 21:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def forwards_func(apps, schema_editor):
+    from lineage.table_lineage import adjacency_query, closure_depth, closure_query
+
+    Workspace = apps.get_model("workspaces", "Workspace")
+
+    with schema_editor.connection.cursor() as cursor:
+        for workspace_id in Workspace.objects.values_list("id", flat=True):
+            params = {"workspace_id": str(workspace_id), "node_ids": None, "max_depth": closure_depth()}
+            cursor.execute(adjacency_query(rebuild=True), params)
+            if params["max_depth"] > 0:
+                cursor.execute(closure_query(rebuild=True), params)
+
+
+def reverse_func(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("workspaces", "0009_alter_workspace_ai_enabled"),
+        ("lineage", "0022_node_content_digest_edge_content_digest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TableLineage",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "destination",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upstream_lineage",
+                        to="lineage.node",
+                    ),
+                ),
+                (
+                    "source",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="downstream_lineage",
+                        to="lineage.node",
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="table_lineage",
+                        to="workspaces.workspace",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["workspace", "destination", "source"], name="table_lineage_destination")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="TableLineageClosure",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_lineage",
+                        to="lineage.node",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_lineage",
+                        to="lineage.node",
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="table_lineage_closure",
+                        to="workspaces.workspace",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["workspace", "ancestor", "depth"], name="lineage_closure_ancestor"),
+                    models.Index(fields=["workspace", "descendant", "depth"], name="lineage_closure_descendant"),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="tablelineage",
+            constraint=models.UniqueConstraint(
+                fields=("workspace", "source", "destination"), name="table_lineage_uniqueness"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="tablelineageclosure",
+            constraint=models.UniqueConstraint(
+                fields=("workspace", "ancestor", "descendant"), name="table_lineage_closure_uniqueness"
+            ),
+        ),
+        migrations.RunPython(forwards_func, reverse_func),
+    ]
@@ -4,6 +4,7 @@ from django.conf import settings
 from django.db import models
 from django.db.models import F, Q
 from django_multitenant.models import TenantModel
+from grai_schemas.digest import spec_digest
 from grai_schemas.serializers import GraiEncoder
 from pgvector.django import HnswIndex, VectorField
 
@@ -11,7 +12,14 @@ from lineage.tasks import update_node_vector_index
 
 from .graph_cache import GraphCache
 from .graph_tasks import cache_edge, cache_node
-from .managers import CacheManager, NodeManager, SourceManager
+from .managers import (
+    EdgeManager,
+    NodeEmbeddingSearchManager,
+    NodeManager,
+    SourceManager,
+    TableLineageManager,
+)
+from .table_lineage import refresh_table_lineage
 
 
 class Node(TenantModel):
@@ -23,6 +31,7 @@ class Node(TenantModel):
     display_name = models.TextField()
     metadata = models.JSONField(default=dict, encoder=GraiEncoder)
     is_active = models.BooleanField(default=True)
+    content_digest = models.CharField(max_length=64, blank=True, null=True)
 
     workspace = models.ForeignKey(
         "workspaces.Workspace",
@@ -55,7 +64,9 @@ class Node(TenantModel):
 
     def save(self, *args, **kwargs):
         self.set_names()
+        self.set_content_digest()
         super().save(*args, **kwargs)
+        # The cached data source comes from the node's sources which the digest doesn't cover
         self.cache_model()
 
     def delete(self, *args, **kwargs):
@@ -67,6 +78,10 @@ class Node(TenantModel):
             self.display_name = self.name
         return self
 
+    def set_content_digest(self):
+        self.content_digest = spec_digest(self.name, self.namespace, self.display_name, self.is_active, self.metadata)
+        return self
+
     def cache_model(self, cache: GraphCache | None = None, delete: bool = False):
         if cache:
             cache.cache_node(self)
@@ -93,16 +108,28 @@ class Node(TenantModel):
                 models.F("metadata__grai__node_type"),
                 name="lineage_node_type",
             ),
+            models.Index(fields=["workspace", "created_at", "id"], name="lineage_node_keyset"),
         ]
 
 
 class NodeEmbeddings(models.Model):
+    objects = NodeEmbeddingSearchManager()
+
     embedding = VectorField(dimensions=1536)
     node = models.OneToOneField(
         Node,
         on_delete=models.CASCADE,
         primary_key=True,
     )
+    # Denormalised from the node so searches can filter by workspace without joining every candidate vector
+    workspace = models.ForeignKey(
+        "workspaces.Workspace",
+        related_name="+",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+    )
+    content_hash = models.CharField(max_length=64, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -125,7 +152,7 @@ class NodeEmbeddings(models.Model):
 
 
 class Edge(TenantModel):
-    objects = CacheManager()
+    objects = EdgeManager()
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.TextField()
@@ -133,6 +160,7 @@ class Edge(TenantModel):
     display_name = models.TextField()
     metadata = models.JSONField(default=dict, encoder=GraiEncoder)
     is_active = models.BooleanField(default=True)
+    content_digest = models.CharField(max_length=64, blank=True, null=True)
 
     source = models.ForeignKey("Node", related_name="source_edges", on_delete=models.PROTECT)
     destination = models.ForeignKey("Node", related_name="destination_edges", on_delete=models.PROTECT)
@@ -147,14 +175,41 @@ class Edge(TenantModel):
     updated_at = models.DateTimeField(auto_now=True)
     # created_by = models.OneToOneField("users.User", on_delete=models.PROTECT)
 
+    # The endpoints and edge type the edge was loaded with, None for a new edge
+    loaded_endpoints: tuple | None = None
+    loaded_edge_type: str | None = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.loaded_endpoints = (instance.__dict__.get("source_id"), instance.__dict__.get("destination_id"))
+        if "metadata" in instance.__dict__:
+            instance.loaded_edge_type = instance.edge_type()
+        return instance
+
+    def edge_type(self) -> str | None:
+        return self.metadata.get("grai", {}).get("edge_type")
+
     def save(self, *args, **kwargs):
         self.set_names()
+        previous_digest = self.content_digest
+        previous_endpoints = self.loaded_endpoints
+        self.set_content_digest()
         super().save(*args, **kwargs)
-        self.cache_model()
+        endpoints = (self.source_id, self.destination_id)
+        # Saving an unchanged object leaves the graph cache as it was, the digest doesn't cover the endpoints
+        if self.content_digest != previous_digest or endpoints != previous_endpoints:
+            self.cache_model()
+        # Table lineage depends only on the endpoints and edge type, a moved edge also changes its old endpoints
+        if endpoints != previous_endpoints or self.edge_type() != self.loaded_edge_type:
+            node_ids = {*endpoints, *(previous_endpoints or ())}
+            refresh_table_lineage(self.workspace_id, [id for id in node_ids if id is not None])
+        self.loaded_endpoints, self.loaded_edge_type = endpoints, self.edge_type()
 
     def delete(self, *args, **kwargs):
         super().delete(*args, **kwargs)
         self.cache_model(delete=True)
+        refresh_table_lineage(self.workspace_id, [self.source_id, self.destination_id])
 
     def set_names(self):
         if not self.name:
@@ -163,6 +218,10 @@ class Edge(TenantModel):
             self.display_name = self.name
         return self
 
+    def set_content_digest(self):
+        self.content_digest = spec_digest(self.name, self.namespace, self.display_name, self.is_active, self.metadata)
+        return self
+
     def cache_model(self, cache: GraphCache = None, delete: bool = False):
         if cache:
             cache.cache_edge(self)
@@ -195,6 +254,7 @@ class Edge(TenantModel):
             models.Index(fields=["workspace", "is_active"]),
             models.Index(fields=["workspace", "namespace", "name"]),
             models.Index(fields=["workspace", "source", "destination"]),
+            models.Index(fields=["workspace", "created_at", "id"], name="lineage_edge_keyset"),
             models.Index(
                 "workspace",
                 models.F("metadata__grai__edge_type"),
@@ -213,6 +273,66 @@ class Edge(TenantModel):
         ]
 
 
+class TableLineage(TenantModel):
+    """Data flowing from the `source` table into the `destination` table, maintained from edges by `table_lineage`"""
+
+    objects = TableLineageManager()
+
+    id = models.BigAutoField(primary_key=True)
+    source = models.ForeignKey("Node", related_name="downstream_lineage", on_delete=models.CASCADE)
+    destination = models.ForeignKey("Node", related_name="upstream_lineage", on_delete=models.CASCADE)
+
+    workspace = models.ForeignKey(
+        "workspaces.Workspace",
+        related_name="table_lineage",
+        on_delete=models.CASCADE,
+    )
+
+    class TenantMeta:
+        tenant_field_name = "workspace_id"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["workspace", "source", "destination"],
+                name="table_lineage_uniqueness",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["workspace", "destination", "source"], name="table_lineage_destination"),
+        ]
+
+
+class TableLineageClosure(TenantModel):
+    """Every table `descendant` reachable from `ancestor` within `TABLE_LINEAGE_CLOSURE_DEPTH` hops"""
+
+    id = models.BigAutoField(primary_key=True)
+    ancestor = models.ForeignKey("Node", related_name="descendant_lineage", on_delete=models.CASCADE)
+    descendant = models.ForeignKey("Node", related_name="ancestor_lineage", on_delete=models.CASCADE)
+    depth = models.PositiveSmallIntegerField()
+
+    workspace = models.ForeignKey(
+        "workspaces.Workspace",
+        related_name="table_lineage_closure",
+        on_delete=models.CASCADE,
+    )
+
+    class TenantMeta:
+        tenant_field_name = "workspace_id"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["workspace", "ancestor", "descendant"],
+                name="table_lineage_closure_uniqueness",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["workspace", "ancestor", "depth"], name="lineage_closure_ancestor"),
+            models.Index(fields=["workspace", "descendant", "depth"], name="lineage_closure_descendant"),
+        ]
+
+
 class Filter(TenantModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(
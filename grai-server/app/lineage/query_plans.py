@@ -0,0 +1,130 @@
+"""`EXPLAIN` checks that the lineage hot paths are served by their indexes.
+
+Each entry of `INDEXED_QUERIES` builds a query the server runs on a hot path and names the tables which must never be
+read with a sequential scan to answer it. Plans are produced with `enable_seqscan` off, so a sequential scan only
+appears when no usable index exists. The check doesn't depend on the size of the workspace, which lets it run against
+a small test database as well as a seeded benchmark workspace.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+from django.db import connection
+from django.db.models import QuerySet
+
+from .managers import local_setting
+from .models import Edge, Node, TableLineage
+from .table_lineage import adjacency_query
+
+Query = Tuple[str, Any]
+
+
+class PlanCheck(NamedTuple):
+    build: Callable[[Node], Query]
+    tables: Tuple[str, ...]
+
+
+def queryset_sql(queryset: QuerySet) -> Query:
+    return queryset.query.sql_with_params()
+
+
+def explain(sql: str, params: Any = ()) -> Dict:
+    """The root node of a query's JSON plan"""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    # Some drivers leave the JSON as text
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def plan_nodes(plan: Dict) -> Iterator[Dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def sequential_scans(plan: Dict, tables: Sequence[str] = ()) -> List[str]:
+    """The tables a plan reads with a sequential scan, limited to `tables` if given"""
+    return [
+        node["Relation Name"]
+        for node in plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan" and (not tables or node["Relation Name"] in tables)
+    ]
+
+
+def index_names(plan: Dict) -> List[str]:
+    """The indexes a plan reads"""
+    return sorted({node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node})
+
+
+def table_columns(table: Node) -> Query:
+    return queryset_sql(Edge.objects.filter(metadata__grai__edge_type="TableToColumn", source=table))
+
+
+def column_tables(table: Node) -> Query:
+    return queryset_sql(Edge.objects.filter(metadata__grai__edge_type="TableToColumn", destination=table))
+
+
+def nodes_by_type(table: Node) -> Query:
+    return queryset_sql(Node.objects.filter(workspace_id=table.workspace_id, metadata__grai__node_type="Table"))
+
+
+def nodes_by_name(table: Node) -> Query:
+    return queryset_sql(
+        Node.objects.filter(workspace_id=table.workspace_id, namespace=table.namespace, name=table.name)
+    )
+
+
+def nodes_page(table: Node) -> Query:
+    queryset = Node.objects.filter(workspace_id=table.workspace_id, created_at__gt=table.created_at)
+    return queryset_sql(queryset.order_by("created_at", "id")[:100])
+
+
+def source_tables(table: Node) -> Query:
+    return queryset_sql(TableLineage.objects.filter(source_id__in=[table.id]).select_related("destination"))
+
+
+def destination_tables(table: Node) -> Query:
+    return queryset_sql(TableLineage.objects.filter(destination_id__in=[table.id]).select_related("source"))
+
+
+def table_lineage_refresh(table: Node) -> Query:
+    params = {"workspace_id": str(table.workspace_id), "node_ids": [str(table.id)]}
+    return adjacency_query(rebuild=False), params
+
+
+INDEXED_QUERIES: Dict[str, PlanCheck] = {
+    "table_columns": PlanCheck(table_columns, ("lineage_edge",)),
+    "column_tables": PlanCheck(column_tables, ("lineage_edge",)),
+    "nodes_by_type": PlanCheck(nodes_by_type, ("lineage_node",)),
+    "nodes_by_name": PlanCheck(nodes_by_name, ("lineage_node",)),
+    "nodes_page": PlanCheck(nodes_page, ("lineage_node",)),
+    "source_tables": PlanCheck(source_tables, ("lineage_tablelineage", "lineage_node")),
+    "destination_tables": PlanCheck(destination_tables, ("lineage_tablelineage", "lineage_node")),
+    "table_lineage_refresh": PlanCheck(table_lineage_refresh, ("lineage_edge", "lineage_tablelineage")),
+}
+
+
+def check_plans(table: Node) -> Dict[str, Dict[str, List[str]]]:
+    """Explains every indexed hot path query for a table
+
+    Args:
+        table: A table node whose workspace the queries run against
+
+    Returns:
+        The sequential scans and the indexes of each query's plan, keyed by query name
+    """
+    results = {}
+    with local_setting("enable_seqscan", "off"):
+        for name, check in INDEXED_QUERIES.items():
+            plan = explain(*check.build(table))
+            results[name] = {"seq_scans": sequential_scans(plan, check.tables), "indexes": index_names(plan)}
+    return results
+
+
+def plan_failures(results: Dict[str, Dict[str, List[str]]]) -> Dict[str, List[str]]:
+    """The queries of `check_plans` which fell back to a sequential scan"""
+    return {name: result["seq_scans"] for name, result in results.items() if result["seq_scans"]}
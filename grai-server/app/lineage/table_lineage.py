@@ -0,0 +1,165 @@
+"""Maintenance of the table level lineage index.
+
+`lineage_tablelineage` holds one row for every pair of tables where data flows from `source` into `destination`:
+
+* every edge which isn't a `TableToColumn` or `ColumnToColumn` edge e.g. `TableToTable` edges
+* every edge out of a column lifted to the tables owning each end through their `TableToColumn` edges
+
+which are the same relationships `Table.source_tables` and `Table.destination_tables` used to assemble from four
+levels of nested prefetches. When `TABLE_LINEAGE_CLOSURE_DEPTH` is set, `lineage_tablelineageclosure` additionally
+holds every pair of tables within that many hops of one another along with the length of the shortest path.
+
+Both are maintained incrementally. A changed edge can only alter index rows involving its own endpoints or the tables
+owning them, so only the rows touching those tables are recomputed, and only the closure rows of their ancestors.
+"""
+
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db import connection, transaction
+
+# Matches the expression of the `lineage_edge_type_*` indexes as Django compiles `metadata__grai__edge_type`
+IS_TABLE_TO_COLUMN = "({alias}.metadata #> ARRAY['grai', 'edge_type']) = '\"TableToColumn\"'::jsonb"
+IS_LINEAGE_EDGE = (
+    "({alias}.metadata #> ARRAY['grai', 'edge_type']) IS DISTINCT FROM '\"TableToColumn\"'::jsonb"
+    " AND ({alias}.metadata #> ARRAY['grai', 'edge_type']) IS DISTINCT FROM '\"ColumnToColumn\"'::jsonb"
+)
+IS_COLUMN_EDGE = "({alias}.metadata #> ARRAY['grai', 'edge_type']) IS DISTINCT FROM '\"TableToColumn\"'::jsonb"
+
+DIRECT_PAIRS = f"""
+    SELECT edges.source_id, edges.destination_id
+    FROM public.lineage_edge edges
+    WHERE edges.workspace_id = %(workspace_id)s AND {IS_LINEAGE_EDGE.format(alias="edges")} {{condition}}"""
+
+LIFTED_PAIRS = f"""
+    SELECT source_table.source_id, destination_table.source_id
+    FROM public.lineage_edge source_table
+    INNER JOIN public.lineage_edge edges
+      ON edges.source_id = source_table.destination_id AND {IS_COLUMN_EDGE.format(alias="edges")}
+    INNER JOIN public.lineage_edge destination_table
+      ON destination_table.destination_id = edges.destination_id
+      AND {IS_TABLE_TO_COLUMN.format(alias="destination_table")}
+    WHERE source_table.workspace_id = %(workspace_id)s
+      AND {IS_TABLE_TO_COLUMN.format(alias="source_table")} {{condition}}"""
+
+TOUCHED_TABLES = f"""touched(id) AS (
+      SELECT unnest(%(node_ids)s::uuid[])
+    UNION
+      SELECT owners.source_id
+      FROM public.lineage_edge owners
+      WHERE owners.destination_id = ANY(%(node_ids)s::uuid[]) AND {IS_TABLE_TO_COLUMN.format(alias="owners")}
+    )"""
+
+REFRESH_ADJACENCY = """WITH {touched}, pairs(source_id, destination_id) AS ({pairs}
+    ), deleted AS (
+      DELETE FROM public.lineage_tablelineage lineage
+      WHERE lineage.workspace_id = %(workspace_id)s {condition}
+        AND NOT EXISTS (
+          SELECT 1 FROM pairs
+          WHERE pairs.source_id = lineage.source_id AND pairs.destination_id = lineage.destination_id
+        )
+    )
+INSERT INTO public.lineage_tablelineage (workspace_id, source_id, destination_id)
+SELECT DISTINCT %(workspace_id)s::uuid, source_id, destination_id FROM pairs
+ON CONFLICT (workspace_id, source_id, destination_id) DO NOTHING"""
+
+REFRESH_CLOSURE = """WITH RECURSIVE {affected}, reach(ancestor_id, descendant_id, depth) AS (
+      SELECT lineage.source_id, lineage.destination_id, 1
+      FROM public.lineage_tablelineage lineage
+      WHERE lineage.workspace_id = %(workspace_id)s {reach_condition}
+    UNION
+      SELECT reach.ancestor_id, lineage.destination_id, reach.depth + 1
+      FROM reach
+      INNER JOIN public.lineage_tablelineage lineage
+        ON lineage.source_id = reach.descendant_id AND lineage.workspace_id = %(workspace_id)s
+      WHERE reach.depth < %(max_depth)s
+    ), paths AS (
+      SELECT ancestor_id, descendant_id, min(depth) AS depth FROM reach GROUP BY ancestor_id, descendant_id
+    ), deleted AS (
+      DELETE FROM public.lineage_tablelineageclosure closure
+      WHERE closure.workspace_id = %(workspace_id)s {delete_condition}
+        AND NOT EXISTS (
+          SELECT 1 FROM paths
+          WHERE paths.ancestor_id = closure.ancestor_id AND paths.descendant_id = closure.descendant_id
+        )
+    )
+INSERT INTO public.lineage_tablelineageclosure (workspace_id, ancestor_id, descendant_id, depth)
+SELECT %(workspace_id)s::uuid, ancestor_id, descendant_id, depth FROM paths
+ON CONFLICT (workspace_id, ancestor_id, descendant_id) DO UPDATE SET depth = EXCLUDED.depth
+WHERE lineage_tablelineageclosure.depth <> EXCLUDED.depth"""
+
+# The ancestors whose reachable tables may have changed. New index rows all touch a table in `touched` so any path
+# through one either reaches a touched table or a new direct predecessor of one through rows which didn't change.
+AFFECTED_ANCESTORS = f"""{TOUCHED_TABLES}, roots(id) AS (
+      SELECT id FROM touched
+    UNION
+      SELECT lineage.source_id
+      FROM public.lineage_tablelineage lineage
+      WHERE lineage.workspace_id = %(workspace_id)s AND lineage.destination_id IN (SELECT id FROM touched)
+    ), affected(id) AS (
+      SELECT id FROM roots
+    UNION
+      SELECT closure.ancestor_id
+      FROM public.lineage_tablelineageclosure closure
+      WHERE closure.workspace_id = %(workspace_id)s AND closure.descendant_id IN (SELECT id FROM roots)
+    )"""
+
+
+def closure_depth() -> int:
+    """The maximum depth of the closure index, 0 when the closure isn't maintained"""
+    return settings.TABLE_LINEAGE_CLOSURE_DEPTH
+
+
+def refresh_table_lineage(workspace_id: UUID | str, node_ids: Optional[Iterable[UUID | str]] = None):
+    """Recomputes the table lineage index rows affected by changes to the edges of `node_ids`.
+
+    Call this after creating, updating, or deleting edges with the endpoints of every changed edge. Passing no
+    `node_ids` rebuilds the workspace's index from scratch.
+
+    Args:
+        workspace_id: The workspace the edges belong to
+        node_ids: The source and destination of each changed edge
+    """
+    if node_ids is not None:
+        node_ids = list({str(node_id) for node_id in node_ids})
+        if not node_ids:
+            return
+
+    params = {"workspace_id": str(workspace_id), "node_ids": node_ids, "max_depth": closure_depth()}
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(adjacency_query(rebuild=node_ids is None), params)
+        if params["max_depth"] > 0:
+            cursor.execute(closure_query(rebuild=node_ids is None), params)
+
+
+def adjacency_query(rebuild: bool) -> str:
+    if rebuild:
+        pairs = "\n    UNION".join([DIRECT_PAIRS.format(condition=""), LIFTED_PAIRS.format(condition="")])
+        return REFRESH_ADJACENCY.format(touched="touched(id) AS (SELECT NULL::uuid)", pairs=pairs, condition="")
+
+    touched = "IN (SELECT id FROM touched)"
+    pairs = "\n    UNION".join(
+        [
+            DIRECT_PAIRS.format(condition=f"AND edges.source_id {touched}"),
+            DIRECT_PAIRS.format(condition=f"AND edges.destination_id {touched}"),
+            LIFTED_PAIRS.format(condition=f"AND source_table.source_id {touched}"),
+            LIFTED_PAIRS.format(condition=f"AND destination_table.source_id {touched}"),
+        ]
+    )
+    condition = f"AND (lineage.source_id {touched} OR lineage.destination_id {touched})"
+    return REFRESH_ADJACENCY.format(touched=TOUCHED_TABLES, pairs=pairs, condition=condition)
+
+
+def closure_query(rebuild: bool) -> str:
+    if rebuild:
+        return REFRESH_CLOSURE.format(
+            affected="affected(id) AS (SELECT NULL::uuid)", reach_condition="", delete_condition=""
+        )
+
+    return REFRESH_CLOSURE.format(
+        affected=AFFECTED_ANCESTORS,
+        reach_condition="AND lineage.source_id IN (SELECT id FROM affected)",
+        delete_condition="AND closure.ancestor_id IN (SELECT id FROM affected)",
+    )
@@ -1,6 +1,7 @@
+import hashlib
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Iterable, Iterator, TypeVar
 from uuid import UUID
 import asyncio
 
@@ -10,7 +11,7 @@ from django_celery_beat.models import PeriodicTask, PeriodicTasks
 from grai_schemas.serializers import GraiYamlSerializer
 
 from celery import shared_task
-from grAI.encoders import Embedder
+from grAI.encoders import BaseEmbedder, Embedder
 
 
 T = TypeVar("T")
@@ -21,6 +22,10 @@ if TYPE_CHECKING:
     from lineage.models import Node
 
 
+# The number of nodes handled by a single `update_node_vector_indexes` task
+EMBEDDING_TASK_BATCH_SIZE = 1000
+
+
 class EmbeddingTaskStatus:
     WAIT = 0
 
@@ -37,12 +42,87 @@ def get_embedded_node_content(node: "Node") -> str:
     return content
 
 
-def create_node_vector_index(node: "Node"):
+def get_content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def batch_embedding_inputs(items: Iterable[tuple[T, str, int]], max_size: int, max_tokens: int) -> Iterator[list]:
+    """Groups (item, content, token count) triples into batches respecting the provider's per request limits"""
+    batch: list[tuple[T, str, int]] = []
+    batch_tokens = 0
+    for item in items:
+        n_tokens = item[2]
+        if batch and (len(batch) >= max_size or batch_tokens + n_tokens > max_tokens):
+            yield batch
+            batch, batch_tokens = [], 0
+
+        batch.append(item)
+        batch_tokens += n_tokens
+
+    if batch:
+        yield batch
+
+
+async def embed_batches(embedder: BaseEmbedder, batches: list[list[tuple[T, str, int]]]) -> list[list[list[float]]]:
+    semaphore = asyncio.Semaphore(embedder.max_concurrency)
+
+    async def embed(batch: list[tuple[T, str, int]]) -> list[list[float]]:
+        async with semaphore:
+            return await embedder.get_embeddings([content for _, content, _ in batch])
+
+    return await asyncio.gather(*(embed(batch) for batch in batches))
+
+
+def create_node_vector_indexes(nodes: Iterable["Node"], embedder: BaseEmbedder | None = None) -> int:
+    """Embeds every node whose content has changed since it was last embedded.
+
+    Nodes are embedded in as few provider requests as the provider's batch limits allow and each batch is written
+    with a single upsert. Returns the number of nodes which were (re)embedded.
+    """
     from lineage.models import NodeEmbeddings
 
-    content = get_embedded_node_content(node)
-    embedding_resp = asyncio.run(Embedder.get_embedding(content))
-    NodeEmbeddings.objects.update_or_create(node=node, embedding=embedding_resp.data[0].embedding)
+    embedder = Embedder if embedder is None else embedder
+
+    nodes = list(nodes)
+    existing_hashes = dict(
+        NodeEmbeddings.objects.filter(node_id__in=[node.id for node in nodes]).values_list("node_id", "content_hash")
+    )
+
+    pending = []
+    for node in nodes:
+        content = get_embedded_node_content(node)
+        content_hash = get_content_hash(content)
+        if existing_hashes.get(node.id, None) == content_hash:
+            continue
+
+        content, n_tokens = embedder.prepare_content(content)
+        obj = NodeEmbeddings(node=node, workspace_id=node.workspace_id, content_hash=content_hash)
+        pending.append((obj, content, n_tokens))
+
+    if not pending:
+        return 0
+
+    batches = list(batch_embedding_inputs(pending, embedder.max_batch_size, embedder.max_batch_tokens))
+    results = asyncio.run(embed_batches(embedder, batches))
+
+    for batch, embeddings in zip(batches, results):
+        objs = []
+        for (obj, _, _), embedding in zip(batch, embeddings):
+            obj.embedding = embedding
+            objs.append(obj)
+
+        NodeEmbeddings.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=["node"],
+            update_fields=["embedding", "workspace", "content_hash", "updated_at"],
+        )
+
+    return len(pending)
+
+
+def create_node_vector_index(node: "Node"):
+    create_node_vector_indexes([node])
 
 
 def get_embedding_task_state(task_id: UUID | None) -> int | None:
@@ -74,6 +154,33 @@ def update_node_vector_index(self, node_id: UUID, task_id: UUID | None = None):
         return
 
 
+@shared_task(bind=True, max_retries=None)
+def update_node_vector_indexes(self, node_ids: list[UUID]):
+    from lineage.models import Node
+
+    logging.info(f"Creating embeddings for {len(node_ids)} nodes")
+
+    nodes = Node.objects.prefetch_related("data_sources").filter(id__in=node_ids)
+    try:
+        create_node_vector_indexes(nodes)
+    except openai.RateLimitError:
+        logging.info(f"Openai rate limit reach retrying in 10 seconds")
+        self.retry(countdown=10)
+        return
+
+
+def enqueue_node_vector_indexes(node_ids: Iterable[UUID], batch_size: int = EMBEDDING_TASK_BATCH_SIZE):
+    batch = []
+    for node_id in node_ids:
+        batch.append(node_id)
+        if len(batch) == batch_size:
+            update_node_vector_indexes.delay(batch)
+            batch = []
+
+    if batch:
+        update_node_vector_indexes.delay(batch)
+
+
 @shared_task
 def bulk_update_embeddings():
     from lineage.models import Node
@@ -81,5 +188,4 @@ def bulk_update_embeddings():
     task = PeriodicTask.objects.get(name="lineage:Node:bulk_update_embeddings")
     last_run_at = task.last_run_at if task.last_run_at is not None else datetime.min
 
-    for node_id in Node.objects.filter(updated_at__gt=last_run_at).values_list("id", flat=True):
-        update_node_vector_index.delay(node_id)
+    enqueue_node_vector_indexes(Node.objects.filter(updated_at__gt=last_run_at).values_list("id", flat=True))
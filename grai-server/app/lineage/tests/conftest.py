@@ -2,6 +2,8 @@ import json
 import uuid
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from lineage.models import Edge, Node, Source
@@ -77,6 +79,37 @@ def create_edge_without_node_ids(client, workspace, source=None, destination=Non
     return response
 
 
+def count_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+
+    assert response.status_code == 200, response
+    return len(context.captured_queries)
+
+
+def create_sourced_nodes(workspace, source, n):
+    nodes = [Node.objects.create(name=str(uuid.uuid4()), namespace="default", workspace=workspace) for _ in range(n)]
+    source.nodes.add(*nodes)
+    return nodes
+
+
+def create_sourced_edges(workspace, source, n):
+    edges = []
+    for _ in range(n):
+        node_source, node_destination = create_sourced_nodes(workspace, source, 2)
+        edges.append(
+            Edge.objects.create(
+                source=node_source,
+                destination=node_destination,
+                namespace="default",
+                workspace=workspace,
+                name=str(uuid.uuid4()),
+            )
+        )
+    source.edges.add(*edges)
+    return edges
+
+
 @pytest.fixture
 def test_password():
     return "strong-test-pass"
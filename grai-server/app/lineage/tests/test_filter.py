@@ -4,8 +4,8 @@ import pytest
 from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 
-from lineage.filter import apply_table_filter
-from lineage.models import Filter, Node
+from lineage.filter import apply_table_filter, get_n_hop_edges
+from lineage.models import Edge, Filter, Node
 from workspaces.models import Organisation, Workspace
 
 
@@ -256,3 +256,67 @@ async def test_unsupported_type(test_workspace, test_user):
         await apply_table_filter(queryset, filter)
 
     assert str(e_info.value) == "Unknown filter type: random"
+
+
+def create_chain(workspace, names: list[str]) -> list[Node]:
+    nodes = [Node.objects.create(workspace=workspace, name=name) for name in names]
+    for source, destination in zip(nodes, nodes[1:]):
+        Edge.objects.create(
+            workspace=workspace,
+            source=source,
+            destination=destination,
+            metadata={"grai": {"edge_type": "TableToTable"}},
+        )
+    return nodes
+
+
+class TestNHopEdges:
+    @pytest.fixture
+    def workspace(self):
+        organisation = Organisation.objects.create(name=str(uuid.uuid4()))
+        return Workspace.objects.create(name=str(uuid.uuid4()), organisation=organisation)
+
+    @pytest.mark.django_db
+    def test_hop_limit(self, workspace):
+        nodes = create_chain(workspace, ["a", "b", "c", "d", "e"])
+
+        edges = get_n_hop_edges(workspace.id, nodes[2].id, 1)
+
+        assert set(edges) == {
+            (("b", "default"), ("c", "default"), "TableToTable"),
+            (("c", "default"), ("d", "default"), "TableToTable"),
+        }
+
+    @pytest.mark.django_db
+    def test_multiple_hops(self, workspace):
+        nodes = create_chain(workspace, ["a", "b", "c", "d", "e"])
+
+        edges = get_n_hop_edges(workspace.id, nodes[0].id, 3)
+
+        assert [(source[0], destination[0]) for source, destination, _ in edges] == [("a", "b"), ("b", "c"), ("c", "d")]
+
+    @pytest.mark.django_db
+    def test_cycles_return_each_edge_once(self, workspace):
+        nodes = create_chain(workspace, ["a", "b", "c"])
+        Edge.objects.create(workspace=workspace, source=nodes[2], destination=nodes[0])
+
+        edges = get_n_hop_edges(workspace.id, nodes[0].id, 10)
+
+        assert len(edges) == 3
+
+    @pytest.mark.django_db
+    def test_result_limit(self, workspace):
+        nodes = create_chain(workspace, ["a", "b", "c", "d", "e"])
+
+        edges = get_n_hop_edges(workspace.id, nodes[0].id, 10, limit=2)
+
+        assert [(source[0], destination[0]) for source, destination, _ in edges] == [("a", "b"), ("b", "c")]
+
+    @pytest.mark.django_db
+    def test_other_workspaces_are_ignored(self, workspace):
+        nodes = create_chain(workspace, ["a", "b"])
+        other = Workspace.objects.create(name=str(uuid.uuid4()), organisation=workspace.organisation)
+        other_node = Node.objects.create(workspace=other, name="c")
+        Edge.objects.create(workspace=other, source=other_node, destination=nodes[0])
+
+        assert len(get_n_hop_edges(workspace.id, nodes[0].id, 2)) == 1
@@ -0,0 +1,63 @@
+import uuid
+
+import pytest
+from django_multitenant.utils import set_current_tenant
+
+from lineage.models import Edge, Node
+from lineage.query_plans import (
+    INDEXED_QUERIES,
+    check_plans,
+    plan_failures,
+    sequential_scans,
+)
+from workspaces.models import Organisation, Workspace
+
+
+@pytest.fixture
+def table():
+    set_current_tenant(None)
+    organisation = Organisation.objects.create(name=str(uuid.uuid4()))
+    workspace = Workspace.objects.create(name=str(uuid.uuid4()), organisation=organisation)
+
+    def create_table():
+        table = Node.objects.create(
+            name=str(uuid.uuid4()), workspace=workspace, metadata={"grai": {"node_type": "Table"}}
+        )
+        column = Node.objects.create(
+            name=str(uuid.uuid4()), workspace=workspace, metadata={"grai": {"node_type": "Column"}}
+        )
+        Edge.objects.create(
+            source=table, destination=column, workspace=workspace, metadata={"grai": {"edge_type": "TableToColumn"}}
+        )
+        return table, column
+
+    table, column = create_table()
+    _, other_column = create_table()
+    Edge.objects.create(
+        source=column,
+        destination=other_column,
+        workspace=workspace,
+        metadata={"grai": {"edge_type": "ColumnToColumn"}},
+    )
+    return table
+
+
+def test_sequential_scans():
+    plan = {
+        "Node Type": "Nested Loop",
+        "Plans": [
+            {"Node Type": "Seq Scan", "Relation Name": "lineage_node"},
+            {"Node Type": "Index Scan", "Relation Name": "lineage_edge", "Index Name": "lineage_edge_type_source"},
+        ],
+    }
+
+    assert sequential_scans(plan) == ["lineage_node"]
+    assert sequential_scans(plan, ["lineage_edge"]) == []
+
+
+@pytest.mark.django_db
+def test_hot_paths_use_indexes(table):
+    results = check_plans(table)
+
+    assert set(results) == set(INDEXED_QUERIES)
+    assert plan_failures(results) == {}
@@ -0,0 +1,189 @@
+import uuid
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from django_multitenant.utils import set_current_tenant
+
+from lineage.models import Edge, Node, TableLineage, TableLineageClosure
+from lineage.table_lineage import refresh_table_lineage
+from workspaces.models import Organisation, Workspace
+
+
+@pytest.fixture
+def workspace():
+    set_current_tenant(None)
+    organisation = Organisation.objects.create(name=str(uuid.uuid4()))
+    return Workspace.objects.create(name=str(uuid.uuid4()), organisation=organisation)
+
+
+def create_table(workspace, columns: int = 1):
+    table = Node.objects.create(name=str(uuid.uuid4()), workspace=workspace, metadata={"grai": {"node_type": "Table"}})
+    table_columns = []
+    for _ in range(columns):
+        column = Node.objects.create(
+            name=str(uuid.uuid4()), workspace=workspace, metadata={"grai": {"node_type": "Column"}}
+        )
+        create_edge(workspace, table, column, "TableToColumn")
+        table_columns.append(column)
+    return table, table_columns
+
+
+def create_edge(workspace, source, destination, edge_type):
+    return Edge.objects.create(
+        source=source, destination=destination, workspace=workspace, metadata={"grai": {"edge_type": edge_type}}
+    )
+
+
+def pairs(workspace):
+    return set(TableLineage.objects.filter(workspace=workspace).values_list("source_id", "destination_id"))
+
+
+@pytest.mark.django_db
+def test_table_to_table_edges_are_indexed(workspace):
+    a, _ = create_table(workspace)
+    b, _ = create_table(workspace)
+    create_edge(workspace, a, b, "TableToTable")
+
+    assert pairs(workspace) == {(a.id, b.id)}
+
+
+@pytest.mark.django_db
+def test_column_edges_are_lifted_to_tables(workspace):
+    a, [a_column] = create_table(workspace)
+    b, [b_column] = create_table(workspace)
+    edge = create_edge(workspace, a_column, b_column, "ColumnToColumn")
+
+    assert pairs(workspace) == {(a.id, b.id)}
+
+    edge.delete()
+
+    assert pairs(workspace) == set()
+
+
+@pytest.mark.django_db
+def test_moving_an_edge_updates_its_lineage(workspace):
+    a, _ = create_table(workspace)
+    b, _ = create_table(workspace)
+    c, _ = create_table(workspace)
+    create_edge(workspace, a, b, "TableToTable")
+
+    edge = Edge.objects.get(source=a, destination=b)
+    edge.destination = c
+    with mock.patch("lineage.models.cache_edge") as cache_edge:
+        edge.save()
+
+    cache_edge.delay.assert_called_once_with(edge.id, delete=False)
+    assert pairs(workspace) == {(a.id, c.id)}
+
+
+@pytest.mark.django_db
+def test_only_lineage_changes_refresh_the_index(workspace):
+    a, _ = create_table(workspace)
+    b, _ = create_table(workspace)
+    create_edge(workspace, a, b, "TableToTable")
+    edge = Edge.objects.get(source=a, destination=b)
+
+    with mock.patch("lineage.models.refresh_table_lineage") as refresh:
+        edge.display_name = "renamed"
+        edge.save()
+        refresh.assert_not_called()
+
+        edge.metadata = {"grai": {"edge_type": "Generic"}}
+        edge.save()
+        refresh.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_removing_a_column_removes_its_lineage(workspace):
+    a, [a_column] = create_table(workspace)
+    b, [b_column] = create_table(workspace)
+    create_edge(workspace, a_column, b_column, "ColumnToColumn")
+
+    Edge.objects.get(source=a, destination=a_column).delete()
+
+    assert pairs(workspace) == set()
+
+
+@pytest.mark.django_db
+def test_bulk_created_edges_are_indexed(workspace):
+    a, [a_column] = create_table(workspace)
+    b, [b_column] = create_table(workspace)
+    c, _ = create_table(workspace)
+    Edge.objects.bulk_create(
+        [
+            Edge(
+                source=a_column,
+                destination=b_column,
+                workspace=workspace,
+                name="a",
+                display_name="a",
+                metadata={"grai": {"edge_type": "ColumnToColumn"}},
+            ),
+            Edge(
+                source=b,
+                destination=c,
+                workspace=workspace,
+                name="b",
+                display_name="b",
+                metadata={"grai": {"edge_type": "TableToTable"}},
+            ),
+        ]
+    )
+
+    assert pairs(workspace) == {(a.id, b.id), (b.id, c.id)}
+
+
+@pytest.mark.django_db
+def test_rebuild_matches_incremental_index(workspace):
+    a, [a_column] = create_table(workspace)
+    b, [b_column] = create_table(workspace)
+    c, _ = create_table(workspace)
+    create_edge(workspace, a_column, b_column, "ColumnToColumn")
+    create_edge(workspace, b, c, "TableToTable")
+    expected = pairs(workspace)
+
+    TableLineage.objects.filter(workspace=workspace).delete()
+    refresh_table_lineage(workspace.id)
+
+    assert pairs(workspace) == expected
+
+
+@pytest.mark.django_db
+def test_upstream_and_downstream(workspace):
+    a, _ = create_table(workspace)
+    b, _ = create_table(workspace)
+    c, _ = create_table(workspace)
+    create_edge(workspace, a, b, "TableToTable")
+    create_edge(workspace, b, c, "TableToTable")
+
+    assert TableLineage.objects.downstream(workspace.id, a.id) == {str(b.id): 1}
+    assert TableLineage.objects.downstream(workspace.id, a.id, depth=2) == {str(b.id): 1, str(c.id): 2}
+    assert TableLineage.objects.upstream(workspace.id, c.id, depth=2) == {str(b.id): 1, str(a.id): 2}
+    assert TableLineage.objects.is_upstream(workspace.id, a.id, c.id)
+    assert not TableLineage.objects.is_upstream(workspace.id, a.id, c.id, depth=1)
+    assert not TableLineage.objects.is_upstream(workspace.id, c.id, a.id)
+
+
+@pytest.mark.django_db
+@override_settings(TABLE_LINEAGE_CLOSURE_DEPTH=5)
+def test_closure_is_maintained(workspace):
+    a, _ = create_table(workspace)
+    b, _ = create_table(workspace)
+    c, _ = create_table(workspace)
+    create_edge(workspace, a, b, "TableToTable")
+    edge = create_edge(workspace, b, c, "TableToTable")
+
+    closure = TableLineageClosure.objects.filter(workspace=workspace)
+    assert set(closure.values_list("ancestor_id", "descendant_id", "depth")) == {
+        (a.id, b.id, 1),
+        (b.id, c.id, 1),
+        (a.id, c.id, 2),
+    }
+    assert TableLineage.objects.downstream(workspace.id, a.id, depth=2) == {str(b.id): 1, str(c.id): 2}
+    assert TableLineage.objects.is_upstream(workspace.id, a.id, c.id, depth=2)
+
+    edge.delete()
+
+    assert set(closure.values_list("ancestor_id", "descendant_id", "depth")) == {(a.id, b.id, 1)}
+    assert not TableLineage.objects.is_upstream(workspace.id, a.id, c.id)
@@ -0,0 +1,136 @@
+import uuid
+from unittest import mock
+
+import pytest
+
+from grAI.mocks import FakeEmbedder
+from lineage.managers import local_setting
+from lineage.models import Node, NodeEmbeddings
+from lineage.tasks import batch_embedding_inputs, create_node_vector_indexes
+
+
+def create_nodes(workspace, source, n):
+    nodes = [Node.objects.create(name=str(uuid.uuid4()), namespace="default", workspace=workspace) for _ in range(n)]
+    source.nodes.add(*nodes)
+    return list(Node.objects.prefetch_related("data_sources").filter(id__in=[node.id for node in nodes]))
+
+
+class TestBatchEmbeddingInputs:
+    def test_respects_max_size(self):
+        items = [(i, "content", 1) for i in range(10)]
+        batches = list(batch_embedding_inputs(items, max_size=3, max_tokens=100))
+        assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+
+    def test_respects_max_tokens(self):
+        items = [(i, "content", 4) for i in range(5)]
+        batches = list(batch_embedding_inputs(items, max_size=100, max_tokens=10))
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_oversized_items_get_their_own_batch(self):
+        items = [(0, "content", 50), (1, "content", 1)]
+        batches = list(batch_embedding_inputs(items, max_size=100, max_tokens=10))
+        assert [len(batch) for batch in batches] == [1, 1]
+
+
+class TestCreateNodeVectorIndexes:
+    @pytest.mark.django_db
+    def test_embeds_nodes_in_batches(self, create_workspace, test_source):
+        nodes = create_nodes(create_workspace, test_source, 5)
+        embedder = FakeEmbedder(max_batch_size=2)
+
+        assert create_node_vector_indexes(nodes, embedder) == 5
+        assert [len(request) for request in embedder.requests] == [2, 2, 1]
+        assert NodeEmbeddings.objects.filter(node__in=nodes).count() == 5
+
+    @pytest.mark.django_db
+    def test_unchanged_nodes_are_skipped(self, create_workspace, test_source):
+        nodes = create_nodes(create_workspace, test_source, 3)
+        embedder = FakeEmbedder()
+        create_node_vector_indexes(nodes, embedder)
+
+        assert create_node_vector_indexes(nodes, embedder) == 0
+        assert len(embedder.requests) == 1
+
+    @pytest.mark.django_db
+    def test_changed_nodes_are_updated(self, create_workspace, test_source):
+        nodes = create_nodes(create_workspace, test_source, 3)
+        embedder = FakeEmbedder()
+        create_node_vector_indexes(nodes, embedder)
+        original_hash = NodeEmbeddings.objects.get(node=nodes[0]).content_hash
+
+        nodes[0].metadata = {"grai": {"node_type": "Table"}}
+        nodes[0].save()
+
+        assert create_node_vector_indexes(nodes, embedder) == 1
+        assert NodeEmbeddings.objects.get(node=nodes[0]).content_hash != original_hash
+        assert NodeEmbeddings.objects.count() == 3
+
+
+class TestNearestNeighbors:
+    @pytest.mark.django_db
+    def test_embeddings_record_workspace(self, create_workspace, test_source):
+        nodes = create_nodes(create_workspace, test_source, 2)
+        create_node_vector_indexes(nodes, FakeEmbedder())
+
+        assert NodeEmbeddings.objects.filter(workspace=create_workspace).count() == 2
+
+    @pytest.mark.django_db
+    def test_results_are_limited_to_workspace(self, create_workspace, test_source):
+        nodes = create_nodes(create_workspace, test_source, 3)
+        create_node_vector_indexes(nodes, FakeEmbedder())
+        query = NodeEmbeddings.objects.get(node=nodes[0]).embedding.tolist()
+
+        results = NodeEmbeddings.objects.nearest_neighbors(create_workspace.id, query, limit=10)
+
+        assert {result.node_id for result in results} == {node.id for node in nodes}
+
+    @pytest.mark.django_db
+    def test_results_are_ordered_by_similarity(self, create_workspace, test_source):
+        nodes = create_nodes(create_workspace, test_source, 5)
+        create_node_vector_indexes(nodes, FakeEmbedder())
+        query = NodeEmbeddings.objects.get(node=nodes[2]).embedding.tolist()
+
+        embeddings = NodeEmbeddings.objects.filter(node__in=nodes)
+        expected = sorted(embeddings, key=lambda e: -sum(a * b for a, b in zip(e.embedding, query)))
+
+        results = NodeEmbeddings.objects.nearest_neighbors(create_workspace.id, query, limit=2)
+
+        assert [result.node_id for result in results] == [e.node_id for e in expected[:2]]
+
+    @pytest.mark.django_db
+    def test_large_workspaces_use_hnsw(self, create_workspace, test_source, settings):
+        settings.VECTOR_SEARCH_EXACT_THRESHOLD = 0
+        nodes = create_nodes(create_workspace, test_source, 3)
+        create_node_vector_indexes(nodes, FakeEmbedder())
+        query = NodeEmbeddings.objects.get(node=nodes[1]).embedding.tolist()
+
+        results = NodeEmbeddings.objects.nearest_neighbors(create_workspace.id, query, limit=3)
+
+        assert len(results) == 3
+
+    def test_ef_search_scales_with_workspace_share(self, settings):
+        settings.VECTOR_SEARCH_EF_SEARCH = 40
+
+        assert NodeEmbeddings.objects.get_ef_search(10, 1000, 1000) == 40
+        assert NodeEmbeddings.objects.get_ef_search(10, 1000, 10000) == 200
+        assert NodeEmbeddings.objects.get_ef_search(10, 40, 2000) == 1000
+        assert NodeEmbeddings.objects.get_ef_search(10, 1, 10**9) is None
+
+    @pytest.mark.django_db
+    def test_minority_workspaces_are_searched_exactly(self, create_workspace, test_source, settings):
+        settings.VECTOR_SEARCH_EXACT_THRESHOLD = 10000
+        nodes = create_nodes(create_workspace, test_source, 3)
+        create_node_vector_indexes(nodes, FakeEmbedder())
+        query = NodeEmbeddings.objects.get(node=nodes[1]).embedding.tolist()
+
+        # 20k of 10M vectors would need an ef_search of 10000
+        def counts(workspace_id=None):
+            return 20000 if workspace_id else 10**7
+
+        with mock.patch.object(NodeEmbeddings.objects, "cached_count", side_effect=counts), mock.patch(
+            "lineage.managers.local_setting", wraps=local_setting
+        ) as setting:
+            results = NodeEmbeddings.objects.nearest_neighbors(create_workspace.id, query, limit=3)
+
+        setting.assert_called_once_with("enable_indexscan", "off")
+        assert len(results) == 3
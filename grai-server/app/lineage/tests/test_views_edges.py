@@ -3,12 +3,26 @@ import pytest
 from django.urls import reverse
 
 from .conftest import (
+    count_queries,
     create_edge_with_node_ids,
     create_edge_without_node_ids,
     create_node,
+    create_sourced_edges,
 )
 
 
+@pytest.mark.django_db
+def test_list_edges_query_count_is_constant(auto_login_user, create_workspace, test_source):
+    client, user = auto_login_user()
+    url = reverse("graph:edges-list")
+
+    create_sourced_edges(create_workspace, test_source, 2)
+    baseline = count_queries(client, url)
+
+    create_sourced_edges(create_workspace, test_source, 20)
+    assert count_queries(client, url) == baseline
+
+
 @pytest.mark.django_db
 def test_post_edge(api_key, create_workspace, api_client):
     api_client.credentials(HTTP_AUTHORIZATION=f"Api-Key {api_key}")
@@ -128,6 +142,21 @@ class TestEdgesWithFilter:
         response = client.get(url, content_type="application/json")
         assert response.status_code == 200, response
 
+    def test_cursor_pagination_returns_every_edge_once(self, client, test_edges):
+        url = f"{reverse('graph:edges-list')}?pagination=cursor&size=2"
+
+        ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200, response
+            page = response.json()
+            assert "count" not in page
+            ids.extend(item["id"] for item in page["results"])
+            url = page["next"]
+
+        assert len(ids) == len(set(ids))
+        assert set(ids) == {edge["id"] for edge in test_edges}
+
 
 class TestEdgeUserAuth:
     @pytest.mark.django_db
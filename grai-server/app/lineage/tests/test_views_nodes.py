@@ -1,6 +1,8 @@
 import json
 import uuid
+from base64 import b64encode
 from itertools import product
+from urllib.parse import quote
 
 import django.db.utils
 import pytest
@@ -10,7 +12,7 @@ from lineage.models import Node
 from lineage.urls import app_name
 from workspaces.models import Membership, Organisation, Workspace
 
-from .conftest import api_key, create_node
+from .conftest import api_key, count_queries, create_node, create_sourced_nodes
 
 actions = ["list"]
 route_prefixes = ["nodes", "edges", "sources"]
@@ -26,6 +28,30 @@ def test_get_endpoints(auto_login_user, url_name, status):
     assert response.status_code == status, f"verb `get` failed on {url} with status {response.status_code}"
 
 
+@pytest.mark.django_db
+def test_list_nodes_query_count_is_constant(auto_login_user, create_workspace, test_source):
+    client, user = auto_login_user()
+    url = reverse("graph:nodes-list")
+
+    create_sourced_nodes(create_workspace, test_source, 2)
+    baseline = count_queries(client, url)
+
+    create_sourced_nodes(create_workspace, test_source, 20)
+    assert count_queries(client, url) == baseline
+
+
+@pytest.mark.django_db
+def test_filter_nodes_by_source_name_query_count_is_constant(auto_login_user, create_workspace, test_source):
+    client, user = auto_login_user()
+    url = f"{reverse('graph:nodes-list')}?source_name={test_source.name}"
+
+    create_sourced_nodes(create_workspace, test_source, 2)
+    baseline = count_queries(client, url)
+
+    create_sourced_nodes(create_workspace, test_source, 20)
+    assert count_queries(client, url) == baseline
+
+
 @pytest.mark.django_db
 def test_post_node(api_key, create_workspace, api_client):
     api_client.credentials(HTTP_AUTHORIZATION=f"Api-Key {api_key}")
@@ -293,3 +319,61 @@ class TestNodeWithFilter:
         response = client.get(url)
         print(response)
         assert response.status_code == 200, response
+
+
+class TestNodeKeysetPagination:
+    @pytest.mark.django_db
+    def test_cursor_pagination_returns_every_node_once(self, test_full_nodes, auto_login_user):
+        client, user = auto_login_user()
+        url = f"{reverse('graph:nodes-list')}?pagination=cursor&size=3"
+
+        ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200, response
+            page = response.json()
+            assert "count" not in page
+            ids.extend(item["id"] for item in page["results"])
+            url = page["next"]
+
+        assert len(ids) == len(set(ids))
+        assert set(ids) == {node["id"] for node in test_full_nodes}
+
+    @pytest.mark.django_db
+    def test_cursor_pagination_by_id(self, test_full_nodes, auto_login_user):
+        client, user = auto_login_user()
+        url = f"{reverse('graph:nodes-list')}?pagination=cursor&ordering=id&size=1"
+
+        ids = []
+        while url:
+            page = client.get(url).json()
+            ids.extend(item["id"] for item in page["results"])
+            url = page["next"]
+
+        assert ids == sorted(node["id"] for node in test_full_nodes)
+
+    @pytest.mark.django_db
+    def test_invalid_cursor(self, test_full_nodes, auto_login_user):
+        client, user = auto_login_user()
+        url = f"{reverse('graph:nodes-list')}?pagination=cursor&cursor=not-a-cursor"
+        response = client.get(url)
+        assert response.status_code == 404, response
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            {"o": "created_at", "p": "2023-01-01T00:00:00+00:00"},
+            {"o": ["created_at"], "p": []},
+            {"o": "created_at", "p": ["not-a-date", str(uuid.uuid4())]},
+            {"o": "created_at", "p": ["2023-01-01T00:00:00+00:00", "not-a-uuid"]},
+            {"o": "id", "p": [1]},
+            ["created_at", []],
+        ],
+    )
+    @pytest.mark.django_db
+    def test_malformed_cursor(self, test_full_nodes, auto_login_user, cursor):
+        client, user = auto_login_user()
+        encoded = b64encode(json.dumps(cursor).encode("utf-8")).decode("ascii")
+        url = f"{reverse('graph:nodes-list')}?pagination=cursor&cursor={quote(encoded)}"
+        response = client.get(url)
+        assert response.status_code == 404, response
@@ -5,6 +5,8 @@ from django.urls import reverse
 
 from lineage.models import Source
 
+from .conftest import count_queries, create_sourced_edges
+
 
 @pytest.mark.django_db
 def test_get_source_edges(auto_login_user, test_source):
@@ -121,3 +123,15 @@ def test_post_edge_delete(api_key, api_client, test_source, test_edge):
     response = api_client.delete(url)
 
     assert response.status_code == 204
+
+
+@pytest.mark.django_db
+def test_list_source_edges_query_count_is_constant(auto_login_user, create_workspace, test_source):
+    client, user = auto_login_user()
+    url = reverse("graph:source-edges-list", kwargs={"source_pk": test_source.id})
+
+    create_sourced_edges(create_workspace, test_source, 2)
+    baseline = count_queries(client, url)
+
+    create_sourced_edges(create_workspace, test_source, 20)
+    assert count_queries(client, url) == baseline
@@ -5,6 +5,8 @@ from django.urls import reverse
 
 from lineage.models import Source
 
+from .conftest import count_queries, create_sourced_nodes
+
 
 @pytest.mark.django_db
 def test_get_source_nodes(auto_login_user, test_source):
@@ -86,3 +88,15 @@ def test_post_node_delete(api_key, api_client, test_source, test_node):
     response = api_client.delete(url)
 
     assert response.status_code == 204
+
+
+@pytest.mark.django_db
+def test_list_source_nodes_query_count_is_constant(auto_login_user, create_workspace, test_source):
+    client, user = auto_login_user()
+    url = reverse("graph:source-nodes-list", kwargs={"source_pk": test_source.id})
+
+    create_sourced_nodes(create_workspace, test_source, 2)
+    baseline = count_queries(client, url)
+
+    create_sourced_nodes(create_workspace, test_source, 20)
+    assert count_queries(client, url) == baseline
@@ -14,6 +14,7 @@ from lineage.serializers import (
     SourceNodeSerializer,
     SourceSerializer,
 )
+from pagination.standard_pagination import OptionalKeysetPagination
 from rest_framework import status
 
 
@@ -44,14 +45,15 @@ class HasSourceViewSetMixin:
 
 class NodeViewSet(AuthenticatedViewSetMixin, ModelViewSet):
     serializer_class = NodeSerializer
+    pagination_class = OptionalKeysetPagination
     type = Node
 
     def get_queryset(self):
-        return self._get_queryset().all()
+        return self._get_queryset().prefetch_related("data_sources")
 
     def _get_queryset(self):
         if len(self.request.query_params) == 0:
-            return self.type.objects
+            return self.type.objects.all()
 
         q_filter = Q()
         query_params = self.request.query_params
@@ -67,8 +69,7 @@ class NodeViewSet(AuthenticatedViewSetMixin, ModelViewSet):
         starts_with_filters = ("metadata", "created_at", "updated_at", "data_sources")
         for filter_name, filter_value in query_params.items():
             if filter_name == "source_name":
-                source = Source.objects.get(name=filter_value)
-                q_filter &= Q(data_sources=source)
+                q_filter &= Q(data_sources__in=Source.objects.filter(name=filter_value).values("id"))
             elif filter_name in supported_filters or filter_name.startswith(starts_with_filters):
                 q_filter &= Q(**{filter_name: filter_value})
         return self.type.objects.filter(q_filter)
@@ -76,14 +77,15 @@ class NodeViewSet(AuthenticatedViewSetMixin, ModelViewSet):
 
 class EdgeViewSet(AuthenticatedViewSetMixin, ModelViewSet):
     serializer_class = EdgeSerializer
+    pagination_class = OptionalKeysetPagination
     type = Edge
 
     def get_queryset(self):
-        return self._get_queryset().all()
+        return self._get_queryset().prefetch_related("data_sources")
 
     def _get_queryset(self):
         if len(self.request.query_params) == 0:
-            return self.type.objects
+            return self.type.objects.all()
 
         q_filter = Q()
         query_params = self.request.query_params
@@ -99,8 +101,7 @@ class EdgeViewSet(AuthenticatedViewSetMixin, ModelViewSet):
         starts_with_filters = ("metadata", "created_at", "updated_at")
         for filter_name, filter_value in query_params.items():
             if filter_name == "source_name":
-                source = Source.objects.get(name=filter_value)
-                q_filter &= Q(data_sources=source)
+                q_filter &= Q(data_sources__in=Source.objects.filter(name=filter_value).values("id"))
             elif filter_name in supported_filters or filter_name.startswith(starts_with_filters):
                 q_filter &= Q(**{filter_name: filter_value})
 
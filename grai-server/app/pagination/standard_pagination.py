@@ -1,4 +1,14 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from uuid import UUID
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class StandardResultsPagination(PageNumberPagination):
@@ -7,3 +17,163 @@ class StandardResultsPagination(PageNumberPagination):
     page_size_query_param = "size"  # query param to allow user to set page size
 
     max_page_size = 1000  # max page size allowed
+
+
+class KeysetPagination(BasePagination):
+    """Forward only keyset (cursor) pagination.
+
+    Pages are selected with a `WHERE (created_at, id) > (:created_at, :id)` predicate rather than an OFFSET and no
+    COUNT(*) is ever issued, so every page costs the same regardless of how deep into the result set it is.
+    """
+
+    page_size = StandardResultsPagination.page_size
+    page_size_query_param = StandardResultsPagination.page_size_query_param
+    max_page_size = StandardResultsPagination.max_page_size
+
+    cursor_query_param = "cursor"
+    ordering_query_param = "ordering"
+    invalid_cursor_message = "Invalid cursor"
+
+    orderings = {
+        "created_at": ("created_at", "id"),
+        "id": ("id",),
+    }
+    default_ordering = "created_at"
+    # Parse each ordering field from its position in a cursor, returning None or raising ValueError when it's invalid
+    field_parsers = {
+        "created_at": parse_datetime,
+        "id": UUID,
+    }
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        ordering_name, position = self.decode_cursor(request)
+        self.ordering_name = ordering_name
+        self.ordering = self.orderings[ordering_name]
+
+        queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after(position))
+
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        return min(max(size, 1), self.max_page_size)
+
+    def get_ordering_name(self, request) -> str:
+        ordering_name = request.query_params.get(self.ordering_query_param, self.default_ordering)
+        return ordering_name if ordering_name in self.orderings else self.default_ordering
+
+    def after(self, position: list) -> Q:
+        """Builds the keyset predicate for rows strictly after `position` in the current ordering.
+
+        The leading `>=` on the first column is redundant for correctness but lets postgres use it as an index range
+        bound rather than evaluating the OR for every row.
+        """
+        fields = self.ordering
+        predicate = Q()
+        for i, field in enumerate(fields):
+            equal = {fields[j]: position[j] for j in range(i)}
+            predicate |= Q(**equal, **{f"{field}__gt": position[i]})
+
+        return Q(**{f"{fields[0]}__gte": position[0]}) & predicate
+
+    def decode_cursor(self, request) -> tuple[str, list | None]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return self.get_ordering_name(request), None
+
+        try:
+            cursor = json.loads(b64decode(encoded.encode("ascii")).decode("utf-8"))
+            ordering_name = cursor["o"]
+            return ordering_name, self.parse_position(self.orderings[ordering_name], cursor["p"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def parse_position(self, fields: tuple[str, ...], position) -> list:
+        if not isinstance(position, list) or len(position) != len(fields):
+            raise ValueError("Cursor position doesn't match its ordering")
+
+        values = []
+        for field, value in zip(fields, position):
+            if not isinstance(value, str) or (parsed := self.field_parsers[field](value)) is None:
+                raise ValueError(f"Invalid cursor {field}")
+            values.append(parsed)
+        return values
+
+    def encode_cursor(self, instance) -> str:
+        position = [str(getattr(instance, field)) for field in self.ordering]
+        if "created_at" in self.ordering:
+            position[self.ordering.index("created_at")] = instance.created_at.isoformat()
+
+        cursor = json.dumps({"o": self.ordering_name, "p": position})
+        return b64encode(cursor.encode("utf-8")).decode("ascii")
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+
+        return replace_query_param(self.base_url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", None),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "previous": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "results": schema,
+            },
+        }
+
+
+class OptionalKeysetPagination(StandardResultsPagination):
+    """Page number pagination unless the client opts into keyset pagination with `?pagination=cursor`."""
+
+    mode_query_param = "pagination"
+    keyset_mode = "cursor"
+    keyset_pagination_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if request.query_params.get(self.mode_query_param) == self.keyset_mode:
+            self.keyset = self.keyset_pagination_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+
+        return super().get_paginated_response(data)
@@ -368,6 +368,29 @@ OTP_TOTP_ISSUER = "Grai Cloud"
 
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
+# OpenLineage
+
+# Events are buffered per connection and merged into a single run every window (seconds) or batch size events
+OPEN_LINEAGE_BATCH_WINDOW = config("OPEN_LINEAGE_BATCH_WINDOW", default=10, cast=int)
+OPEN_LINEAGE_BATCH_SIZE = config("OPEN_LINEAGE_BATCH_SIZE", default=100, cast=int)
+
+# Table lineage
+
+# Pairs of tables within this many hops are kept in a closure index for constant time reachability lookups, 0 disables it
+TABLE_LINEAGE_CLOSURE_DEPTH = config("TABLE_LINEAGE_CLOSURE_DEPTH", default=0, cast=int)
+
+# Vector search
+
+# Workspaces with at most this many embeddings are searched exactly rather than through the HNSW index
+VECTOR_SEARCH_EXACT_THRESHOLD = config("VECTOR_SEARCH_EXACT_THRESHOLD", default=10000, cast=int)
+VECTOR_SEARCH_EF_SEARCH = config("VECTOR_SEARCH_EF_SEARCH", default=40, cast=int)
+
+# grAI
+
+# Idle conversations are evicted from the shared cache after this many seconds and rehydrated from the database
+GRAI_CONVERSATION_CACHE_TIMEOUT = config("GRAI_CONVERSATION_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int)
+GRAI_CONVERSATION_POOL_SIZE = config("GRAI_CONVERSATION_POOL_SIZE", default=256, cast=int)
+
 # OpenAI
 
 OPENAI_API_KEY = config("OPENAI_API_KEY", None)
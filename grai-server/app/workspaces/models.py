@@ -47,7 +47,7 @@ class Workspace(TenantModel):
 
     def update_embeddings(self):
         from lineage.models import Node
-        from lineage.tasks import update_node_vector_index
+        from lineage.tasks import enqueue_node_vector_indexes
 
         if not self.ai_enabled:
             return
@@ -56,8 +56,7 @@ class Workspace(TenantModel):
             workspace_id=self.id, nodeembeddings__isnull=True
         ).values_list("id", flat=True)
 
-        for node_id in nodes_without_embeddings:
-            update_node_vector_index.delay(node_id)
+        enqueue_node_vector_indexes(nodes_without_embeddings)
 
     def save(self, *args, **kwargs):
         current_state = Workspace.objects.filter(id=self.id).first()